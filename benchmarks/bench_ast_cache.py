@@ -0,0 +1,73 @@
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.core.ast_cache import ASTCache
+from benchmarks.bench_script_parser import SAMPLE_BLOCK
+
+
+def collect_scripts(root):
+    """
+    Get every .txt file below a directory.
+    """
+    paths = []
+    for dirpath, _, files in os.walk(root):
+        paths.extend(os.path.join(dirpath, name) for name in files if name.endswith('.txt'))
+    return sorted(paths)
+
+
+def write_synthetic_scripts(root, files, blocks_per_file):
+    for i in range(files):
+        directory = os.path.join(root, 'common', f'group_{i % 20}')
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f'script_{i}.txt'), 'w', encoding='utf-8') as f:
+            f.write(''.join(SAMPLE_BLOCK.format(n=i * 1000 + j) for j in range(blocks_per_file)))
+
+
+def run(cache_dir, paths, max_bytes):
+    start = time.perf_counter()
+    with ASTCache(cache_dir, max_bytes=max_bytes) as cache:
+        for path in paths:
+            cache.get_or_parse(path)
+        stats = cache.get_stats()
+    return time.perf_counter() - start, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the parsed-AST cache")
+    parser.add_argument('--scripts', help="Directory of script files (default: synthetic)")
+    parser.add_argument('--files', type=int, default=400)
+    parser.add_argument('--blocks', type=int, default=50)
+    parser.add_argument('--max-mb', type=int, default=256)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix='ck3_ast_bench_')
+    try:
+        scripts_dir = args.scripts
+        if not scripts_dir:
+            scripts_dir = os.path.join(tmp_dir, 'game')
+            write_synthetic_scripts(scripts_dir, args.files, args.blocks)
+        paths = collect_scripts(scripts_dir)
+        megabytes = sum(os.path.getsize(path) for path in paths) / 1024 / 1024
+        cache_dir = os.path.join(tmp_dir, 'cache')
+        max_bytes = args.max_mb * 1024 * 1024
+        print(f"{len(paths)} files, {megabytes:.1f} MiB")
+
+        cold, stats = run(cache_dir, paths, max_bytes)
+        print(f"Cold: {cold:.2f}s  {stats}")
+        warm, stats = run(cache_dir, paths, max_bytes)
+        print(f"Warm: {warm:.2f}s  {stats}")
+        print(f"Speed-up: {cold / warm:.0f}x")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
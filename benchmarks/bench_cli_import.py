@@ -0,0 +1,79 @@
+import os
+import sys
+import argparse
+import subprocess
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# GUI and platform modules the headless CLI must never pull in
+FORBIDDEN_PREFIXES = ('tkinter', '_tkinter', 'ttkbootstrap', 'winreg', 'PIL')
+
+# Statement timed for each scenario (the modules a command imports when it runs),
+# and its import time budget in milliseconds
+SCENARIOS = {
+    'startup': ('import src.cli; src.cli.build_parser()', 30.0),
+    'version/list-files': ('import src.cli, src.core.game_utils', 60.0),
+    'create': ('import src.cli, src.core.mod_creator, src.core.mod_params, src.core.mod_registry, '
+               'src.core.steam_finder', 80.0),
+    'batch': ('import src.cli, src.core.batch_creator', 90.0),
+}
+
+
+def measure(statement):
+    """
+    Run a statement under -X importtime in a fresh interpreter.
+
+    Returns:
+        tuple: (microseconds spent importing project modules and their
+            dependencies, list of every module imported)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=project_root, capture_output=True, text=True, check=True
+    )
+    total = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.append(name.strip())
+        # Top-level src.* entries include everything they imported first
+        if name.startswith(' src.'):
+            total += int(cumulative)
+    return total, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the import time budget of the headless CLI")
+    parser.add_argument('--budget-scale', type=float, default=1.0,
+                        help="Multiplier for every scenario's budget, for slower machines")
+    parser.add_argument('--runs', type=int, default=5, help="Runs per scenario; the fastest counts")
+    args = parser.parse_args()
+
+    failed = False
+    for scenario, (statement, budget_ms) in SCENARIOS.items():
+        times = []
+        modules = []
+        for _ in range(args.runs):
+            total, modules = measure(statement)
+            times.append(total)
+        forbidden = sorted({name for name in modules if name.split('.')[0] in FORBIDDEN_PREFIXES})
+        best_ms = min(times) / 1000
+        budget_ms *= args.budget_scale
+        print(f"{scenario:<20} {best_ms:7.1f}ms  {len(modules)} modules  (budget {budget_ms:.0f}ms)")
+        if forbidden:
+            print(f"  FAIL: imports {', '.join(forbidden)}")
+            failed = True
+        if best_ms > budget_ms:
+            print(f"  FAIL: over the {budget_ms:.0f}ms budget")
+            failed = True
+
+    print("FAIL" if failed else "OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
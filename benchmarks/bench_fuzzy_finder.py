@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+import argparse
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.core.fuzzy_finder import FuzzyFileFinder
+from benchmarks.bench_path_trie import synthetic_paths
+
+QUERIES = [
+    'health_5123', 'on_action', 'onact', 'scripted effects 77', 'english yml 4',
+    'traits/group_12/health', 'gui', 'h', 'hlth99', 'zzzq'
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fuzzy game file finder")
+    parser.add_argument('--paths', type=int, default=100000)
+    parser.add_argument('--file-list', help="vanilla_files.txt to load instead of synthetic paths")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.file_list:
+        with open(args.file_list, 'r', encoding='utf-8') as f:
+            paths = [line.strip() for line in f.readlines()[2:] if line.strip()]
+    else:
+        paths = synthetic_paths(args.paths)
+
+    start = time.perf_counter()
+    finder = FuzzyFileFinder(paths)
+    print(f"Indexed {len(finder)} paths in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    for query in QUERIES:
+        best = float('inf')
+        results = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = finder.search(query)
+            best = min(best, time.perf_counter() - start)
+        top = results[0][0] if results else '-'
+        print(f"{query!r:<28} {best * 1000:7.2f} ms  {len(results):3d} results  top: {top}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.core.game_index import GameFileIndex
+
+# Top-level folders of the real game directory
+TOP_LEVEL_DIRS = [
+    'common', 'content_source', 'data_binding', 'events', 'fonts', 'gfx', 'gui',
+    'history', 'localization', 'map_data', 'music', 'notifications', 'sound', 'tests'
+]
+
+
+def build_synthetic_tree(root, files_per_dir=40, dirs_per_top=60):
+    """
+    Create a synthetic game directory shaped roughly like CK3's.
+
+    Args:
+        root (str): Directory to create the tree in
+        files_per_dir (int): Files in each leaf directory
+        dirs_per_top (int): Leaf directories under each top-level folder
+
+    Returns:
+        int: Number of files created
+    """
+    count = 0
+    for top in TOP_LEVEL_DIRS:
+        for i in range(dirs_per_top):
+            leaf = os.path.join(root, top, f'group_{i % 7}', f'dir_{i}')
+            os.makedirs(leaf, exist_ok=True)
+            for j in range(files_per_dir):
+                with open(os.path.join(leaf, f'file_{j}.txt'), 'w', encoding='utf-8') as f:
+                    f.write('key = value\n')
+                count += 1
+    return count
+
+
+def os_walk_listing(game_dir):
+    """
+    The original list_game_files walker: os.walk plus relpath per file.
+    """
+    file_list = []
+    for root, dirs, files in os.walk(game_dir):
+        for file in files:
+            file_list.append(os.path.relpath(os.path.join(root, file), game_dir))
+    return file_list
+
+
+def timed(label, func, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<40} {best * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark game directory walkers")
+    parser.add_argument('--game-dir', help="Existing game directory (default: synthetic tree)")
+    parser.add_argument('--workers', type=int, nargs='*', default=[1, 4, 8, 16])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix='ck3_scan_bench_')
+    try:
+        game_dir = args.game_dir
+        if not game_dir:
+            game_dir = os.path.join(tmp_dir, 'game')
+            count = build_synthetic_tree(game_dir)
+            print(f"Synthetic tree: {count} files in {game_dir}")
+        index_path = os.path.join(tmp_dir, 'index.json')
+
+        baseline = timed("os.walk + relpath", lambda: os_walk_listing(game_dir), args.repeat)
+        expected = sorted(path.replace(os.sep, '/') for path in baseline)
+
+        for workers in args.workers:
+            def cold_scan():
+                index = GameFileIndex(game_dir, index_path=index_path)
+                index.scan(full=True, save=False, max_workers=workers)
+                return index.list_files()
+            listing = timed(f"GameFileIndex full scan, {workers} workers", cold_scan, args.repeat)
+            assert listing == expected, "parallel scan disagrees with os.walk"
+
+        index = GameFileIndex(game_dir, index_path=index_path)
+        index.scan()
+        timed("GameFileIndex incremental rescan", lambda: GameFileIndex(game_dir, index_path=index_path).scan(), args.repeat)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.core.path_trie import PathTrie
+
+
+def synthetic_paths(count):
+    """
+    Generate game-like relative paths.
+
+    Args:
+        count (int): Number of paths to generate
+
+    Returns:
+        list: Relative paths
+    """
+    tops = ['common', 'events', 'gfx', 'gui', 'history', 'localization', 'map_data', 'sound']
+    subs = ['on_action', 'scripted_effects', 'traits', 'characters', 'english', 'french', 'models', 'interface']
+    exts = ['.txt', '.yml', '.dds', '.gui', '.asset']
+    paths = []
+    for i in range(count):
+        top = tops[i % len(tops)]
+        sub = subs[(i // 7) % len(subs)]
+        paths.append(f"{top}/{sub}/group_{i % 97}/health_{i}{exts[i % len(exts)]}")
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the game path trie")
+    parser.add_argument('--paths', type=int, default=100000)
+    parser.add_argument('--file-list', help="vanilla_files.txt to load instead of synthetic paths")
+    args = parser.parse_args()
+
+    if args.file_list:
+        with open(args.file_list, 'r', encoding='utf-8') as f:
+            paths = [line.strip() for line in f.readlines()[2:] if line.strip()]
+    else:
+        paths = synthetic_paths(args.paths)
+
+    start = time.perf_counter()
+    trie = PathTrie.from_paths(paths)
+    build_time = time.perf_counter() - start
+
+    # Measure memory on a second build; tracemalloc slows the build down a lot
+    del trie
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    trie = PathTrie.from_paths(paths)
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    flat_list = sum(sys.getsizeof(path) for path in paths) + sys.getsizeof(paths)
+    print(f"Paths:                  {len(trie)}")
+    print(f"Build time:             {build_time * 1000:.1f} ms")
+    print(f"Trie memory:            {used / 1024 / 1024:.1f} MiB ({used / len(trie):.0f} bytes/entry)")
+    print(f"Flat list of str:       {flat_list / 1024 / 1024:.1f} MiB ({flat_list / len(paths):.0f} bytes/entry)")
+
+    queries = [
+        ("list_dir('common/on_action')", lambda: trie.list_dir('common/on_action')),
+        ("find_prefix('events/traits/group_1')", lambda: trie.find_prefix('events/traits/group_1')),
+        ("glob('common/*/group_5/*.txt')", lambda: trie.glob('common/*/group_5/*.txt')),
+        ("find_extension('.yml')", lambda: trie.find_extension('.yml')),
+    ]
+    for label, query in queries:
+        query()  # warm the lazily sorted child lists
+        start = time.perf_counter()
+        result = query()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<40} {len(result):7d} results {elapsed * 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
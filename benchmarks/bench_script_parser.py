@@ -0,0 +1,88 @@
+import os
+import sys
+import mmap
+import time
+import argparse
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.core.script_parser import ScriptTokenizer, parse_bytes
+
+SAMPLE_BLOCK = '''﻿# Synthetic script modelled on game/common
+sample_effect_{n} = {{
+    if = {{
+        limit = {{
+            is_ai = no
+            has_trait = brave
+            gold >= 100
+            NOT = {{ has_character_flag = flag_{n} }}
+        }}
+        add_gold = -50
+        scope:actor ?= {{ add_prestige = 25 }}
+        set_global_variable = {{ name = sample_{n}_is_loaded value = yes }}
+    }}
+    color = rgb {{ 120 40 {n} }}
+    names = {{ "Name One" "Name Two" plain_name }}
+}}
+'''
+
+
+def load_sources(game_common_dir, synthetic_mb):
+    """
+    Read script files into memory, or generate synthetic ones.
+
+    Args:
+        game_common_dir (str): Path to game/common, or None for synthetic data
+        synthetic_mb (int): Size of synthetic data in MiB
+
+    Returns:
+        list: Raw bytes of each file
+    """
+    if not game_common_dir:
+        block = ''.join(SAMPLE_BLOCK.format(n=i) for i in range(200)).encode('utf-8')
+        count = max(1, synthetic_mb * 1024 * 1024 // len(block))
+        return [block] * count
+
+    sources = []
+    for root, _, files in os.walk(game_common_dir):
+        for name in files:
+            if name.endswith('.txt'):
+                path = os.path.join(root, name)
+                if os.path.getsize(path) == 0:
+                    continue
+                with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    sources.append(mm[:])
+    return sources
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Paradox script tokenizer and parser")
+    parser.add_argument('--game-common', help="Path to Crusader Kings III/game/common")
+    parser.add_argument('--synthetic-mb', type=int, default=20)
+    args = parser.parse_args()
+
+    sources = load_sources(args.game_common, args.synthetic_mb)
+    total_bytes = sum(len(source) for source in sources)
+    megabytes = total_bytes / 1024 / 1024
+    print(f"{len(sources)} files, {megabytes:.1f} MiB")
+
+    start = time.perf_counter()
+    tokens = 0
+    for source in sources:
+        for _ in ScriptTokenizer(source).iter_spans():
+            tokens += 1
+    elapsed = time.perf_counter() - start
+    print(f"Tokenize: {tokens} tokens in {elapsed:.2f}s = {megabytes / elapsed:.1f} MiB/s")
+
+    start = time.perf_counter()
+    errors = 0
+    for source in sources:
+        errors += len(parse_bytes(source)[1])
+    elapsed = time.perf_counter() - start
+    print(f"Parse:    {errors} errors in {elapsed:.2f}s = {megabytes / elapsed:.1f} MiB/s")
+
+
+if __name__ == '__main__':
+    main()
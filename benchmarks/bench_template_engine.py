@@ -0,0 +1,123 @@
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.core.template_engine import TemplateEngine, LINK_MODES
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+SAMPLE_EVENT = '''
+<your_mod_name_here>.{n} = {{
+    type = character_event
+    title = <your_mod_name_here>.{n}.t
+    desc = "<your_long_mod_name_here> event {n}"
+    immediate = {{
+        add_gold = 10
+    }}
+    option = {{
+        name = <your_mod_name_here>.{n}.a
+    }}
+}}
+'''
+
+
+def write_synthetic_templates(root, files, events_per_file):
+    for i in range(files):
+        directory = os.path.join(root, 'events', f'group_{i % 10}')
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f'your_mod_name_here_events_{i}.txt'), 'wb') as f:
+            text = ''.join(SAMPLE_EVENT.format(n=i * 1000 + j) for j in range(events_per_file))
+            f.write(UTF8_BOM + text.replace('\n', '\r\n').encode('utf-8'))
+
+
+def write_synthetic_assets(root, megabytes, file_mb=4):
+    directory = os.path.join(root, 'gfx', 'your_mod_name_here')
+    os.makedirs(directory, exist_ok=True)
+    block = os.urandom(1024 * 1024)
+    for i in range(max(1, megabytes // file_mb)):
+        with open(os.path.join(directory, f'texture_{i}.dds'), 'wb') as f:
+            for _ in range(file_mb):
+                f.write(block)
+
+
+def naive_copy(src, dst, short_mod_name, mod_name):
+    """
+    The previous implementation: walk, decode, chained str.replace, encode.
+    """
+    os.makedirs(dst, exist_ok=True)
+    for item in os.listdir(src):
+        s = os.path.join(src, item)
+        d = os.path.join(dst, item.replace('your_mod_name_here', short_mod_name)
+                         .replace('your_long_mod_name_here', mod_name))
+        if os.path.isdir(s):
+            naive_copy(s, d, short_mod_name, mod_name)
+        else:
+            with open(s, 'r', encoding='utf-8') as f:
+                content = f.read()
+            content = (content.replace('<your_mod_name_here>', short_mod_name)
+                       .replace('<your_long_mod_name_here>', mod_name))
+            with open(d, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+
+def time_mods(tmp_dir, mods, create):
+    start = time.perf_counter()
+    for i in range(mods):
+        create(os.path.join(tmp_dir, f'mod_{i}'), f'mod{i}', f'Benchmark Mod {i}')
+    elapsed = time.perf_counter() - start
+    for i in range(mods):
+        shutil.rmtree(os.path.join(tmp_dir, f'mod_{i}'))
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the compiled template engine")
+    parser.add_argument('--templates', help="Template directory (default: synthetic)")
+    parser.add_argument('--files', type=int, default=200)
+    parser.add_argument('--events', type=int, default=40)
+    parser.add_argument('--mods', type=int, default=20)
+    parser.add_argument('--assets-mb', type=int, default=0, help="Add binary assets to the synthetic templates")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix='ck3_template_bench_')
+    try:
+        template_dir = args.templates
+        if not template_dir:
+            template_dir = os.path.join(tmp_dir, 'templates')
+            write_synthetic_templates(template_dir, args.files, args.events)
+            if args.assets_mb:
+                write_synthetic_assets(template_dir, args.assets_mb)
+
+        start = time.perf_counter()
+        engine = TemplateEngine.get(template_dir)
+        compile_time = time.perf_counter() - start
+        start = time.perf_counter()
+        TemplateEngine.get(template_dir)
+        lookup_time = time.perf_counter() - start
+        print(f"{len(engine.files)} rendered files, {len(engine.assets)} copied files; "
+              f"compile {compile_time * 1000:.1f}ms, cached lookup {lookup_time * 1000:.1f}ms")
+
+        if engine.assets:
+            # The text-mode baseline cannot read binary assets
+            for link_mode in LINK_MODES:
+                elapsed = time_mods(tmp_dir, args.mods, lambda dst, short, name: engine.render(dst, short, name, link_mode))
+                print(f"{link_mode:<9} {elapsed / args.mods * 1000:.1f}ms per mod")
+        else:
+            naive = time_mods(tmp_dir, args.mods, lambda dst, short, name: naive_copy(template_dir, dst, short, name))
+            compiled = time_mods(tmp_dir, args.mods, lambda dst, short, name: TemplateEngine.get(template_dir).render(dst, short, name))
+            print(f"Naive:    {naive / args.mods * 1000:.1f}ms per mod")
+            print(f"Compiled: {compiled / args.mods * 1000:.1f}ms per mod")
+            print(f"Speed-up: {naive / compiled:.1f}x")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import sys
 import os
+import multiprocessing
 import tkinter as tk
 import ttkbootstrap as ttk
 from typing import Optional, Tuple
@@ -72,5 +73,10 @@ def main():
     
     root.mainloop()
 
+    # Write out any config changes still pending in the write-behind window
+    ConfigManager.flush()
+
 if __name__ == "__main__":
+    # Needed for process pools in the frozen PyInstaller build
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -0,0 +1,201 @@
+"""
+Headless command line interface for the CK3 Mod Creator.
+
+Usage: python -m src.cli <command> [options]
+
+Only argparse is imported up front, not even json or logging; each command
+imports the core modules it needs when it runs, and nothing here imports
+tkinter, ttkbootstrap or winreg. benchmarks/bench_cli_import.py checks the
+import time budget.
+"""
+import os
+import sys
+import argparse
+
+
+def _status(message, is_error=False):
+    print(message, file=sys.stderr)
+
+
+def _resolve_steam_path(args) -> str:
+    """
+    Get the Steam path from --steam-path, the config or auto-detection.
+    """
+    if args.steam_path:
+        return args.steam_path
+    from src.core.config import ConfigManager
+    steam_path = ConfigManager.get_steam_path()
+    if steam_path and os.path.exists(steam_path):
+        return steam_path
+    from src.core.steam_finder import SteamPathFinder
+    return SteamPathFinder.find_steam_installation_path()
+
+
+def _default_version(args):
+    """
+    Get the installed game version for mods without one, or None if it can't be detected.
+    """
+    from src.core.game_utils import CK3GameUtils
+    try:
+        return CK3GameUtils.get_version_for_files(CK3GameUtils.get_latest_ck3_version(_resolve_steam_path(args)))
+    except (OSError, ValueError) as e:
+        _status(f"Could not detect game version: {e}", is_error=True)
+        return None
+
+
+def cmd_version(args) -> int:
+    from src.core.game_utils import CK3GameUtils
+    version_info = CK3GameUtils.get_latest_ck3_version(_resolve_steam_path(args))
+    if args.json:
+        import json
+        print(json.dumps(version_info))
+    else:
+        print(CK3GameUtils.get_version_info_for_ui(version_info))
+    return 0
+
+
+def cmd_list_files(args) -> int:
+    from src.core.game_utils import CK3GameUtils
+    steam_path = _resolve_steam_path(args)
+    if args.output:
+        result = CK3GameUtils.stream_game_files(steam_path, args.output, status_callback=_status)
+        return 0 if result['success'] else 1
+
+    out = sys.stdout
+    count = 0
+    for rel_path in CK3GameUtils.iter_game_files(steam_path, status_callback=_status if args.verbose else None):
+        out.write(rel_path.replace(os.sep, '/') + '\n')
+        count += 1
+    if not count:
+        _status("No game files found", is_error=True)
+        return 1
+    return 0
+
+
+def cmd_create(args) -> int:
+    from src.core.config import ConfigManager
+    from src.core.mod_creator import ModCreator, ESSENTIALS_DIR
+    from src.core.mod_params import ModCreationParams
+    from src.core.mod_registry import ModRegistry
+
+    supported_version = args.version if args.version is not None else _default_version(args)
+
+    try:
+        params = ModCreationParams(
+            mod_name=args.mod_name,
+            short_mod_name=args.short_mod_name,
+            tags=args.tags or ["Fixes"],
+            supported_version=supported_version
+        )
+    except ValueError as e:
+        _status(f"Validation error: {e}", is_error=True)
+        return 1
+
+    ModCreator.clean_staging(args.debug)
+    paths = ModCreator.get_mod_paths(params.mod_name, args.debug)
+    existing_mod = ModRegistry.get_shared().find_existing(
+        params.mod_name, paths['mod_folder_path'], paths['mod_file_path']
+    )
+    if existing_mod:
+        _status(f"A mod named '{existing_mod['name']}' already exists at {existing_mod['path']}", is_error=True)
+        return 1
+
+    result = ModCreator.create_mod(
+        params.mod_name, params.short_mod_name, params.tags, params.supported_version,
+        None if args.no_essentials else ESSENTIALS_DIR, args.debug,
+        status_callback=_status, link_mode=args.link_mode
+    )
+    if not result['success']:
+        return 1
+    if args.verbose:
+        _status(', '.join(f"{phase} {seconds * 1000:.1f}ms" for phase, seconds in result['timings'].items()))
+    ConfigManager.add_recent_mod(params.short_mod_name, params.mod_name)
+    print(result['mod_folder_path'])
+    return 0
+
+
+def cmd_batch(args) -> int:
+    from src.core.batch_creator import BatchModCreator, load_manifest
+    from src.core.mod_creator import ModCreator
+
+    try:
+        manifest = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        _status(f"Manifest error: {e}", is_error=True)
+        return 1
+
+    default_version = args.version if args.version is not None else _default_version(args)
+
+    ModCreator.clean_staging(args.debug)
+    creator = BatchModCreator(debug=args.debug, max_workers=args.workers, link_mode=args.link_mode)
+    report = creator.create_all(manifest, default_version, skip_invalid=args.skip_invalid, status_callback=_status)
+    for mod in report['mods']:
+        line = f"{mod['row']:>4}  {mod['status']:<8} {mod['mod_name']}"
+        if mod['error']:
+            line += f"  ({mod['error']})"
+        print(line)
+    print(f"{report['created']} created, {report['failed']} failed, {report['invalid']} invalid "
+          f"in {report['elapsed']:.2f}s")
+    if args.report:
+        BatchModCreator.write_report(report, args.report)
+    return 0 if not report['failed'] and not report['invalid'] else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m src.cli', description="CK3 Mod Creator command line")
+    parser.add_argument('--steam-path', help="Steam installation (default: configured or detected)")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Log progress details")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    version_parser = subparsers.add_parser('version', help="Print the installed game version")
+    version_parser.add_argument('--json', action='store_true', help="Print full and numeric versions as JSON")
+    version_parser.set_defaults(func=cmd_version)
+
+    list_parser = subparsers.add_parser('list-files', help="List the vanilla game files")
+    list_parser.add_argument('-o', '--output', help="Write a report file instead of printing to stdout")
+    list_parser.set_defaults(func=cmd_list_files)
+
+    # Same as template_engine.LINK_MODES, without importing it for --help
+    link_modes = ('copy', 'hardlink', 'reflink')
+
+    create_parser = subparsers.add_parser('create', help="Create a mod")
+    create_parser.add_argument('mod_name')
+    create_parser.add_argument('short_mod_name')
+    create_parser.add_argument('--tags', nargs='*', help="Mod tags (default: Fixes)")
+    create_parser.add_argument('--version', help="Supported game version (default: detected)")
+    create_parser.add_argument('--link-mode', choices=link_modes, help="How template assets are copied")
+    create_parser.add_argument('--no-essentials', action='store_true', help="Skip the Essentials template")
+    create_parser.add_argument('--debug', action='store_true', help="Create in debug/output")
+    create_parser.set_defaults(func=cmd_create)
+
+    batch_parser = subparsers.add_parser('batch', help="Create every mod in a JSON or CSV manifest")
+    batch_parser.add_argument('manifest')
+    batch_parser.add_argument('--report', help="Write the per-mod report as JSON")
+    batch_parser.add_argument('--skip-invalid', action='store_true', help="Create valid rows even if others are invalid")
+    batch_parser.add_argument('--workers', type=int, help="Worker threads")
+    batch_parser.add_argument('--version', help="Supported version for rows without one (default: detected)")
+    batch_parser.add_argument('--link-mode', choices=link_modes, help="How template assets are copied")
+    batch_parser.add_argument('--debug', action='store_true', help="Create in debug/output")
+    batch_parser.set_defaults(func=cmd_batch)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.verbose:
+        # Core warnings reach stderr through logging's last-resort handler either way
+        import logging
+        logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        _status(f"Error: {e}", is_error=True)
+        return 1
+    finally:
+        if 'src.core.config' in sys.modules:
+            # Write out config changes still pending in the write-behind window
+            sys.modules['src.core.config'].ConfigManager.flush()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
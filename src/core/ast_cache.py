@@ -0,0 +1,285 @@
+import os
+import json
+import time
+import zlib
+import marshal
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.script_parser import PARSER_VERSION, parse_bytes
+
+# 256 MiB of serialized trees is enough for vanilla common/ and events/
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ASTCache:
+    """
+    On-disk cache of parsed script trees, keyed by content hash and parser version.
+
+    Each entry is the parse result serialized with marshal and compressed with
+    zlib. A path index remembers the size, mtime and digest of every file seen,
+    so a warm lookup neither reads nor hashes the source file. The cache is
+    bounded in bytes: entries are kept in least recently used order, and once
+    over the bound the oldest are evicted in one batch down to LOW_WATER of it.
+    """
+    INDEX_VERSION = 1
+    # Share of max_bytes an eviction batch frees the cache down to
+    LOW_WATER = 0.9
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            cache_dir (str, optional): Cache location. Defaults to src/data/ast_cache
+            max_bytes (int, optional): Size bound for stored entries. Defaults to 256 MiB.
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'ast_cache')
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger('CK3ModCreator')
+        self._lock = threading.RLock()
+        self._dirty = False
+
+        # path -> [size, mtime_ns, digest]
+        self._paths: Dict[str, List[Any]] = {}
+        # digest -> [entry size in bytes, last used timestamp], least recently used first
+        self._entries: 'OrderedDict[str, List[float]]' = OrderedDict()
+        self._total_bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'stat_hits': 0}
+        self._load_index()
+
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(self.cache_dir, 'index.json')
+
+    def _entry_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, f'{digest}-v{PARSER_VERSION}.ast')
+
+    def _load_index(self):
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') != self.INDEX_VERSION or data.get('parser_version') != PARSER_VERSION:
+            # Entries from another parser version are useless; drop them
+            self.clear()
+            return
+        self._paths = data.get('paths', {})
+        self._entries = OrderedDict(sorted(data.get('entries', {}).items(), key=lambda item: item[1][1]))
+        self._total_bytes = sum(entry[0] for entry in self._entries.values())
+
+    def save(self):
+        """
+        Persist the path index and LRU bookkeeping.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = self._index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': self.INDEX_VERSION,
+                    'parser_version': PARSER_VERSION,
+                    'paths': self._paths,
+                    'entries': self._entries
+                }, f, separators=(',', ':'))
+            os.replace(tmp_path, self._index_path)
+            self._dirty = False
+
+    def clear(self):
+        """
+        Remove every cache entry.
+        """
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.ast') or name == 'index.json':
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        pass
+            self._paths = {}
+            self._entries = OrderedDict()
+            self._total_bytes = 0
+            self._dirty = True
+
+    @staticmethod
+    def digest(data) -> str:
+        """
+        Content hash used as the cache key.
+
+        Args:
+            data (bytes-like): File contents
+
+        Returns:
+            str: BLAKE2b hex digest
+        """
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, digest: str) -> Optional[Tuple[list, list]]:
+        """
+        Load a cached parse result.
+
+        A hit only moves the entry to the back of the LRU order; it does not
+        mark the index for saving, so read-only runs leave it untouched.
+
+        Args:
+            digest (str): Content digest
+
+        Returns:
+            Optional[tuple]: (nodes, errors) or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            try:
+                with open(self._entry_path(digest), 'rb') as f:
+                    result = marshal.loads(zlib.decompress(f.read()))
+            except (OSError, ValueError, EOFError, TypeError, zlib.error):
+                # Missing or corrupt entry: forget it
+                self._total_bytes -= self._entries.pop(digest)[0]
+                self._dirty = True
+                return None
+            entry[1] = time.time()
+            self._entries.move_to_end(digest)
+            return result
+
+    def put(self, digest: str, nodes: list, errors: list):
+        """
+        Store a parse result and evict old entries if over the size bound.
+
+        Args:
+            digest (str): Content digest
+            nodes (list): Parsed nodes
+            errors (list): Parse errors
+        """
+        blob = zlib.compress(marshal.dumps((nodes, errors)), 1)
+        with self._lock:
+            path = self._entry_path(digest)
+            tmp_path = f'{path}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(blob)
+            os.replace(tmp_path, path)
+            previous = self._entries.pop(digest, None)
+            if previous is not None:
+                self._total_bytes -= previous[0]
+            self._entries[digest] = [len(blob), time.time()]
+            self._total_bytes += len(blob)
+            self._dirty = True
+            self._evict()
+
+    def _evict(self):
+        if self._total_bytes <= self.max_bytes:
+            return
+        low_water = self.max_bytes * self.LOW_WATER
+        while self._entries and self._total_bytes > low_water:
+            digest, entry = self._entries.popitem(last=False)
+            try:
+                os.remove(self._entry_path(digest))
+            except OSError:
+                pass
+            self._total_bytes -= entry[0]
+            self._stats['evictions'] += 1
+        # Drop path records that point at evicted entries, once per batch
+        self._paths = {path: record for path, record in self._paths.items() if record[2] in self._entries}
+
+    def lookup_path(self, path: str) -> Optional[str]:
+        """
+        Get the digest recorded for a file if its size and mtime are unchanged.
+
+        Args:
+            path (str): Path to the script file
+
+        Returns:
+            Optional[str]: Known digest, or None if the file must be hashed
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        record = self._paths.get(os.path.normpath(path))
+        if record and record[0] == stat.st_size and record[1] == stat.st_mtime_ns:
+            return record[2]
+        return None
+
+    def record_path(self, path: str, digest: str):
+        """
+        Remember the digest of a file for stat-based lookups.
+
+        Args:
+            path (str): Path to the script file
+            digest (str): Its content digest
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        with self._lock:
+            self._paths[os.path.normpath(path)] = [stat.st_size, stat.st_mtime_ns, digest]
+            self._dirty = True
+
+    def get_or_parse(self, path: str) -> Tuple[list, list]:
+        """
+        Get the parse result of a script file, parsing it on a miss.
+
+        Args:
+            path (str): Path to the script file
+
+        Returns:
+            tuple: (nodes, errors) as returned by script_parser.parse_bytes
+        """
+        digest = self.lookup_path(path)
+        if digest is not None:
+            result = self.get(digest)
+            if result is not None:
+                with self._lock:
+                    self._stats['hits'] += 1
+                    self._stats['stat_hits'] += 1
+                return result
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = self.digest(data)
+        self.record_path(path, digest)
+
+        # Same content may already be cached under another path
+        result = self.get(digest)
+        if result is not None:
+            with self._lock:
+                self._stats['hits'] += 1
+            return result
+
+        with self._lock:
+            self._stats['misses'] += 1
+        nodes, errors = parse_bytes(data)
+        self.put(digest, nodes, errors)
+        return nodes, errors
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: hits, misses, stat_hits (hits that skipped reading the file),
+                evictions, entries, bytes and max_bytes
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.save()
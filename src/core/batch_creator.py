@@ -0,0 +1,259 @@
+import os
+import csv
+import json
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from src.core.mod_creator import ModCreator, ESSENTIALS_DIR
+from src.core.mod_params import ModCreationParams
+from src.core.mod_registry import ModRegistry
+from src.core.template_engine import TemplateEngine
+
+# Manifest columns; tags may be a list (JSON) or a ';'-separated string (CSV)
+MANIFEST_FIELDS = ('mod_name', 'short_mod_name', 'tags', 'supported_version')
+
+
+def _manifest_scalar(value: Any, field: str, number: int, path: str) -> str:
+    """
+    Convert a manifest cell to a stripped string.
+
+    Numbers (e.g. a JSON supported_version of 1.12) are converted with str();
+    missing cells become ''.
+
+    Raises:
+        ValueError: If the cell is a list, object or other non-scalar value
+    """
+    if value is None:
+        return ''
+    if not isinstance(value, (str, int, float)):
+        raise ValueError(f"Manifest {path} row {number}: '{field}' must be a string, "
+                         f"not {type(value).__name__}")
+    return str(value).strip()
+
+
+def load_manifest(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a batch manifest.
+
+    JSON manifests hold a list of objects, or an object with a 'mods' list.
+    CSV manifests need a header row naming the MANIFEST_FIELDS columns.
+
+    Args:
+        path (str): .json or .csv file
+
+    Returns:
+        list: One dict per mod with the MANIFEST_FIELDS keys
+
+    Raises:
+        ValueError: If the file is not a valid manifest or a row has a cell
+            of the wrong type
+    """
+    if path.lower().endswith('.csv'):
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            rows = list(csv.DictReader(f))
+    else:
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON manifest {path}: {e}")
+        rows = data.get('mods') if isinstance(data, dict) else data
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError(f"Manifest {path} must contain a list of mod objects")
+
+    manifest = []
+    for number, row in enumerate(rows, 1):
+        tags = row.get('tags')
+        if tags is None:
+            tags = []
+        elif isinstance(tags, str):
+            tags = [tag.strip() for tag in tags.split(';') if tag.strip()]
+        elif isinstance(tags, list):
+            tags = [_manifest_scalar(tag, 'tags', number, path) for tag in tags]
+        else:
+            raise ValueError(f"Manifest {path} row {number}: 'tags' must be a string or a list")
+        manifest.append({
+            'mod_name': _manifest_scalar(row.get('mod_name'), 'mod_name', number, path),
+            'short_mod_name': _manifest_scalar(row.get('short_mod_name'), 'short_mod_name', number, path),
+            'tags': tags,
+            'supported_version': _manifest_scalar(row.get('supported_version'), 'supported_version',
+                                                  number, path) or None
+        })
+    return manifest
+
+
+class BatchModCreator:
+    """
+    Creates many mods from a manifest.
+
+    Every row is validated with ModCreationParams before anything is written,
+    together with checks for names repeated within the manifest and mods that
+    are already installed. The mods are then created concurrently on a thread
+    pool; the work is file I/O, and the Essentials template is compiled once
+    up front and shared by every worker. Each mod is staged and committed
+    atomically by ModCreator.create_mod, so a failed row leaves nothing behind.
+    """
+
+    def __init__(self, template_dir: str = ESSENTIALS_DIR, debug: bool = False,
+                 max_workers: Optional[int] = None, link_mode: Optional[str] = None):
+        """
+        Args:
+            template_dir (str, optional): Template copied into each mod. Defaults to Mod/Essentials.
+            debug (bool, optional): Whether to use the debug output path. Defaults to False.
+            max_workers (int, optional): Worker threads. Defaults to min(32, CPU count + 4).
+            link_mode (str, optional): See ModCreator.copy_and_replace
+        """
+        self.template_dir = template_dir
+        self.debug = debug
+        self.max_workers = max_workers
+        self.link_mode = link_mode
+
+    def validate(self, manifest: List[Dict[str, Any]], default_version: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Validate every manifest row without writing anything.
+
+        Args:
+            manifest (list): Rows from load_manifest
+            default_version (str, optional): Supported version for rows without one
+
+        Returns:
+            list: Per-row dicts with 'row', 'mod_name', 'short_mod_name', 'params'
+                (ModCreationParams or None) and 'error' (None if valid)
+        """
+        registry = ModRegistry.get_shared()
+        seen_names = {}
+        seen_short_names = {}
+        results = []
+        for number, row in enumerate(manifest, 1):
+            result = {
+                'row': number,
+                'mod_name': row.get('mod_name', ''),
+                'short_mod_name': row.get('short_mod_name', ''),
+                'params': None,
+                'error': None
+            }
+            results.append(result)
+            try:
+                params = ModCreationParams(
+                    mod_name=row.get('mod_name', ''),
+                    short_mod_name=row.get('short_mod_name', ''),
+                    tags=row.get('tags') or ["Fixes"],
+                    supported_version=row.get('supported_version') or default_version
+                )
+            except ValueError as e:
+                result['error'] = str(e)
+                continue
+
+            name_key = params.mod_name.casefold()
+            if name_key in seen_names:
+                result['error'] = f"Mod name '{params.mod_name}' is also used in row {seen_names[name_key]}"
+                continue
+            if params.short_mod_name in seen_short_names:
+                result['error'] = (f"Short mod name '{params.short_mod_name}' is also used in row "
+                                   f"{seen_short_names[params.short_mod_name]}")
+                continue
+            seen_names[name_key] = number
+            seen_short_names[params.short_mod_name] = number
+
+            paths = ModCreator.get_mod_paths(params.mod_name, self.debug)
+            existing_mod = registry.find_existing(params.mod_name, paths['mod_folder_path'], paths['mod_file_path'])
+            if existing_mod:
+                result['error'] = f"A mod named '{existing_mod['name']}' already exists at {existing_mod['path']}"
+                continue
+            result['params'] = params
+        return results
+
+    def _create_one(self, params: ModCreationParams) -> Dict[str, Any]:
+        start = time.perf_counter()
+        result = ModCreator.create_mod(
+            params.mod_name, params.short_mod_name, params.tags, params.supported_version,
+            self.template_dir, self.debug, link_mode=self.link_mode
+        )
+        result['elapsed'] = time.perf_counter() - start
+        return result
+
+    def create_all(self, manifest: List[Dict[str, Any]], default_version: Optional[str] = None,
+                   skip_invalid: bool = False, status_callback=None) -> Dict[str, Any]:
+        """
+        Validate a manifest and create its mods.
+
+        Args:
+            manifest (list): Rows from load_manifest
+            default_version (str, optional): Supported version for rows without one
+            skip_invalid (bool, optional): Create the valid rows even if others are
+                invalid. Defaults to False, which creates nothing unless every row is valid.
+            status_callback (callable, optional): Callback for progress updates, called from worker threads
+
+        Returns:
+            dict: 'mods' (per-row dicts with 'row', 'mod_name', 'short_mod_name',
+                'status' ('created', 'failed', 'invalid' or 'skipped'), 'error',
+                'mod_folder_path', 'elapsed' and 'timings' per phase, see
+                ModCreator.create_mod), 'created', 'failed', 'invalid' and 'elapsed'
+        """
+        start = time.perf_counter()
+        validated = self.validate(manifest, default_version)
+        invalid = [result for result in validated if result['error']]
+
+        mods = []
+        for result in validated:
+            mods.append({
+                'row': result['row'],
+                'mod_name': result['mod_name'],
+                'short_mod_name': result['short_mod_name'],
+                'status': 'invalid' if result['error'] else 'skipped',
+                'error': result['error'],
+                'mod_folder_path': None,
+                'elapsed': 0.0,
+                'timings': None
+            })
+
+        pending = [(mod, result['params']) for mod, result in zip(mods, validated) if result['params'] is not None]
+        if invalid and not skip_invalid:
+            pending = []
+            if status_callback:
+                status_callback(f"{len(invalid)} of {len(manifest)} manifest rows are invalid; no mods created",
+                                is_error=True)
+
+        if pending:
+            if os.path.isdir(self.template_dir):
+                TemplateEngine.get(self.template_dir)
+            done = 0
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self._create_one, params): mod for mod, params in pending}
+                for future in as_completed(futures):
+                    mod = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {'success': False, 'error': str(e), 'elapsed': 0.0}
+                    mod['status'] = 'created' if result['success'] else 'failed'
+                    mod['error'] = result.get('error')
+                    mod['mod_folder_path'] = result.get('mod_folder_path')
+                    mod['elapsed'] = result['elapsed']
+                    mod['timings'] = result.get('timings')
+                    done += 1
+                    if status_callback:
+                        status_callback(f"{mod['status'].capitalize()} {done}/{len(pending)}: {mod['mod_name']}",
+                                        is_error=not result['success'])
+
+        created = sum(mod['status'] == 'created' for mod in mods)
+        failed = sum(mod['status'] == 'failed' for mod in mods)
+        elapsed = time.perf_counter() - start
+        logging.info(f"Batch creation: {created} created, {failed} failed, {len(invalid)} invalid in {elapsed:.2f}s")
+        return {'mods': mods, 'created': created, 'failed': failed, 'invalid': len(invalid), 'elapsed': elapsed}
+
+    @staticmethod
+    def write_report(report: Dict[str, Any], path: str):
+        """
+        Write a create_all report as JSON, atomically.
+
+        Args:
+            report (dict): Result of create_all
+            path (str): Output file
+        """
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp_path, path)
@@ -0,0 +1,245 @@
+import os
+import time
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.core.ast_cache import ASTCache
+from src.core.script_parser import parse_bytes
+
+# Target bytes of script per worker task
+DEFAULT_SHARD_BYTES = 2 * 1024 * 1024
+# Cap on files per task so thousands of tiny files still spread across workers
+DEFAULT_SHARD_FILES = 256
+
+
+def _parse_shard(game_dir: str, rel_paths: List[str]) -> List[Tuple[str, Optional[str], Any, Any]]:
+    """
+    Parse a batch of script files in a worker process.
+
+    Module-level so it can be pickled into worker processes.
+
+    Args:
+        game_dir (str): Path to the game directory
+        rel_paths (list): Relative paths ('/' separated) to parse
+
+    Returns:
+        list: (path, digest, nodes, errors) per file; digest and nodes are None
+            and errors is the message if the file could not be read
+    """
+    results = []
+    for rel_path in rel_paths:
+        try:
+            with open(os.path.join(game_dir, *rel_path.split('/')), 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            results.append((rel_path, None, None, str(e)))
+            continue
+        try:
+            nodes, errors = parse_bytes(data)
+        except Exception as e:
+            # A parser bug must not take the whole shard down
+            results.append((rel_path, None, None, f"Parser failure: {e}"))
+            continue
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        results.append((rel_path, digest, nodes, errors))
+    return results
+
+
+class BulkScriptParser:
+    """
+    Parses every script file of the game directory on a process pool.
+
+    Files are packed into shards of roughly equal byte size and the largest
+    shards are submitted first, so big files such as landed_titles start early
+    instead of straggling at the end. Results are yielded as shards complete;
+    unreadable files are reported per file instead of aborting the run.
+    """
+    SCRIPT_EXTENSIONS = ('.txt',)
+
+    def __init__(self, game_dir: str, max_workers: Optional[int] = None,
+                 shard_bytes: int = DEFAULT_SHARD_BYTES, shard_files: int = DEFAULT_SHARD_FILES,
+                 cache: Optional[ASTCache] = None, save_cache: bool = True):
+        """
+        Args:
+            game_dir (str): Path to the game directory
+            max_workers (int, optional): Parser processes. Defaults to the CPU count.
+            shard_bytes (int, optional): Target bytes per task
+            shard_files (int, optional): Maximum files per task
+            cache (ASTCache, optional): Serve unchanged files from, and store results in, this cache
+            save_cache (bool, optional): Save the cache index after each run. Callers that
+                parse many small sources in a row pass False and save once at the end,
+                since every save rewrites the whole index. Defaults to True.
+        """
+        self.game_dir = game_dir
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shard_bytes = max(1, shard_bytes)
+        self.shard_files = max(1, shard_files)
+        self.cache = cache
+        self.save_cache = save_cache
+        self.report: Dict[str, Any] = {}
+
+    @classmethod
+    def select_scripts(cls, files: Dict[str, List[int]]) -> Dict[str, int]:
+        """
+        Pick the script files out of a game file listing.
+
+        Args:
+            files (dict): Relative path -> [size, mtime_ns], e.g. from GameFileIndex.get_files()
+
+        Returns:
+            dict: Relative path -> size for non-empty script files
+        """
+        return {
+            path: stat[0] for path, stat in files.items()
+            if path.endswith(cls.SCRIPT_EXTENSIONS) and stat[0] > 0
+        }
+
+    def make_shards(self, sizes: Dict[str, int]) -> List[List[str]]:
+        """
+        Pack files into shards of about shard_bytes each, largest shard first.
+
+        Files are placed largest first; a file bigger than shard_bytes gets a
+        shard of its own.
+
+        Args:
+            sizes (dict): Relative path -> size in bytes
+
+        Returns:
+            list: Shards as lists of relative paths
+        """
+        shards: List[Tuple[int, List[str]]] = []
+        current: List[str] = []
+        current_bytes = 0
+        for path in sorted(sizes, key=lambda p: (-sizes[p], p)):
+            size = sizes[path]
+            if current and (current_bytes + size > self.shard_bytes or len(current) >= self.shard_files):
+                shards.append((current_bytes, current))
+                current, current_bytes = [], 0
+            current.append(path)
+            current_bytes += size
+        if current:
+            shards.append((current_bytes, current))
+        shards.sort(key=lambda shard: -shard[0])
+        return [paths for _, paths in shards]
+
+    def iter_parse(self, sizes: Dict[str, int], status_callback=None,
+                   cancel_token=None) -> Iterator[Tuple[str, Any, Any]]:
+        """
+        Parse files and yield results as they become available.
+
+        Cached results are yielded first, then each shard as its worker finishes.
+        Afterwards ``report`` holds 'parsed', 'cached', 'failed' (path -> message),
+        'syntax_errors' (path -> error count), 'cancelled' and 'elapsed'. New
+        results are put in the cache, whose index is saved at the end unless
+        save_cache is False.
+
+        Args:
+            sizes (dict): Relative path -> size, e.g. from select_scripts()
+            status_callback (callable, optional): Callback for progress updates
+            cancel_token (threading.Event, optional): Stops submitting work once set
+
+        Yields:
+            tuple: (relative path, nodes, errors); nodes is None for files that
+                could not be read, with errors holding the message
+        """
+        start = time.perf_counter()
+        report = {'parsed': 0, 'cached': 0, 'failed': {}, 'syntax_errors': {}, 'cancelled': False, 'elapsed': 0.0}
+        self.report = report
+
+        pending: Dict[str, int] = {}
+        for path, size in sizes.items():
+            result = None
+            if self.cache is not None:
+                digest = self.cache.lookup_path(self._abs_path(path))
+                if digest is not None:
+                    result = self.cache.get(digest)
+            if result is None:
+                pending[path] = size
+                continue
+            report['cached'] += 1
+            if result[1]:
+                report['syntax_errors'][path] = len(result[1])
+            yield path, result[0], result[1]
+
+        shards = self.make_shards(pending)
+        if status_callback:
+            status_callback(f"Parsing {len(pending)} script files ({report['cached']} cached) "
+                            f"in {len(shards)} shards...")
+
+        try:
+            for done, (shard, results) in enumerate(self._run_shards(shards), 1):
+                if cancel_token is not None and cancel_token.is_set():
+                    report['cancelled'] = True
+                    break
+                if isinstance(results, Exception):
+                    # Worker died (e.g. out of memory); report the whole shard
+                    for path in shard:
+                        report['failed'][path] = f"Worker failure: {results}"
+                        yield path, None, report['failed'][path]
+                    continue
+                for path, digest, nodes, errors in results:
+                    if digest is None:
+                        report['failed'][path] = errors
+                        yield path, None, errors
+                        continue
+                    report['parsed'] += 1
+                    if errors:
+                        report['syntax_errors'][path] = len(errors)
+                    if self.cache is not None:
+                        self.cache.put(digest, nodes, errors)
+                        self.cache.record_path(self._abs_path(path), digest)
+                    yield path, nodes, errors
+                if status_callback:
+                    status_callback(f"Parsed {done}/{len(shards)} shards...")
+        finally:
+            if self.cache is not None and self.save_cache:
+                self.cache.save()
+
+        report['elapsed'] = time.perf_counter() - start
+        if report['failed']:
+            logging.warning(f"Could not parse {len(report['failed'])} script files")
+
+    def parse_all(self, sizes: Dict[str, int], status_callback=None, cancel_token=None) -> Dict[str, Any]:
+        """
+        Parse files and collect every result.
+
+        Args:
+            sizes (dict): Relative path -> size, e.g. from select_scripts()
+            status_callback (callable, optional): Callback for progress updates
+            cancel_token (threading.Event, optional): Stops the run once set
+
+        Returns:
+            dict: Relative path -> (nodes, errors) for files that were parsed
+        """
+        return {
+            path: (nodes, errors)
+            for path, nodes, errors in self.iter_parse(sizes, status_callback, cancel_token)
+            if nodes is not None
+        }
+
+    def _run_shards(self, shards: List[List[str]]) -> Iterator[Tuple[List[str], Any]]:
+        """
+        Yield (shard, results or exception) in completion order.
+        """
+        if not shards:
+            return
+        if self.max_workers == 1:
+            # No pool: pickling the trees back would only add overhead
+            for shard in shards:
+                yield shard, _parse_shard(self.game_dir, shard)
+            return
+        executor = ProcessPoolExecutor(max_workers=min(self.max_workers, len(shards)))
+        try:
+            futures = {executor.submit(_parse_shard, self.game_dir, shard): shard for shard in shards}
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result()
+                except Exception as e:
+                    yield futures[future], e
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _abs_path(self, rel_path: str) -> str:
+        return os.path.join(self.game_dir, *rel_path.split('/'))
@@ -1,6 +1,11 @@
 import os
+import copy
 import json
-from typing import Any, Dict, List, Optional
+import atexit
+import logging
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 class ConfigManager:
     """
@@ -11,11 +16,31 @@ class ConfigManager:
         'window_size': (1000, 1000),
         'log_level': 'INFO',
         'recent_mods': [],
+        'recent_mod_names': [],
         'steam_path_history': [],
         'current_steam_path': None,
-        'first_startup': True
+        'first_startup': True,
+        'scan_workers': None,
+        'parse_workers': None,
+        'parse_shard_kb': 2048,
+        'template_link_mode': 'copy'
     }
 
+    # Process-wide parsed snapshot of the config file, keyed by its stat signature
+    _cache: Optional[Dict[str, Any]] = None
+    _cache_signature: Optional[Tuple[int, int]] = None
+    _cache_hits = 0
+    _cache_misses = 0
+    _cache_lock = threading.RLock()
+
+    # Write-behind state: mutations land in the cache and a background timer
+    # flushes them _write_delay seconds after the first unsaved change. The
+    # window is not extended by later changes, so no change waits longer than
+    # that; a failed flush is retried after another window
+    _write_delay = 0.5
+    _dirty = False
+    _flush_timer: Optional[threading.Timer] = None
+
     @classmethod
     def get_config_dir(cls) -> str:
         """
@@ -38,37 +63,182 @@ class ConfigManager:
         """
         return os.path.join(cls.get_config_dir(), 'app_config.json')
 
+    @classmethod
+    def _get_file_signature(cls, config_path: str) -> Optional[Tuple[int, int]]:
+        """
+        Get the stat signature used to detect changes to the configuration file.
+        
+        Args:
+            config_path (str): Path to the configuration file
+        
+        Returns:
+            Optional[Tuple[int, int]]: (mtime_ns, size) or None if the file is missing
+        """
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     @classmethod
     def load_config(cls) -> Dict[str, Any]:
         """
         Load configuration from file.
         
+        The parsed file is cached for the whole process and only re-read when
+        its mtime or size changes. Callers get their own copy and may mutate it.
+        
         Returns:
             dict: Loaded configuration or default configuration
         """
         config_path = cls.get_config_path()
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            # Merge with default config to ensure all keys exist
-            return {**cls._DEFAULT_CONFIG, **config}
-        except (FileNotFoundError, json.JSONDecodeError):
-            # Create default config file if it doesn't exist
-            config = cls._DEFAULT_CONFIG
-            cls.save_config(config)
-            return config
+        with cls._cache_lock:
+            # Unflushed changes are newer than whatever is on disk
+            if cls._dirty and cls._cache is not None:
+                cls._cache_hits += 1
+                return copy.deepcopy(cls._cache)
+
+            signature = cls._get_file_signature(config_path)
+            if cls._cache is not None and signature is not None and signature == cls._cache_signature:
+                cls._cache_hits += 1
+                return copy.deepcopy(cls._cache)
+
+            cls._cache_misses += 1
+            try:
+                with open(config_path, 'r') as f:
+                    config = json.load(f)
+                # Merge with default config to ensure all keys exist
+                config = {**copy.deepcopy(cls._DEFAULT_CONFIG), **config}
+                cls._cache = config
+                cls._cache_signature = signature
+                return copy.deepcopy(config)
+            except (FileNotFoundError, json.JSONDecodeError):
+                # Create default config file if it doesn't exist
+                config = copy.deepcopy(cls._DEFAULT_CONFIG)
+                cls.save_config(config)
+                return config
 
     @classmethod
-    def save_config(cls, config: Dict[str, Any]):
+    def save_config(cls, config: Dict[str, Any], immediate: bool = False):
         """
         Save configuration to file.
         
+        The write is deferred: the first unsaved change starts the write-behind
+        window, and every change made before it ends is written by one
+        background flush when it does.
+        
         Args:
             config (dict): Configuration to save
+            immediate (bool, optional): Write to disk before returning. Defaults to False.
         """
-        config_path = cls.get_config_path()
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=4)
+        with cls._cache_lock:
+            # Store the JSON-decoded form (tuples become lists) so cached reads
+            # match what a fresh read of the file would return
+            cls._cache = json.loads(json.dumps(config))
+            cls._mark_dirty()
+        if immediate:
+            cls.flush()
+
+    @classmethod
+    def _mark_dirty(cls):
+        """
+        Mark the cached configuration as unsaved and schedule a flush.
+        """
+        cls._dirty = True
+        if cls._write_delay <= 0:
+            cls.flush()
+            return
+        if cls._flush_timer is None:
+            cls._schedule_flush()
+
+    @classmethod
+    def _schedule_flush(cls):
+        cls._flush_timer = threading.Timer(cls._write_delay, cls._timed_flush)
+        cls._flush_timer.daemon = True
+        cls._flush_timer.start()
+
+    @classmethod
+    def _timed_flush(cls):
+        """
+        Timer callback: flush, and retry after another window if writing fails.
+        """
+        try:
+            cls.flush()
+        except Exception as e:
+            logging.warning(f"Could not save configuration, retrying in {cls._write_delay}s: {e}")
+            with cls._cache_lock:
+                if cls._dirty and cls._flush_timer is None:
+                    cls._schedule_flush()
+
+    @classmethod
+    def set_write_delay(cls, seconds: float):
+        """
+        Set the write-behind coalescing window.
+        
+        Args:
+            seconds (float): Delay before pending changes are flushed. 0 writes synchronously.
+        """
+        with cls._cache_lock:
+            cls._write_delay = max(0.0, float(seconds))
+
+    @classmethod
+    def flush(cls):
+        """
+        Write pending configuration changes to disk.
+        
+        The file is replaced atomically via a temporary file and rename, so a
+        crash mid-write never leaves a truncated config behind.
+        """
+        with cls._cache_lock:
+            if cls._flush_timer is not None:
+                cls._flush_timer.cancel()
+                cls._flush_timer = None
+            if not cls._dirty or cls._cache is None:
+                return
+
+            config_path = cls.get_config_path()
+            fd, tmp_path = tempfile.mkstemp(
+                prefix='.app_config.', suffix='.tmp', dir=os.path.dirname(config_path)
+            )
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(cls._cache, f, indent=4)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, config_path)
+            except Exception:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+            cls._dirty = False
+            cls._cache_signature = cls._get_file_signature(config_path)
+
+    @classmethod
+    def invalidate_cache(cls):
+        """
+        Drop the cached configuration so the next read goes to disk.
+        """
+        with cls._cache_lock:
+            cls.flush()
+            cls._cache = None
+            cls._cache_signature = None
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, int]:
+        """
+        Get configuration cache hit/miss counters.
+        
+        Returns:
+            dict: Number of cache hits and misses since startup
+        """
+        with cls._cache_lock:
+            return {
+                'hits': cls._cache_hits,
+                'misses': cls._cache_misses
+            }
 
     @classmethod
     def set_steam_path(cls, steam_path: str):
@@ -128,13 +298,19 @@ class ConfigManager:
         """
         Update a specific configuration key.
         
+        The change is visible to readers immediately and written to disk by
+        the next write-behind flush.
+        
         Args:
             key (str): Configuration key to update
             value (Any): New value for the key
         """
-        config = cls.load_config()
-        config[key] = value
-        cls.save_config(config)
+        with cls._cache_lock:
+            if cls._cache is None or not cls._dirty:
+                # Make sure the cache reflects the file before mutating it
+                cls.load_config()
+            cls._cache[key] = json.loads(json.dumps(value))
+            cls._mark_dirty()
 
     @classmethod
     def get_config_value(cls, key: str, default: Optional[Any] = None) -> Any:
@@ -152,24 +328,30 @@ class ConfigManager:
         return config.get(key, default)
 
     @classmethod
-    def add_recent_mod(cls, mod_name: str):
+    def add_recent_mod(cls, mod_name: str, full_name: Optional[str] = None):
         """
         Add a mod to the recent mods list.
         
         Args:
-            mod_name (str): Name of the mod to add
+            mod_name (str): Short name of the mod to add
+            full_name (str, optional): Full name of the mod, kept in a separate
+                'recent_mod_names' list for looking mods up in the ModRegistry
         """
         config = cls.load_config()
-        recent_mods = config.get('recent_mods', [])
-        
+        config['recent_mods'] = cls._push_recent(config.get('recent_mods', []), mod_name)
+        if full_name:
+            config['recent_mod_names'] = cls._push_recent(config.get('recent_mod_names', []), full_name)
+        cls.save_config(config)
+
+    @staticmethod
+    def _push_recent(recent: List[str], name: str) -> List[str]:
         # Remove duplicates and add to the beginning of the list
-        if mod_name in recent_mods:
-            recent_mods.remove(mod_name)
-        recent_mods.insert(0, mod_name)
+        if name in recent:
+            recent.remove(name)
+        recent.insert(0, name)
         
         # Limit to last 10 mods
-        config['recent_mods'] = recent_mods[:10]
-        cls.save_config(config)
+        return recent[:10]
 
     @classmethod
     def get_recent_mods(cls) -> List[str]:
@@ -177,10 +359,20 @@ class ConfigManager:
         Get the list of recent mods.
         
         Returns:
-            List[str]: List of recent mod names
+            List[str]: List of recent short mod names
         """
         return cls.get_config_value('recent_mods', [])
 
+    @classmethod
+    def get_recent_mod_names(cls) -> List[str]:
+        """
+        Get the full names of the recent mods.
+        
+        Returns:
+            List[str]: Full mod names, most recent first
+        """
+        return cls.get_config_value('recent_mod_names', [])
+
     @classmethod
     def is_first_startup(cls) -> bool:
         """
@@ -199,4 +391,7 @@ class ConfigManager:
         """
         config = cls.load_config()
         config['first_startup'] = False
-        cls.save_config(config)
\ No newline at end of file
+        cls.save_config(config)
+
+# Don't lose changes still sitting in the write-behind window on exit
+atexit.register(ConfigManager.flush)
@@ -0,0 +1,256 @@
+import os
+import mmap
+import struct
+import tempfile
+from typing import Iterable, Iterator, List, Optional
+
+# Header: magic, format version, entries per block, entry count, block count,
+# offset of the block offset table
+_HEADER = struct.Struct('<8sHHIIQ')
+_MAGIC = b'CK3FLIX\x00'
+_FORMAT_VERSION = 1
+_OFFSET = struct.Struct('<Q')
+
+
+def _encode_varint(value: int, out: bytearray):
+    """
+    Append an unsigned LEB128 varint to a buffer.
+    """
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varint(buf, pos: int):
+    """
+    Decode an unsigned LEB128 varint.
+
+    Returns:
+        tuple: (value, position after the varint)
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+class FileListIndex:
+    """
+    Sorted, front-coded binary index of game file paths.
+
+    Paths are stored in blocks of ``block_size`` entries. The first entry of
+    each block is stored in full, the rest as (shared prefix length, suffix)
+    against the previous entry. A table of block offsets at the end of the
+    file allows binary search over block heads, so membership and prefix
+    queries decode only a single block plus O(log n) block heads straight
+    from the memory-mapped file.
+
+    Layout::
+
+        header | block 0 | block 1 | ... | offset table (u64 per block)
+    """
+    DEFAULT_BLOCK_SIZE = 32
+
+    def __init__(self, path: str):
+        """
+        Open an index file for reading.
+
+        Args:
+            path (str): Path to an index written by FileListIndex.write
+
+        Raises:
+            ValueError: If the file is not a valid index
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"Not a file list index: {path}")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, version, block_size, count, block_count, table_pos = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported file list index: {path}")
+        self.block_size = block_size
+        self._count = count
+        self._block_count = block_count
+        self._table_pos = table_pos
+
+    @classmethod
+    def write(cls, paths: Iterable[str], output_path: str, block_size: int = DEFAULT_BLOCK_SIZE) -> int:
+        """
+        Write a sorted, front-coded index of paths.
+
+        Args:
+            paths (iterable): Relative paths; separators are normalised to '/'
+            output_path (str): Where to write the index
+            block_size (int, optional): Entries per block. Defaults to 32.
+
+        Returns:
+            int: Number of entries written
+        """
+        keys = sorted({path.replace(os.sep, '/').encode('utf-8') for path in paths})
+
+        body = bytearray()
+        offsets: List[int] = []
+        previous = b''
+        for i, key in enumerate(keys):
+            if i % block_size == 0:
+                offsets.append(_HEADER.size + len(body))
+                _encode_varint(len(key), body)
+                body += key
+            else:
+                shared = 0
+                limit = min(len(previous), len(key))
+                while shared < limit and previous[shared] == key[shared]:
+                    shared += 1
+                _encode_varint(shared, body)
+                _encode_varint(len(key) - shared, body)
+                body += key[shared:]
+            previous = key
+
+        table_pos = _HEADER.size + len(body)
+        # A unique temporary name, so concurrent writers never write into the same file
+        fd, tmp_path = tempfile.mkstemp(
+            prefix='.' + os.path.basename(output_path) + '.', suffix='.tmp',
+            dir=os.path.dirname(os.path.abspath(output_path))
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, block_size, len(keys), len(offsets), table_pos))
+                f.write(body)
+                for offset in offsets:
+                    f.write(_OFFSET.pack(offset))
+            os.replace(tmp_path, output_path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return len(keys)
+
+    def close(self):
+        """
+        Release the memory map and file handle.
+        """
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _block_offset(self, block: int) -> int:
+        return _OFFSET.unpack_from(self._mm, self._table_pos + block * _OFFSET.size)[0]
+
+    def _block_head(self, block: int) -> bytes:
+        """
+        Decode only the first (full) key of a block.
+        """
+        length, pos = _decode_varint(self._mm, self._block_offset(block))
+        return self._mm[pos:pos + length]
+
+    def _iter_block(self, block: int) -> Iterator[bytes]:
+        """
+        Decode the keys of one block in order.
+        """
+        pos = self._block_offset(block)
+        entries = min(self.block_size, self._count - block * self.block_size)
+        length, pos = _decode_varint(self._mm, pos)
+        key = self._mm[pos:pos + length]
+        pos += length
+        yield key
+        for _ in range(entries - 1):
+            shared, pos = _decode_varint(self._mm, pos)
+            length, pos = _decode_varint(self._mm, pos)
+            key = key[:shared] + self._mm[pos:pos + length]
+            pos += length
+            yield key
+
+    def _find_block(self, key: bytes) -> int:
+        """
+        Find the last block whose head is <= key (0 if key precedes every block).
+        """
+        lo, hi = 0, self._block_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._block_head(mid) <= key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return max(lo - 1, 0)
+
+    def _iter_from(self, block: int) -> Iterator[bytes]:
+        for current in range(block, self._block_count):
+            yield from self._iter_block(current)
+
+    def __contains__(self, path: str) -> bool:
+        if not self._count:
+            return False
+        key = path.replace(os.sep, '/').encode('utf-8')
+        for candidate in self._iter_block(self._find_block(key)):
+            if candidate == key:
+                return True
+            if candidate > key:
+                break
+        return False
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._iter_from(0):
+            yield key.decode('utf-8')
+
+    def iter_prefix(self, prefix: str) -> Iterator[str]:
+        """
+        Yield all paths starting with a prefix, in sorted order.
+
+        Args:
+            prefix (str): Path prefix, e.g. 'common/on_action/'
+
+        Yields:
+            str: Matching relative paths
+        """
+        if not self._count:
+            return
+        key = prefix.replace(os.sep, '/').encode('utf-8')
+        for candidate in self._iter_from(self._find_block(key)):
+            if candidate.startswith(key):
+                yield candidate.decode('utf-8')
+            elif candidate > key:
+                return
+
+    def find_prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Get paths starting with a prefix.
+
+        Args:
+            prefix (str): Path prefix
+            limit (int, optional): Maximum number of results
+
+        Returns:
+            list: Matching relative paths in sorted order
+        """
+        results = []
+        for path in self.iter_prefix(prefix):
+            results.append(path)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
@@ -0,0 +1,336 @@
+import os
+import re
+import bisect
+from array import array
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class FuzzyFileFinder:
+    """
+    Ctrl+P style fuzzy finder over relative game file paths.
+
+    Every lowercased path is broken into bigrams and trigrams and each maps
+    to a posting list of path ids; every character has a posting list too.
+    A query is answered by intersecting the rarest posting lists, keeping
+    the candidates that contain each query word as a subsequence, and
+    scoring only the best of those with a matcher that rewards contiguous
+    runs, matches at word boundaries and matches in the file name.
+    Space-separated query words may match in any order.
+
+    Path ids are assigned shortest path first. Candidates are ranked
+    globally, first by how the words match (all inside the file name, all
+    verbatim somewhere in the path, as subsequences of paths sharing a
+    trigram with a scattered word, or only as subsequences) and then by
+    path id, so only the best CANDIDATE_LIMIT of them get a full score.
+    Paths whose file name is or starts with a query word are looked up
+    separately in a sorted file name index and always scored.
+    """
+    # Number of best-ranked matches that get a full score
+    CANDIDATE_LIMIT = 150
+    # Stop intersecting posting lists once this few candidates remain
+    NARROW_STOP = 64
+    # Posting lists covering more than this share of paths are not intersected
+    DENSE_RATIO = 0.25
+    # Rarest posting lists intersected per word; verification does the rest
+    MAX_INTERSECT = 3
+    # Candidates checked per group and tier before giving up, so scattered queries stay interactive
+    SCAN_LIMIT = 5000
+    # Trigram posting lists covering more than this share of paths do not mark partial matches
+    PARTIAL_RATIO = 0.5
+
+    def __init__(self, paths: Iterable[str]):
+        """
+        Build the bigram, trigram and character indexes.
+
+        Args:
+            paths (iterable): Relative file paths (either separator style)
+        """
+        # Shortest paths first, so path id order is also the tie-break order of the ranking
+        self.paths: List[str] = sorted((path.replace(os.sep, '/') for path in paths),
+                                       key=lambda path: (len(path), path.lower(), path))
+        self._lowered: List[str] = [path.lower() for path in self.paths]
+        self._basename_start: List[int] = [path.rfind('/') + 1 for path in self._lowered]
+        self._basenames: List[str] = [
+            path[start:] for path, start in zip(self._lowered, self._basename_start)
+        ]
+        # File names in sorted order (shortest path first among equal names), for prefix lookups
+        order = sorted(range(len(self._lowered)), key=lambda path_id: (
+            self._basenames[path_id], len(self._lowered[path_id])
+        ))
+        self._basename_order = array('I', order)
+        self._sorted_basenames: List[str] = [self._basenames[path_id] for path_id in order]
+
+        postings: Dict[str, set] = {}
+        char_postings: Dict[str, set] = {}
+        for path_id, path in enumerate(self._lowered):
+            for gram in {path[i:i + size] for size in (2, 3) for i in range(len(path) - size + 1)}:
+                ids = postings.get(gram)
+                if ids is None:
+                    postings[gram] = {path_id}
+                else:
+                    ids.add(path_id)
+            for char in set(path):
+                ids = char_postings.get(char)
+                if ids is None:
+                    char_postings[char] = {path_id}
+                else:
+                    ids.add(path_id)
+        # Compact, sorted posting lists
+        self._postings: Dict[str, array] = {
+            gram: array('I', sorted(ids)) for gram, ids in postings.items()
+        }
+        self._char_postings: Dict[str, array] = {
+            char: array('I', sorted(ids)) for char, ids in char_postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @staticmethod
+    def _narrow(ids: set, postings: array) -> set:
+        """
+        Intersect a candidate set with a sorted posting list.
+
+        Small candidate sets are probed by binary search, so a common trigram
+        with a huge posting list costs O(k log n) instead of O(n).
+        """
+        if len(ids) * 16 >= len(postings):
+            return ids.intersection(postings)
+        narrowed = set()
+        size = len(postings)
+        for path_id in ids:
+            i = bisect.bisect_left(postings, path_id)
+            if i < size and postings[i] == path_id:
+                narrowed.add(path_id)
+        return narrowed
+
+    def _intersect(self, lists: List[array]) -> Optional[set]:
+        """
+        Intersect posting lists, rarest first.
+
+        Dense lists (characters like 'e' or '_' that occur in most paths)
+        barely prune anything, so intersection stops when it reaches one,
+        or after MAX_INTERSECT lists.
+
+        Returns:
+            Optional[set]: Candidate ids, or None if even the rarest list is dense
+        """
+        lists = sorted(lists, key=len)
+        dense = len(self.paths) * self.DENSE_RATIO
+        if len(lists[0]) > dense:
+            return None
+        ids = set(lists[0])
+        for postings in lists[1:self.MAX_INTERSECT]:
+            if len(ids) <= self.NARROW_STOP or len(postings) > dense:
+                break
+            ids = self._narrow(ids, postings)
+        return ids
+
+    def _gram_lists(self, word: str) -> Optional[List[array]]:
+        """
+        Get the posting lists of a word's trigrams (the word itself if shorter).
+
+        Returns:
+            Optional[list]: Posting lists, or None if the word occurs verbatim in no path
+        """
+        grams = {word[i:i + 3] for i in range(len(word) - 2)} or {word}
+        postings = self._char_postings if len(word) == 1 else self._postings
+        lists = [postings.get(gram) for gram in grams]
+        return None if any(ids is None for ids in lists) else lists
+
+    def _candidate_groups(self, words: List[str]) -> Iterator[Iterable[int]]:
+        """
+        Split the candidates into disjoint groups, best group first.
+
+        The first group may contain every word verbatim. If some word occurs
+        verbatim nowhere, it was typed as a scattered subsequence: the first
+        group is then empty, the paths sharing one of its trigrams come next
+        and every other path containing all query characters comes last.
+        Later groups are only built if the ranking gets to them.
+
+        Yields:
+            iterable: Path ids of one group in id order; the first group is a sequence
+        """
+        chars = set(''.join(words))
+        if any(char not in self._char_postings for char in chars):
+            return
+        verbatim_lists: List[array] = []
+        scattered: List[str] = []
+        for word in words:
+            lists = self._gram_lists(word)
+            if lists is None:
+                scattered.append(word)
+            else:
+                verbatim_lists.append(lists)
+
+        if scattered:
+            verbatim = set()
+        else:
+            # Every word must occur, so intersect the rarest list of each word
+            verbatim = self._intersect([min(lists, key=len) for lists in verbatim_lists])
+        if verbatim is None:
+            yield range(len(self.paths))  # matches most paths, leave it to verification
+            return
+        yield sorted(verbatim)
+        if not scattered:
+            return  # the words were typed verbatim, scattered matches elsewhere are not wanted
+
+        partial = set()
+        for word in scattered:
+            for trigram in {word[i:i + 3] for i in range(len(word) - 2)}:
+                postings = self._postings.get(trigram)
+                if postings is not None and len(postings) <= len(self.paths) * self.PARTIAL_RATIO:
+                    partial.update(postings)
+        partial -= verbatim
+        if partial:
+            yield sorted(partial)
+
+        seen = verbatim | partial
+        rest = self._intersect([self._char_postings[char] for char in chars])
+        if rest is None:
+            yield (path_id for path_id in range(len(self.paths)) if path_id not in seen)
+        else:
+            yield sorted(rest - seen)
+
+    def _ranked(self, groups: Iterator[Iterable[int]], words: List[str], patterns: List['re.Pattern']) -> List[int]:
+        """
+        Get the best-ranked candidates in which every query word occurs.
+
+        Matches rank by tier, then by path id (shortest path first). Paths of
+        the first group that contain every word inside the file name come
+        first, then those containing every word verbatim, then the rest of
+        its subsequence matches; the subsequence matches of each later group
+        form one more tier. Each tier is collected in id order, and only
+        until CANDIDATE_LIMIT paths are ranked. At most SCAN_LIMIT paths of
+        each group are checked; the limit counts work rather than time, so
+        the result never depends on machine load.
+
+        Returns:
+            list: Up to CANDIDATE_LIMIT path ids, best first
+        """
+        lowered = self._lowered
+        basenames = self._basenames
+        first, others = words[0], words[1:]
+        ranked: List[int] = []
+        taken = set()
+
+        first_group = next(groups, None)
+        if first_group is None:
+            return ranked
+        window = first_group[:self.SCAN_LIMIT]
+        tiers = (
+            (path_id for path_id in window
+             if first in basenames[path_id] and all(word in basenames[path_id] for word in others)),
+            (path_id for path_id in window
+             if first in lowered[path_id] and all(word in lowered[path_id] for word in others)
+             and path_id not in taken),
+            (path_id for path_id in window
+             if path_id not in taken and all(pattern.match(lowered[path_id]) for pattern in patterns))
+        )
+        for tier in chain(tiers, (
+            (path_id for path_id in islice(group, self.SCAN_LIMIT)
+             if all(pattern.match(lowered[path_id]) for pattern in patterns))
+            for group in groups
+        )):
+            found = list(islice(tier, self.CANDIDATE_LIMIT - len(ranked)))
+            ranked.extend(found)
+            if len(ranked) >= self.CANDIDATE_LIMIT:
+                break
+            taken.update(found)
+        return ranked
+
+    def _basename_hits(self, word: str) -> List[int]:
+        """
+        Get the paths whose file name is or starts with a word, exact names first.
+
+        Found by bisecting the sorted file names, so the cost is proportional
+        to the number of hits; at most CANDIDATE_LIMIT are returned.
+        """
+        names = self._sorted_basenames
+        order = self._basename_order
+        lo = bisect.bisect_left(names, word)
+        hi = bisect.bisect_left(names, word + '\U0010ffff', lo)
+        if lo == hi:
+            return []
+        # 'name' itself, then 'name.ext'; '/' follows '.' and never occurs in a file name
+        exact_end = bisect.bisect_right(names, word, lo, hi)
+        ext_lo = bisect.bisect_left(names, word + '.', exact_end, hi)
+        ext_hi = bisect.bisect_left(names, word + '/', ext_lo, hi)
+        hits = list(order[lo:exact_end]) + list(order[ext_lo:ext_hi])
+        for start, end in ((exact_end, ext_lo), (ext_hi, hi)):
+            if len(hits) >= self.CANDIDATE_LIMIT:
+                break
+            hits.extend(order[start:min(end, start + self.CANDIDATE_LIMIT - len(hits))])
+        return hits[:self.CANDIDATE_LIMIT]
+
+    def _score(self, query: str, path_id: int) -> float:
+        """
+        Score a path against a query; 0 means the query is not a subsequence.
+        """
+        path = self._lowered[path_id]
+        basename_start = self._basename_start[path_id]
+
+        # Greedy subsequence match; when the query occurs verbatim, start at
+        # that occurrence (file name first) so the contiguous run is scored
+        basename = path[basename_start:]
+        pos = path.find(query, basename_start)
+        if pos < 0:
+            pos = max(path.find(query), 0)
+        score = 0.0
+        previous = -2
+        for char in query:
+            found = path.find(char, pos)
+            if found < 0:
+                return 0.0
+            score += 1.0
+            if found == previous + 1:
+                score += 2.0  # contiguous run
+            if found == 0 or path[found - 1] in '/_-. ':
+                score += 1.5  # word boundary
+            if found >= basename_start:
+                score += 1.0  # inside the file name
+            previous = found
+            pos = found + 1
+
+        if query in basename:
+            score += 10.0 + (5.0 if basename.startswith(query) else 0.0)
+            if basename.split('.', 1)[0] == query:
+                score += 5.0  # exact file name
+        elif query in path:
+            score += 5.0
+        # Prefer shorter paths among equal matches
+        return score - len(path) * 0.01
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[str, float]]:
+        """
+        Find the paths that best match a query.
+
+        Args:
+            query (str): Free-text query; words separated by spaces match in any order
+            limit (int, optional): Maximum number of results. Defaults to 50.
+
+        Returns:
+            list: (path, score) tuples, best match first
+        """
+        words = query.replace(os.sep, '/').lower().split()
+        if not words:
+            return []
+
+        # Leftmost subsequence match; the negated classes never need to backtrack
+        patterns = [
+            re.compile(''.join(f'[^{re.escape(char)}]*{re.escape(char)}' for char in word)) for word in words
+        ]
+        matches = set(self._ranked(self._candidate_groups(words), words, patterns))
+        # Exact and prefix file name hits are kept even if the scan stopped before them
+        for word in words:
+            for path_id in self._basename_hits(word):
+                if path_id not in matches and all(pattern.match(self._lowered[path_id]) for pattern in patterns):
+                    matches.add(path_id)
+
+        scored = []
+        for path_id in matches:
+            score = sum(self._score(word, path_id) for word in words)
+            scored.append((score, path_id))
+        scored.sort(key=lambda item: (-item[0], self.paths[item[1]]))
+        return [(self.paths[path_id], score) for score, path_id in scored[:limit]]
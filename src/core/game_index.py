@@ -0,0 +1,397 @@
+import os
+import json
+import time
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class GameFileIndex:
+    """
+    Persistent, incrementally updated index of the files in a game directory.
+
+    The index records every directory's mtime together with the size and mtime
+    of the files directly inside it. On a rescan, directories whose mtime is
+    unchanged are not listed again: their file entries are reused and only
+    their subdirectories are visited. Adding, removing or replacing a file
+    (which is how Steam applies patches) updates the parent directory's mtime,
+    so those changes are always picked up. In-place edits that keep the
+    directory mtime are only detected by a full rescan (``scan(full=True)``).
+
+    Paths in the index are relative to the game directory and always use
+    forward slashes.
+    """
+    INDEX_VERSION = 1
+
+    def __init__(self, game_dir: str, index_path: Optional[str] = None):
+        """
+        Create an index for a game directory.
+
+        Args:
+            game_dir (str): Path to the game directory to index
+            index_path (str, optional): Where to persist the index. Defaults to
+                src/data/vanilla_index.json
+        """
+        self.game_dir = os.path.normpath(game_dir)
+        if index_path is None:
+            data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+            index_path = os.path.join(data_dir, 'vanilla_index.json')
+        self.index_path = index_path
+        # reldir -> {'mtime': int, 'dirs': [names], 'files': {name: [size, mtime_ns]}}
+        self._dirs: Dict[str, Dict[str, Any]] = {}
+        # Report of the last completed iter_files walk
+        self.last_scan: Optional[Dict[str, Any]] = None
+        self.logger = logging.getLogger('CK3ModCreator')
+
+    @staticmethod
+    def _join(rel_dir: str, name: str) -> str:
+        """
+        Join a relative directory and an entry name with a forward slash.
+        """
+        return f"{rel_dir}/{name}" if rel_dir else name
+
+    def load(self) -> bool:
+        """
+        Load the persisted index from disk.
+
+        Returns:
+            bool: True if a compatible index for this game directory was loaded
+        """
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._dirs = {}
+            return False
+
+        if data.get('version') != self.INDEX_VERSION or data.get('game_dir') != self.game_dir:
+            self._dirs = {}
+            return False
+
+        self._dirs = data.get('dirs', {})
+        return True
+
+    def save(self):
+        """
+        Persist the index to disk atomically.
+        """
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        # A unique temporary name, so concurrent saves never write into the same file
+        fd, tmp_path = tempfile.mkstemp(
+            prefix='.' + os.path.basename(self.index_path) + '.', suffix='.tmp',
+            dir=os.path.dirname(self.index_path)
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': self.INDEX_VERSION,
+                    'game_dir': self.game_dir,
+                    'dirs': self._dirs
+                }, f, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _walk(self, rel_roots: List[str], old_dirs: Dict[str, Dict[str, Any]], full: bool,
+              recursive: bool = True, cancel_token=None, ordered: bool = False
+              ) -> Iterator[Tuple[str, Dict[str, Any], bool]]:
+        """
+        Walk directories depth-first, reusing unchanged ones from old_dirs.
+
+        Only reads from ``old_dirs``, so several subtrees can be walked from
+        different threads at once.
+
+        Args:
+            rel_roots (list): Relative directories to start from
+            old_dirs (dict): Directory records from the previous scan
+            full (bool): Re-list directories even if their mtime is unchanged
+            recursive (bool, optional): Descend into subdirectories. Defaults to True.
+            cancel_token (threading.Event, optional): Stops the walk once set
+            ordered (bool, optional): Visit subdirectories in name order. Defaults to False.
+
+        Yields:
+            tuple: (relative directory, its record, whether it was listed again)
+        """
+        stack = list(reversed(rel_roots))
+        while stack:
+            if cancel_token is not None and cancel_token.is_set():
+                return
+            rel_dir = stack.pop()
+            abs_dir = os.path.join(self.game_dir, rel_dir) if rel_dir else self.game_dir
+            try:
+                dir_mtime = os.stat(abs_dir).st_mtime_ns
+            except OSError:
+                continue
+
+            old = old_dirs.get(rel_dir)
+            if not full and old is not None and old['mtime'] == dir_mtime:
+                # Directory listing is unchanged, reuse the recorded entries
+                record = old
+                listed = False
+            else:
+                subdirs: List[str] = []
+                files: Dict[str, List[int]] = {}
+                try:
+                    with os.scandir(abs_dir) as entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    subdirs.append(entry.name)
+                                elif entry.is_file():
+                                    st = entry.stat()
+                                    files[entry.name] = [st.st_size, st.st_mtime_ns]
+                            except OSError:
+                                continue
+                except OSError as e:
+                    self.logger.warning(f"Could not list {abs_dir}: {e}")
+                    continue
+                record = {'mtime': dir_mtime, 'dirs': subdirs, 'files': files}
+                listed = True
+
+            if recursive:
+                names = sorted(record['dirs'], reverse=True) if ordered else record['dirs']
+                stack.extend(self._join(rel_dir, name) for name in names)
+            yield rel_dir, record, listed
+
+    def _diff_files(self, rel_dir: str, old: Optional[Dict[str, Any]], files: Dict[str, List[int]],
+                    added: List[str], removed: List[str], modified: List[str]):
+        """
+        Diff a relisted directory's files against what was recorded before.
+        """
+        old_files = old['files'] if old is not None else {}
+        for name, stat in files.items():
+            previous = old_files.get(name)
+            if previous is None:
+                added.append(self._join(rel_dir, name))
+            elif previous != stat:
+                modified.append(self._join(rel_dir, name))
+        for name in old_files:
+            if name not in files:
+                removed.append(self._join(rel_dir, name))
+
+    def _scan_tree(self, rel_roots: List[str], old_dirs: Dict[str, Dict[str, Any]],
+                   full: bool, recursive: bool = True, cancel_token=None) -> Dict[str, Any]:
+        """
+        Scan one or more subtrees against the previously recorded directories.
+
+        Args:
+            rel_roots (list): Relative directories to start from
+            old_dirs (dict): Directory records from the previous scan
+            full (bool): Re-list directories even if their mtime is unchanged
+            recursive (bool, optional): Descend into subdirectories. Defaults to True.
+            cancel_token (threading.Event, optional): Stops the scan once set
+
+        Returns:
+            dict: Partial scan result ('dirs', 'added', 'removed', 'modified',
+                'dirs_scanned', 'dirs_reused')
+        """
+        new_dirs: Dict[str, Dict[str, Any]] = {}
+        added: List[str] = []
+        removed: List[str] = []
+        modified: List[str] = []
+        dirs_scanned = 0
+        dirs_reused = 0
+
+        for rel_dir, record, listed in self._walk(rel_roots, old_dirs, full, recursive, cancel_token):
+            new_dirs[rel_dir] = record
+            if not listed:
+                dirs_reused += 1
+                continue
+            dirs_scanned += 1
+            self._diff_files(rel_dir, old_dirs.get(rel_dir), record['files'], added, removed, modified)
+
+        return {
+            'dirs': new_dirs,
+            'added': added,
+            'removed': removed,
+            'modified': modified,
+            'dirs_scanned': dirs_scanned,
+            'dirs_reused': dirs_reused
+        }
+
+    def _finish_scan(self, old_dirs: Dict[str, Dict[str, Any]], new_dirs: Dict[str, Dict[str, Any]],
+                     added: List[str], removed: List[str], modified: List[str],
+                     dirs_scanned: int, dirs_reused: int, save: bool, start: float) -> Dict[str, Any]:
+        """
+        Replace the index with a completed scan, save it and build the report.
+        """
+        # Directories that disappeared take all their files with them
+        for rel_dir, old in old_dirs.items():
+            if rel_dir not in new_dirs:
+                removed.extend(self._join(rel_dir, name) for name in old['files'])
+
+        self._dirs = new_dirs
+        changed = bool(added or removed or modified) or dirs_scanned > 0
+        if save and changed:
+            try:
+                self.save()
+            except OSError as e:
+                self.logger.error(f"Failed to save game file index: {e}")
+
+        added.sort()
+        removed.sort()
+        modified.sort()
+        return {
+            'added': added,
+            'removed': removed,
+            'modified': modified,
+            'total_files': sum(len(d['files']) for d in new_dirs.values()),
+            'dirs_scanned': dirs_scanned,
+            'dirs_reused': dirs_reused,
+            'cancelled': False,
+            'elapsed': time.perf_counter() - start
+        }
+
+    def scan(self, full: bool = False, save: bool = True,
+             max_workers: Optional[int] = None, cancel_token=None) -> Dict[str, Any]:
+        """
+        Bring the index up to date with the game directory.
+
+        The top-level subtrees (common, gfx, localization, ...) are scanned
+        concurrently on a thread pool, which hides stat latency on spinning
+        disks and network-mounted libraries. Results are merged in subtree
+        name order, so the outcome does not depend on thread scheduling.
+
+        Args:
+            full (bool, optional): Re-list every directory and re-stat every file,
+                ignoring directory mtimes. Defaults to False.
+            save (bool, optional): Persist the index afterwards if anything changed.
+                Defaults to True.
+            max_workers (int, optional): Number of scanner threads. 1 scans serially.
+                Defaults to ThreadPoolExecutor's default.
+            cancel_token (threading.Event, optional): Stops every scanner thread once
+                set; a cancelled scan leaves the index unchanged.
+
+        Returns:
+            dict: Scan report with 'added', 'removed' and 'modified' path lists,
+                plus 'total_files', 'dirs_scanned', 'dirs_reused', 'cancelled' and 'elapsed'
+        """
+        start = time.perf_counter()
+        if not self._dirs:
+            self.load()
+
+        old_dirs = self._dirs
+        # List the game directory itself, then fan out over its subdirectories
+        results = [self._scan_tree([''], old_dirs, full, recursive=False, cancel_token=cancel_token)]
+        root_record = results[0]['dirs'].get('')
+        subtrees = sorted(root_record['dirs']) if root_record else []
+
+        if max_workers == 1 or len(subtrees) <= 1:
+            results.extend(self._scan_tree([name], old_dirs, full, cancel_token=cancel_token) for name in subtrees)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='game-scan') as executor:
+                # map() yields in submission order, keeping the merge deterministic
+                results.extend(executor.map(
+                    lambda name: self._scan_tree([name], old_dirs, full, cancel_token=cancel_token), subtrees
+                ))
+
+        if cancel_token is not None and cancel_token.is_set():
+            return {
+                'added': [], 'removed': [], 'modified': [],
+                'total_files': sum(len(d['files']) for d in old_dirs.values()),
+                'dirs_scanned': sum(result['dirs_scanned'] for result in results),
+                'dirs_reused': sum(result['dirs_reused'] for result in results),
+                'cancelled': True,
+                'elapsed': time.perf_counter() - start
+            }
+
+        new_dirs: Dict[str, Dict[str, Any]] = {}
+        added: List[str] = []
+        removed: List[str] = []
+        modified: List[str] = []
+        for result in results:
+            new_dirs.update(result['dirs'])
+            added.extend(result['added'])
+            removed.extend(result['removed'])
+            modified.extend(result['modified'])
+        dirs_scanned = sum(result['dirs_scanned'] for result in results)
+        dirs_reused = sum(result['dirs_reused'] for result in results)
+        return self._finish_scan(old_dirs, new_dirs, added, removed, modified,
+                                 dirs_scanned, dirs_reused, save, start)
+
+    def iter_files(self, full: bool = False, save: bool = True, cancel_token=None,
+                   status_callback=None, progress_interval: float = 0.25) -> Iterator[str]:
+        """
+        Update the index while yielding every file as it is found.
+
+        Unlike scan, the tree is walked serially, depth-first with
+        subdirectories in name order, and each directory's files are yielded
+        (in name order) as soon as it is listed or reused, so only the
+        directory records are held. The index is replaced and saved only
+        once the walk completes; afterwards ``last_scan`` holds the scan
+        report. A cancelled walk leaves the index unchanged.
+
+        Args:
+            full (bool, optional): Re-list every directory, ignoring directory mtimes
+            save (bool, optional): Persist the index afterwards if anything changed
+            cancel_token (threading.Event, optional): Stops the walk once set
+            status_callback (callable, optional): Callback for throttled progress updates
+            progress_interval (float, optional): Minimum seconds between progress updates
+
+        Yields:
+            str: Relative file path using forward slashes
+        """
+        start = time.perf_counter()
+        if not self._dirs:
+            self.load()
+        self.last_scan = None
+
+        old_dirs = self._dirs
+        new_dirs: Dict[str, Dict[str, Any]] = {}
+        added: List[str] = []
+        removed: List[str] = []
+        modified: List[str] = []
+        dirs_scanned = 0
+        dirs_reused = 0
+        count = 0
+        last_report = time.monotonic()
+
+        for rel_dir, record, listed in self._walk([''], old_dirs, full, cancel_token=cancel_token, ordered=True):
+            new_dirs[rel_dir] = record
+            if listed:
+                dirs_scanned += 1
+                self._diff_files(rel_dir, old_dirs.get(rel_dir), record['files'], added, removed, modified)
+            else:
+                dirs_reused += 1
+            for name in sorted(record['files']):
+                yield self._join(rel_dir, name)
+            count += len(record['files'])
+            if status_callback and time.monotonic() - last_report >= progress_interval:
+                last_report = time.monotonic()
+                status_callback(f"Scanning game files... {count} found")
+
+        if cancel_token is not None and cancel_token.is_set():
+            return
+        self.last_scan = self._finish_scan(old_dirs, new_dirs, added, removed, modified,
+                                           dirs_scanned, dirs_reused, save, start)
+
+    def get_files(self) -> Dict[str, List[int]]:
+        """
+        Get every indexed file with its recorded stat.
+
+        Returns:
+            dict: Relative path -> [size, mtime_ns]
+        """
+        return {
+            self._join(rel_dir, name): stat
+            for rel_dir, record in self._dirs.items()
+            for name, stat in record['files'].items()
+        }
+
+    def list_files(self) -> List[str]:
+        """
+        Get the sorted list of indexed relative file paths.
+
+        Returns:
+            list: Relative file paths using forward slashes
+        """
+        return sorted(
+            self._join(rel_dir, name)
+            for rel_dir, record in self._dirs.items()
+            for name in record['files']
+        )
@@ -0,0 +1,231 @@
+import os
+import re
+import json
+import mmap
+import time
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+# BLAKE2b digest size in bytes; 16 bytes is plenty to detect changed files
+DIGEST_SIZE = 16
+
+
+def _hash_file(path: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Hash a single file with BLAKE2b using a memory-mapped read.
+
+    Module-level so it can be pickled into worker processes.
+
+    Args:
+        path (str): Absolute path to the file
+
+    Returns:
+        tuple: (hex digest, None) on success or (None, error message)
+    """
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files cannot be mapped
+                return hashlib.blake2b(b'', digest_size=DIGEST_SIZE).hexdigest(), None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.blake2b(mm, digest_size=DIGEST_SIZE).hexdigest(), None
+    except (OSError, ValueError) as e:
+        return None, str(e)
+
+
+class GameManifest:
+    """
+    Content-hash manifests of the vanilla game files, one per game version.
+
+    A manifest maps every relative game file path to its size, mtime and
+    BLAKE2b digest. Every file is stat'ed when the manifest is built; files
+    whose current size and mtime match the previous manifest keep their old
+    digest, so only new or changed files are hashed.
+    """
+    MANIFEST_VERSION = 1
+
+    # Below this many files the process pool start-up costs more than it saves
+    PARALLEL_THRESHOLD = 64
+
+    @staticmethod
+    def get_manifest_dir() -> str:
+        """
+        Get the directory manifests are stored in, creating it if needed.
+
+        Returns:
+            str: Path to src/data/manifests
+        """
+        manifest_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'manifests')
+        os.makedirs(manifest_dir, exist_ok=True)
+        return manifest_dir
+
+    @classmethod
+    def get_manifest_path(cls, version: str) -> str:
+        """
+        Get the manifest file path for a game version.
+
+        Args:
+            version (str): Game version string, e.g. '1.14.2.2'
+
+        Returns:
+            str: Path to the manifest file
+        """
+        safe_version = re.sub(r'[^0-9A-Za-z._-]', '_', version)
+        return os.path.join(cls.get_manifest_dir(), f'{safe_version}.json')
+
+    @classmethod
+    def load(cls, version: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the stored manifest for a game version.
+
+        Args:
+            version (str): Game version string
+
+        Returns:
+            Optional[dict]: Manifest or None if missing or incompatible
+        """
+        return cls._load_path(cls.get_manifest_path(version))
+
+    @classmethod
+    def _load_path(cls, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if manifest.get('manifest_version') != cls.MANIFEST_VERSION:
+            return None
+        return manifest
+
+    @classmethod
+    def list_versions(cls) -> List[str]:
+        """
+        List the game versions that have a stored manifest, oldest first.
+
+        Returns:
+            list: Version strings ordered by manifest creation time
+        """
+        manifests = []
+        for name in os.listdir(cls.get_manifest_dir()):
+            if not name.endswith('.json'):
+                continue
+            manifest = cls._load_path(os.path.join(cls.get_manifest_dir(), name))
+            if manifest:
+                manifests.append((manifest.get('created', 0), manifest['version']))
+        return [version for _, version in sorted(manifests)]
+
+    @classmethod
+    def load_latest(cls, exclude: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Load the most recently created manifest.
+
+        Args:
+            exclude (str, optional): Version to skip
+
+        Returns:
+            Optional[dict]: Manifest or None if there is none
+        """
+        versions = [version for version in cls.list_versions() if version != exclude]
+        return cls.load(versions[-1]) if versions else None
+
+    @classmethod
+    def save(cls, manifest: Dict[str, Any]) -> str:
+        """
+        Persist a manifest atomically.
+
+        Args:
+            manifest (dict): Manifest produced by build()
+
+        Returns:
+            str: Path the manifest was written to
+        """
+        path = cls.get_manifest_path(manifest['version'])
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def build(cls, game_dir: str, version: str, files: Dict[str, List[int]],
+              previous: Optional[Dict[str, Any]] = None, max_workers: Optional[int] = None,
+              status_callback=None) -> Dict[str, Any]:
+        """
+        Build a content-hash manifest for a game directory.
+
+        Args:
+            game_dir (str): Path to the game directory
+            version (str): Game version the manifest is keyed by
+            files (dict): Relative path -> [size, mtime_ns], e.g. from GameFileIndex.get_files().
+                Only the paths are trusted; sizes and mtimes are read again, since
+                the index does not notice in-place edits in unchanged directories.
+            previous (dict, optional): Earlier manifest whose digests are reused
+                for files with unchanged size and mtime
+            max_workers (int, optional): Hashing processes. Defaults to the CPU count.
+            status_callback (callable, optional): Callback to report progress
+
+        Returns:
+            dict: Manifest with 'version', 'game_dir', 'created', 'files'
+                (path -> [size, mtime_ns, digest]), 'errors' and 'stats'
+        """
+        start = time.perf_counter()
+        previous_files = previous.get('files', {}) if previous else {}
+
+        entries: Dict[str, List[Any]] = {}
+        stats: Dict[str, List[int]] = {}
+        to_hash: List[str] = []
+        for path in sorted(files):
+            try:
+                stat = os.stat(os.path.join(game_dir, *path.split('/')))
+                stats[path] = [stat.st_size, stat.st_mtime_ns]
+            except OSError:
+                # Hashing records the error
+                stats[path] = files[path]
+                to_hash.append(path)
+                continue
+            old = previous_files.get(path)
+            if old is not None and old[:2] == stats[path]:
+                entries[path] = old
+            else:
+                to_hash.append(path)
+
+        if status_callback and to_hash:
+            status_callback(f"Hashing {len(to_hash)} of {len(files)} game files...")
+
+        abs_paths = [os.path.join(game_dir, *path.split('/')) for path in to_hash]
+        if max_workers == 1 or len(to_hash) < cls.PARALLEL_THRESHOLD:
+            digests = map(_hash_file, abs_paths)
+            hashed = list(zip(to_hash, digests))
+        else:
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(abs_paths) // (workers * 8))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                hashed = list(zip(to_hash, executor.map(_hash_file, abs_paths, chunksize=chunksize)))
+
+        errors: Dict[str, str] = {}
+        for path, (digest, error) in hashed:
+            if digest is None:
+                errors[path] = error
+                continue
+            size, mtime = stats[path]
+            entries[path] = [size, mtime, digest]
+
+        if errors:
+            logging.warning(f"Could not hash {len(errors)} game files")
+
+        return {
+            'manifest_version': cls.MANIFEST_VERSION,
+            'version': version,
+            'game_dir': os.path.normpath(game_dir),
+            'created': time.time(),
+            'files': dict(sorted(entries.items())),
+            'errors': errors,
+            'stats': {
+                'total_files': len(files),
+                'hashed': len(to_hash) - len(errors),
+                'reused': len(files) - len(to_hash),
+                'elapsed': time.perf_counter() - start
+            }
+        }
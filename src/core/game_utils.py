@@ -2,6 +2,12 @@ import os
 import json
 import logging
 import re
+import shutil
+import tempfile
+import traceback
+from src.core.game_index import GameFileIndex
+from src.core.file_list_index import FileListIndex
+from src.core.config import ConfigManager
 
 class CK3GameUtils:
     @classmethod
@@ -111,26 +117,59 @@ class CK3GameUtils:
         return version_info['full_version']
         
     @staticmethod
-    def list_game_files(steam_path, status_callback=None):
+    def get_game_dir(steam_path):
+        """
+        Get the Crusader Kings III game directory inside a Steam installation.
+        
+        Args:
+            steam_path (str): Path to the Steam installation directory
+        
+        Returns:
+            str: Path to the game directory
+        """
+        return os.path.join(
+            steam_path, 
+            'steamapps', 
+            'common', 
+            'Crusader Kings III', 
+            'game'
+        )
+
+    @staticmethod
+    def get_data_dir():
+        """
+        Get the application's data directory, creating it if needed.
+        
+        Returns:
+            str: Path to src/data
+        """
+        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+        os.makedirs(data_dir, exist_ok=True)
+        return data_dir
+
+    @staticmethod
+    def list_game_files(steam_path, status_callback=None, full_rescan=False, max_workers=None, write_text=True):
         """
         List game files in the Crusader Kings III game directory.
         
+        The directory tree is tracked by a persistent GameFileIndex, so repeated
+        calls only re-list directories that changed since the last scan. The list
+        is saved as a binary FileListIndex (vanilla_files.idx) and, optionally,
+        as the plain text vanilla_files.txt.
+        
         Args:
             steam_path (str): Path to the Steam installation directory
             status_callback (callable, optional): Callback to update status label
+            full_rescan (bool, optional): Ignore the saved index and re-stat everything
+            max_workers (int, optional): Scanner threads. Defaults to the 'scan_workers' config value
+            write_text (bool, optional): Also write the text export. Defaults to True.
         
         Returns:
             list: List of relative file paths in the game directory
         """
         try:
             # Construct the path to the game directory
-            game_dir = os.path.join(
-                steam_path, 
-                'steamapps', 
-                'common', 
-                'Crusader Kings III', 
-                'game'
-            )
+            game_dir = CK3GameUtils.get_game_dir(steam_path)
 
             # Check if game directory exists
             if not os.path.exists(game_dir):
@@ -138,35 +177,32 @@ class CK3GameUtils:
                     status_callback("Game directory not found", is_error=True)
                 return []
 
-            # Create a list to store file paths
-            file_list = []
+            file_list, file_set_changed = CK3GameUtils._update_file_index(game_dir, full_rescan, max_workers)
+            # Relative paths in the platform's native separator
+            file_list = [path.replace('/', os.sep) for path in file_list]
 
-            # Walk through the directory and its subdirectories
-            for root, dirs, files in os.walk(game_dir):
-                for file in files:
-                    # Get the full path of the file
-                    full_path = os.path.join(root, file)
-                    # Get the relative path from the game directory
-                    relative_path = os.path.relpath(full_path, game_dir)
-                    file_list.append(relative_path)
+            # Define the output file paths
+            index_file = os.path.join(CK3GameUtils.get_data_dir(), 'vanilla_files.idx')
+            output_file = os.path.join(CK3GameUtils.get_data_dir(), 'vanilla_files.txt')
 
-            # Create a 'data' directory if it doesn't exist
-            data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
-            os.makedirs(data_dir, exist_ok=True)
-
-            # Define the output file path
-            output_file = os.path.join(data_dir, 'vanilla_files.txt')
+            # Only rewrite the text export when the file set changed
+            if not file_set_changed and (not write_text or os.path.exists(output_file)):
+                if status_callback:
+                    status_callback(f"Found {len(file_list)} game files (unchanged). Index at {index_file}")
+                return file_list
 
             # Write the file list to the text file
             try:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(f"Total Files Found: {len(file_list)}\n\n")
-                    for file_path in sorted(file_list):
-                        f.write(file_path + "\n")
+                if write_text:
+                    with open(output_file, 'w', encoding='utf-8') as f:
+                        f.write(f"Total Files Found: {len(file_list)}\n\n")
+                        for file_path in file_list:
+                            f.write(file_path + "\n")
                 
                 # Show a success message via status callback if available
                 if status_callback:
-                    status_callback(f"Found {len(file_list)} game files. List saved to {output_file}")
+                    saved_to = output_file if write_text else index_file
+                    status_callback(f"Found {len(file_list)} game files. List saved to {saved_to}")
             
             except Exception as e:
                 # Show an error message if file writing fails
@@ -183,4 +219,530 @@ class CK3GameUtils:
             if status_callback:
                 status_callback(f"Error listing game files: {e}", is_error=True)
             
-            return []
\ No newline at end of file
+            return []
+
+    @staticmethod
+    def _update_file_index(game_dir, full_rescan=False, max_workers=None):
+        """
+        Bring the persistent GameFileIndex up to date and rewrite
+        vanilla_files.idx when the set of files changed.
+        
+        Args:
+            game_dir (str): Path to the game directory
+            full_rescan (bool, optional): Ignore the saved index and re-stat everything
+            max_workers (int, optional): Scanner threads. Defaults to the 'scan_workers' config value
+        
+        Returns:
+            tuple: (sorted relative paths with forward slashes, whether the file set changed)
+        """
+        if max_workers is None:
+            max_workers = ConfigManager.get_config_value('scan_workers')
+        index = GameFileIndex(game_dir)
+        scan = index.scan(full=full_rescan, max_workers=max_workers)
+        logging.info(
+            f"Game file scan: {scan['total_files']} files, "
+            f"{len(scan['added'])} added, {len(scan['removed'])} removed, "
+            f"{len(scan['modified'])} modified, {scan['dirs_scanned']} dirs listed, "
+            f"{scan['dirs_reused']} reused in {scan['elapsed']:.3f}s"
+        )
+        file_list = index.list_files()
+        file_set_changed = bool(scan['added'] or scan['removed'])
+        CK3GameUtils._save_file_list_index(file_list, file_set_changed)
+        return file_list, file_set_changed
+
+    @staticmethod
+    def _save_file_list_index(file_list, file_set_changed):
+        """
+        Rewrite vanilla_files.idx if the file set changed or it is missing.
+        
+        Args:
+            file_list (list): Sorted relative paths with forward slashes
+            file_set_changed (bool): Whether files were added or removed
+        """
+        index_file = os.path.join(CK3GameUtils.get_data_dir(), 'vanilla_files.idx')
+        if file_set_changed or not os.path.exists(index_file):
+            try:
+                FileListIndex.write([path.replace('/', os.sep) for path in file_list], index_file)
+            except OSError as e:
+                logging.error(f"Failed to save game file index {index_file}: {e}")
+
+    @staticmethod
+    def open_file_list_index():
+        """
+        Open the binary game file index written by list_game_files.
+        
+        Returns:
+            FileListIndex: Memory-mapped index, or None if it has not been built yet
+        """
+        index_file = os.path.join(CK3GameUtils.get_data_dir(), 'vanilla_files.idx')
+        if not os.path.exists(index_file):
+            return None
+        return FileListIndex(index_file)
+
+    @staticmethod
+    def iter_game_files(steam_path, status_callback=None, cancel_token=None, progress_interval=0.25):
+        """
+        Yield the game files as the directory walk finds them.
+        
+        The walk goes through the persistent GameFileIndex, so unchanged
+        directories are served from the index instead of being listed again,
+        and the index is brought up to date along the way. Once the walk
+        completes, vanilla_files.idx is refreshed if the file set changed, so
+        exporting the list maintains the same caches as list_game_files.
+        
+        Args:
+            steam_path (str): Path to the Steam installation directory
+            status_callback (callable, optional): Callback for progress updates
+            cancel_token (threading.Event, optional): Stops the walk once set
+            progress_interval (float, optional): Minimum seconds between progress updates
+        
+        Yields:
+            str: Relative file path in the game directory, depth-first in name order
+        
+        Raises:
+            FileNotFoundError: If the game directory does not exist
+        """
+        game_dir = CK3GameUtils.get_game_dir(steam_path)
+        if not os.path.isdir(game_dir):
+            raise FileNotFoundError(f"Game directory not found: {game_dir}")
+
+        index = GameFileIndex(game_dir)
+        for rel_path in index.iter_files(cancel_token=cancel_token, status_callback=status_callback,
+                                         progress_interval=progress_interval):
+            yield rel_path.replace('/', os.sep)
+
+        scan = index.last_scan
+        if scan is not None:
+            CK3GameUtils._save_file_list_index(index.list_files(), bool(scan['added'] or scan['removed']))
+
+    @staticmethod
+    def stream_game_files(steam_path, output_file=None, status_callback=None, cancel_token=None):
+        """
+        Write the game file list to a text report.
+        
+        The list comes from iter_game_files, so the persistent index is used
+        and kept up to date. Entries go to a temporary file; the report is only
+        replaced once every entry is written, so a cancelled or failed listing
+        (including a missing game directory) leaves the previous report intact.
+        
+        Args:
+            steam_path (str): Path to the Steam installation directory
+            output_file (str, optional): Report path. Defaults to src/data/vanilla_files.txt
+            status_callback (callable, optional): Callback to update status label
+            cancel_token (threading.Event, optional): Cancels the listing once set
+        
+        Returns:
+            dict: 'success', 'cancelled', 'count' and 'output_file', plus 'error' on failure
+        """
+        if output_file is None:
+            output_file = os.path.join(CK3GameUtils.get_data_dir(), 'vanilla_files.txt')
+
+        count = 0
+        try:
+            output_dir = os.path.dirname(output_file)
+            with tempfile.TemporaryFile('w+', encoding='utf-8', dir=output_dir) as body:
+                for rel_path in CK3GameUtils.iter_game_files(steam_path, status_callback, cancel_token):
+                    body.write(rel_path + "\n")
+                    count += 1
+
+                if cancel_token is not None and cancel_token.is_set():
+                    if status_callback:
+                        status_callback(f"Listing cancelled after {count} files", is_error=True)
+                    return {'success': False, 'cancelled': True, 'count': count, 'output_file': output_file}
+
+                # Header needs the final count, so assemble the report afterwards
+                body.seek(0)
+                tmp_output = output_file + '.tmp'
+                with open(tmp_output, 'w', encoding='utf-8') as f:
+                    f.write(f"Total Files Found: {count}\n\n")
+                    shutil.copyfileobj(body, f)
+                os.replace(tmp_output, output_file)
+
+            if status_callback:
+                status_callback(f"Found {count} game files. List saved to {output_file}")
+            return {'success': True, 'cancelled': False, 'count': count, 'output_file': output_file}
+
+        except Exception as e:
+            logging.error(f"Error listing game files: {e}")
+            if status_callback:
+                status_callback(f"Error listing game files: {e}", is_error=True)
+            return {'success': False, 'cancelled': False, 'count': count, 'output_file': output_file, 'error': str(e)}
+
+    @staticmethod
+    def build_file_manifest(steam_path, status_callback=None, max_workers=None):
+        """
+        Build and store a content-hash manifest of the game files for the
+        currently installed game version.
+        
+        Digests from the stored manifest of the same version (or, after a patch,
+        the most recent one) are reused for files with unchanged size and mtime.
+        
+        Args:
+            steam_path (str): Path to the Steam installation directory
+            status_callback (callable, optional): Callback to update status label
+            max_workers (int, optional): Hashing processes. Defaults to the CPU count.
+        
+        Returns:
+            dict: The manifest, or None if it could not be built
+        """
+        from src.core.game_manifest import GameManifest
+        try:
+            game_dir = CK3GameUtils.get_game_dir(steam_path)
+            if not os.path.exists(game_dir):
+                if status_callback:
+                    status_callback("Game directory not found", is_error=True)
+                return None
+
+            version = CK3GameUtils.get_latest_ck3_version(steam_path)['version_numbers']
+
+            index = GameFileIndex(game_dir)
+            index.scan(max_workers=ConfigManager.get_config_value('scan_workers'))
+
+            previous = GameManifest.load(version) or GameManifest.load_latest(exclude=version)
+            manifest = GameManifest.build(
+                game_dir, 
+                version, 
+                index.get_files(), 
+                previous=previous, 
+                max_workers=max_workers, 
+                status_callback=status_callback
+            )
+            manifest_path = GameManifest.save(manifest)
+
+            stats = manifest['stats']
+            logging.info(
+                f"Manifest for {version}: {stats['hashed']} hashed, {stats['reused']} reused "
+                f"in {stats['elapsed']:.2f}s"
+            )
+            if status_callback:
+                status_callback(f"Hashed {stats['total_files']} game files for {version}. Manifest saved to {manifest_path}")
+
+            return manifest
+
+        except Exception as e:
+            logging.error(f"Error building game file manifest: {e}")
+            traceback.print_exc()
+
+            if status_callback:
+                status_callback(f"Error building game file manifest: {e}", is_error=True)
+
+            return None
+
+    @staticmethod
+    def parse_game_scripts(steam_path, status_callback=None, cancel_token=None, max_workers=None,
+                           shard_kb=None, use_cache=True):
+        """
+        Parse every script file in the game directory on a process pool.
+        
+        Results are yielded as worker shards complete; files whose size and
+        mtime are unchanged are served from the on-disk AST cache.
+        
+        Args:
+            steam_path (str): Path to the Steam installation directory
+            status_callback (callable, optional): Callback to update status label
+            cancel_token (threading.Event, optional): Stops the run once set
+            max_workers (int, optional): Parser processes. Defaults to the 'parse_workers' config value
+            shard_kb (int, optional): Target KiB per worker task. Defaults to the 'parse_shard_kb' config value
+            use_cache (bool, optional): Use the AST cache. Defaults to True.
+        
+        Yields:
+            tuple: (relative path, nodes, errors); nodes is None for unreadable files
+        
+        Returns:
+            dict: The run report (see BulkScriptParser.iter_parse), as the generator's return value
+        """
+        from src.core.bulk_parser import BulkScriptParser
+        from src.core.ast_cache import ASTCache
+        game_dir = CK3GameUtils.get_game_dir(steam_path)
+        if not os.path.exists(game_dir):
+            if status_callback:
+                status_callback("Game directory not found", is_error=True)
+            return {}
+
+        if max_workers is None:
+            max_workers = ConfigManager.get_config_value('parse_workers')
+        if shard_kb is None:
+            shard_kb = ConfigManager.get_config_value('parse_shard_kb', 2048)
+
+        index = GameFileIndex(game_dir)
+        index.scan(max_workers=ConfigManager.get_config_value('scan_workers'))
+
+        parser = BulkScriptParser(
+            game_dir,
+            max_workers=max_workers,
+            shard_bytes=shard_kb * 1024,
+            cache=ASTCache() if use_cache else None
+        )
+        yield from parser.iter_parse(
+            parser.select_scripts(index.get_files()),
+            status_callback=status_callback,
+            cancel_token=cancel_token
+        )
+
+        report = parser.report
+        logging.info(
+            f"Parsed game scripts: {report['parsed']} parsed, {report['cached']} cached, "
+            f"{len(report['failed'])} failed, {len(report['syntax_errors'])} with syntax errors "
+            f"in {report['elapsed']:.2f}s"
+        )
+        if status_callback:
+            if report['cancelled']:
+                status_callback("Script parsing cancelled", is_error=True)
+            else:
+                status_callback(f"Parsed {report['parsed'] + report['cached']} script files "
+                                f"({len(report['failed'])} failed)")
+        return report
+
+    @staticmethod
+    def get_mod_roots(steam_path):
+        """
+        Find the root folders of installed mods.
+        
+        Uses the ModRegistry of local mods in the Paradox documents mod folder
+        and Steam Workshop subscriptions; only folders with a descriptor.mod count.
+        
+        Args:
+            steam_path (str): Path to the Steam installation directory
+        
+        Returns:
+            dict: Source name ('mod:<folder>' or 'workshop:<id>') -> mod root directory
+        """
+        from src.core.mod_registry import ModRegistry
+        registry = ModRegistry(steam_path=steam_path)
+        registry.refresh()
+        roots = {}
+        for mod in registry.mods():
+            if os.path.exists(os.path.join(mod['path'], 'descriptor.mod')):
+                prefix = 'workshop' if mod['source'] == 'workshop' else 'mod'
+                roots[f"{prefix}:{os.path.basename(mod['path'])}"] = mod['path']
+        return roots
+
+    @staticmethod
+    def build_symbol_index(steam_path, status_callback=None, max_workers=None):
+        """
+        Update the symbol index of the game and all installed mods.
+        
+        Only files whose size or mtime changed since the last build are parsed.
+        
+        Args:
+            steam_path (str): Path to the Steam installation directory
+            status_callback (callable, optional): Callback to update status label
+            max_workers (int, optional): Parser processes. Defaults to the 'parse_workers' config value
+        
+        Returns:
+            SymbolIndex: The updated index, or None if it could not be built
+        """
+        from src.core.symbol_index import SymbolIndex
+        from src.core.ast_cache import ASTCache
+        try:
+            roots = {}
+            game_dir = CK3GameUtils.get_game_dir(steam_path)
+            if os.path.exists(game_dir):
+                roots['vanilla'] = game_dir
+            roots.update(CK3GameUtils.get_mod_roots(steam_path))
+
+            if max_workers is None:
+                max_workers = ConfigManager.get_config_value('parse_workers')
+
+            index = SymbolIndex()
+            index.load()
+            cache = ASTCache()
+            index.build(roots, cache=cache, max_workers=max_workers, status_callback=status_callback)
+            cache.save()
+
+            # Load the shared copy now so the first validation doesn't pay for it
+            SymbolIndex.get_shared()
+
+            if status_callback:
+                status_callback(f"Indexed {index.count()} symbols from {len(roots)} sources")
+            return index
+
+        except Exception as e:
+            logging.error(f"Error building symbol index: {e}")
+            traceback.print_exc()
+
+            if status_callback:
+                status_callback(f"Error building symbol index: {e}", is_error=True)
+            return None
+
+    @staticmethod
+    def check_localization(steam_path, mod_folder_path=None, status_callback=None, max_workers=None):
+        """
+        Index the localization of the game and, optionally, one mod and report
+        missing and duplicated keys.
+        
+        Only .yml files whose size or mtime changed since the last run are parsed.
+        
+        Args:
+            steam_path (str): Path to the Steam installation directory
+            mod_folder_path (str, optional): Mod whose keys are checked. Defaults to checking vanilla.
+            status_callback (callable, optional): Callback to update status label
+            max_workers (int, optional): Parser processes. Defaults to the 'parse_workers' config value
+        
+        Returns:
+            dict: language -> {'missing', 'duplicates'} (see LocalizationIndex.check),
+                or None if the check failed
+        """
+        from src.core.localization_index import LocalizationIndex
+        try:
+            roots = {}
+            game_dir = CK3GameUtils.get_game_dir(steam_path)
+            if os.path.exists(game_dir):
+                roots['vanilla'] = game_dir
+            checked = 'vanilla'
+            if mod_folder_path:
+                checked = f'mod:{os.path.basename(os.path.normpath(mod_folder_path))}'
+                roots[checked] = mod_folder_path
+
+            if max_workers is None:
+                max_workers = ConfigManager.get_config_value('parse_workers')
+
+            index = LocalizationIndex()
+            index.load()
+            # Keep other mods indexed for their next check; only forget deleted ones
+            index.prune()
+            index.build(roots, max_workers=max_workers, status_callback=status_callback)
+            report = index.check(sources=[checked], context=roots)
+
+            if status_callback:
+                missing = sum(len(result['missing']) for result in report.values())
+                duplicates = sum(len(result['duplicates']) for result in report.values())
+                status_callback(f"Localization of {checked}: {missing} missing and {duplicates} duplicated keys "
+                                f"across {len(report)} languages")
+            return report
+
+        except Exception as e:
+            logging.error(f"Error checking localization: {e}")
+            traceback.print_exc()
+
+            if status_callback:
+                status_callback(f"Error checking localization: {e}", is_error=True)
+            return None
+
+    @staticmethod
+    def analyze_mod_overrides(steam_path, mod_folder_path, status_callback=None, max_workers=None):
+        """
+        Report which vanilla files and script objects a mod overrides.
+        
+        Args:
+            steam_path (str): Path to the Steam installation directory
+            mod_folder_path (str): Mod folder, e.g. from ModCreator.create_mod_structure
+            status_callback (callable, optional): Callback to update status label
+            max_workers (int, optional): Parser processes. Defaults to the 'parse_workers' config value
+        
+        Returns:
+            dict: Analysis result (see ModOverrideAnalyzer.analyze), or None if it failed
+        """
+        from src.core.mod_analyzer import ModOverrideAnalyzer
+        try:
+            game_dir = CK3GameUtils.get_game_dir(steam_path)
+            if not os.path.exists(game_dir):
+                if status_callback:
+                    status_callback("Game directory not found", is_error=True)
+                return None
+
+            if max_workers is None:
+                max_workers = ConfigManager.get_config_value('parse_workers')
+
+            analyzer = ModOverrideAnalyzer(game_dir, max_workers=max_workers)
+            result = analyzer.analyze(mod_folder_path, status_callback=status_callback)
+
+            if status_callback:
+                status_callback(f"{len(result['overridden_files'])} vanilla files overridden, "
+                                f"{len(result['redefined_objects'])} objects redefined")
+            return result
+
+        except Exception as e:
+            logging.error(f"Error analyzing mod overrides: {e}")
+            traceback.print_exc()
+
+            if status_callback:
+                status_callback(f"Error analyzing mod overrides: {e}", is_error=True)
+            return None
+
+    @staticmethod
+    def analyze_load_order(steam_path, load_order=None, analyzer=None, status_callback=None, max_workers=None):
+        """
+        Report file and object conflicts between installed mods for a load order.
+        
+        Pass the returned analyzer back in to try other load orders without
+        indexing the mods again.
+        
+        Args:
+            steam_path (str): Path to the Steam installation directory
+            load_order (list, optional): Source names (see get_mod_roots), first loaded first.
+                Defaults to every installed mod in name order.
+            analyzer (LoadOrderAnalyzer, optional): Analyzer from a previous call
+            status_callback (callable, optional): Callback to update status label
+            max_workers (int, optional): Parser processes. Defaults to the 'parse_workers' config value
+        
+        Returns:
+            tuple: (conflict report (see LoadOrderAnalyzer.analyze), analyzer),
+                or (None, None) if the analysis failed
+        """
+        from src.core.mod_analyzer import LoadOrderAnalyzer
+        try:
+            if analyzer is None:
+                if max_workers is None:
+                    max_workers = ConfigManager.get_config_value('parse_workers')
+                analyzer = LoadOrderAnalyzer(max_workers=max_workers)
+                analyzer.index_mods(CK3GameUtils.get_mod_roots(steam_path), status_callback=status_callback)
+
+            if load_order is None:
+                load_order = sorted(analyzer.roots)
+            report = analyzer.analyze(load_order)
+
+            if status_callback:
+                status_callback(f"{len(report['file_conflicts'])} file and {len(report['object_conflicts'])} "
+                                f"object conflicts across {len(load_order)} mods")
+            return report, analyzer
+
+        except Exception as e:
+            logging.error(f"Error analyzing load order: {e}")
+            traceback.print_exc()
+
+            if status_callback:
+                status_callback(f"Error analyzing load order: {e}", is_error=True)
+            return None, None
+
+    @staticmethod
+    def scan_workshop(steam_path, full_rescan=False, status_callback=None, max_workers=None):
+        """
+        Count, size and fingerprint subscribed Steam Workshop mods.
+        
+        Only items that Steam updated (or whose folder changed) since the last
+        scan are walked again.
+        
+        Args:
+            steam_path (str): Path to the Steam installation directory
+            full_rescan (bool, optional): Walk every item again
+            status_callback (callable, optional): Callback to update status label
+            max_workers (int, optional): Scanner threads. Defaults to the 'scan_workers' config value
+        
+        Returns:
+            dict: Item ID -> {'files', 'bytes', 'mtime', 'fingerprint'}, or None if the scan failed
+        """
+        from src.core.workshop_scanner import WorkshopScanner
+        try:
+            if max_workers is None:
+                max_workers = ConfigManager.get_config_value('scan_workers')
+            scanner = WorkshopScanner(steam_path, max_workers=max_workers)
+            scan = scanner.scan(full=full_rescan, status_callback=status_callback)
+            logging.info(
+                f"Workshop scan: {scan['items']} items, {scan['scanned']} scanned, "
+                f"{scan['reused']} reused, {scan['removed']} removed in {scan['elapsed']:.3f}s"
+            )
+
+            items = scanner.get_items()
+            if status_callback:
+                total_mb = sum(item['bytes'] for item in items.values()) / 1024 / 1024
+                status_callback(f"Found {len(items)} workshop mods ({total_mb:.1f} MiB)")
+            return items
+
+        except Exception as e:
+            logging.error(f"Error scanning workshop mods: {e}")
+            traceback.print_exc()
+
+            if status_callback:
+                status_callback(f"Error scanning workshop mods: {e}", is_error=True)
+            return None
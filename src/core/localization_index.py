@@ -0,0 +1,403 @@
+import os
+import re
+import json
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# `l_english:` header naming the file's language, usually after a UTF-8 BOM
+_HEADER_RE = re.compile(rb'^(?:\xef\xbb\xbf)?[ \t]*l_([A-Za-z_]+)[ \t]*:', re.MULTILINE)
+# ` key:0 "text"` or ` key: "text"`; comments and blank lines don't match
+_ENTRY_RE = re.compile(rb'^[ \t]+([^\s#:"]+):[0-9]*[ \t]*"', re.MULTILINE)
+
+LOCALIZATION_DIR = 'localization'
+LOC_EXTENSION = '.yml'
+
+# (key, line) pairs parsed from one file
+LocEntries = List[Tuple[str, int]]
+
+
+def parse_loc_bytes(data: bytes) -> Tuple[Optional[str], LocEntries]:
+    """
+    Parse a localization file.
+
+    Only keys and their line numbers are extracted; the text is left alone.
+
+    Args:
+        data (bytes): File contents
+
+    Returns:
+        tuple: (language from the `l_<language>:` header or None, [(key, line)])
+    """
+    header = _HEADER_RE.search(data)
+    language = header.group(1).decode('ascii') if header else None
+
+    entries: LocEntries = []
+    line = 1
+    pos = 0
+    for match in _ENTRY_RE.finditer(data, header.end() if header else 0):
+        line += data.count(b'\n', pos, match.start())
+        pos = match.start()
+        entries.append((match.group(1).decode('utf-8', 'replace'), line))
+    return language, entries
+
+
+def _parse_loc_files(root: str, rel_paths: List[str]) -> List[Tuple[str, Optional[str], Any]]:
+    """
+    Parse a batch of localization files in a worker process.
+
+    Module-level so it can be pickled into worker processes.
+
+    Args:
+        root (str): Game or mod root directory
+        rel_paths (list): Relative paths ('/' separated)
+
+    Returns:
+        list: (path, language, entries) per file; entries is an error message
+            string if the file could not be read
+    """
+    results = []
+    for rel_path in rel_paths:
+        try:
+            with open(os.path.join(root, *rel_path.split('/')), 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            results.append((rel_path, None, str(e)))
+            continue
+        language, entries = parse_loc_bytes(data)
+        results.append((rel_path, language, entries))
+    return results
+
+
+class LocalizationIndex:
+    """
+    Index of localization keys of the game and mods.
+
+    Maps every key to the (language, source, file, line) places defining it.
+    Sources are tracked per file by size and mtime, so updates only re-parse
+    changed .yml files; large updates are parsed with one task per language
+    folder on a process pool.
+    """
+    INDEX_VERSION = 1
+
+    # Below this many changed files the process pool start-up costs more than it saves
+    PARALLEL_THRESHOLD = 32
+
+    def __init__(self, index_path: Optional[str] = None):
+        """
+        Args:
+            index_path (str, optional): Index file. Defaults to src/data/localization_index.json
+        """
+        if index_path is None:
+            index_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'localization_index.json')
+        self.index_path = index_path
+        # source -> {'root': str, 'files': {rel_path: [size, mtime_ns, language, [[key, line], ...]]}}
+        self._sources: Dict[str, Dict] = {}
+        # language -> key -> [(source, rel_path, line)]
+        self._keys: Dict[str, Dict[str, List[Tuple[str, str, int]]]] = {}
+
+    def load(self) -> bool:
+        """
+        Load the index from disk.
+
+        Returns:
+            bool: True if a compatible index was loaded
+        """
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+        if data.get('version') != self.INDEX_VERSION:
+            return False
+        self._sources = data.get('sources', {})
+        self._keys = {}
+        for source, info in self._sources.items():
+            for rel_path, (_, _, language, entries) in info['files'].items():
+                self._add_entries(source, rel_path, language, entries)
+        return True
+
+    def save(self):
+        """
+        Persist the index atomically.
+        """
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.INDEX_VERSION, 'sources': self._sources}, f, separators=(',', ':'))
+        os.replace(tmp_path, self.index_path)
+
+    def _add_entries(self, source: str, rel_path: str, language: Optional[str], entries: Iterable):
+        if language is None:
+            return
+        keys = self._keys.setdefault(language, {})
+        for key, line in entries:
+            keys.setdefault(key, []).append((source, rel_path, line))
+
+    def _remove_file(self, source: str, rel_path: str):
+        record = self._sources[source]['files'].pop(rel_path, None)
+        if record is None or record[2] is None:
+            return
+        keys = self._keys.get(record[2], {})
+        for key, _ in record[3]:
+            locations = keys.get(key)
+            if locations is None:
+                continue
+            locations[:] = [loc for loc in locations if loc[0] != source or loc[1] != rel_path]
+            if not locations:
+                del keys[key]
+
+    def _set_file(self, source: str, rel_path: str, size: int, mtime: int,
+                  language: Optional[str], entries: LocEntries):
+        self._remove_file(source, rel_path)
+        self._sources[source]['files'][rel_path] = [size, mtime, language, [list(entry) for entry in entries]]
+        self._add_entries(source, rel_path, language, entries)
+
+    @staticmethod
+    def _stat_loc_files(root: str) -> Dict[str, List[int]]:
+        files = {}
+        for dirpath, _, filenames in os.walk(os.path.join(root, LOCALIZATION_DIR)):
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, '/')
+            for name in filenames:
+                if not name.endswith(LOC_EXTENSION):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                files[f'{rel_dir}/{name}'] = [stat.st_size, stat.st_mtime_ns]
+        return files
+
+    def _parse(self, root: str, changed: Dict[str, int], max_workers: Optional[int]):
+        """
+        Yield (path, language, entries) for changed files, one task per language folder.
+        """
+        if max_workers == 1 or len(changed) < self.PARALLEL_THRESHOLD:
+            yield from _parse_loc_files(root, list(changed))
+            return
+
+        # localization/<language>/...; files directly in localization/ form their own group
+        groups: Dict[str, List[str]] = {}
+        group_bytes: Dict[str, int] = {}
+        for rel_path, size in changed.items():
+            parts = rel_path.split('/')
+            group = parts[1] if len(parts) > 2 else ''
+            groups.setdefault(group, []).append(rel_path)
+            group_bytes[group] = group_bytes.get(group, 0) + size
+
+        workers = min(max_workers or os.cpu_count() or 1, len(groups))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Biggest languages first so they don't straggle
+            futures = [
+                executor.submit(_parse_loc_files, root, groups[group])
+                for group in sorted(groups, key=lambda g: -group_bytes[g])
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def update_source(self, source: str, root: str, max_workers: Optional[int] = None) -> Dict[str, int]:
+        """
+        Bring one source (the game or a mod) up to date.
+
+        Args:
+            source (str): Source name, e.g. 'vanilla' or 'mod:My Mod'
+            root (str): Game or mod root directory
+            max_workers (int, optional): Parser processes. Defaults to the CPU count.
+
+        Returns:
+            dict: 'parsed', 'removed', 'unchanged' and 'failed' file counts
+        """
+        root = os.path.normpath(root)
+        info = self._sources.get(source)
+        if info is None or info['root'] != root:
+            if info is not None:
+                self.remove_source(source)
+            info = self._sources[source] = {'root': root, 'files': {}}
+
+        files = self._stat_loc_files(root)
+        removed = [rel_path for rel_path in info['files'] if rel_path not in files]
+        for rel_path in removed:
+            self._remove_file(source, rel_path)
+
+        changed = {}
+        for rel_path, (size, mtime) in files.items():
+            record = info['files'].get(rel_path)
+            if record is None or record[0] != size or record[1] != mtime:
+                changed[rel_path] = size
+
+        failed = 0
+        for rel_path, language, entries in self._parse(root, changed, max_workers):
+            if isinstance(entries, str):
+                logging.warning(f"Could not read {rel_path}: {entries}")
+                self._remove_file(source, rel_path)
+                failed += 1
+                continue
+            size, mtime = files[rel_path]
+            self._set_file(source, rel_path, size, mtime, language, entries)
+
+        return {
+            'parsed': len(changed) - failed,
+            'removed': len(removed),
+            'unchanged': len(files) - len(changed),
+            'failed': failed
+        }
+
+    def update_file(self, source: str, rel_path: str):
+        """
+        Re-index a single .yml file of a known source, e.g. after it was edited.
+
+        Args:
+            source (str): Source name
+            rel_path (str): Path relative to the source root, '/' separated
+        """
+        root = self._sources[source]['root']
+        try:
+            stat = os.stat(os.path.join(root, *rel_path.split('/')))
+        except OSError:
+            self._remove_file(source, rel_path)
+            return
+        _, language, entries = _parse_loc_files(root, [rel_path])[0]
+        if isinstance(entries, str):
+            self._remove_file(source, rel_path)
+            return
+        self._set_file(source, rel_path, stat.st_size, stat.st_mtime_ns, language, entries)
+
+    def remove_source(self, source: str):
+        """
+        Drop a source and all its keys.
+
+        Args:
+            source (str): Source name
+        """
+        if source not in self._sources:
+            return
+        for rel_path in list(self._sources[source]['files']):
+            self._remove_file(source, rel_path)
+        del self._sources[source]
+
+    def prune(self, keep: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Drop sources whose root directory no longer exists and, if keep is
+        given, every source not in it.
+
+        Args:
+            keep (iterable, optional): Sources to keep if their root still exists
+
+        Returns:
+            list: Names of the dropped sources
+        """
+        keep = set(keep) if keep is not None else None
+        dropped = [
+            source for source, info in self._sources.items()
+            if (keep is not None and source not in keep) or not os.path.isdir(info['root'])
+        ]
+        for source in dropped:
+            self.remove_source(source)
+        return dropped
+
+    def languages(self) -> List[str]:
+        """
+        Get the indexed languages.
+
+        Returns:
+            list: Sorted language names, e.g. ['english', 'french']
+        """
+        return sorted(language for language, keys in self._keys.items() if keys)
+
+    def lookup(self, key: str, language: Optional[str] = None) -> List[Tuple[str, str, str, int]]:
+        """
+        Find where a key is defined.
+
+        Args:
+            key (str): Localization key
+            language (str, optional): Only search this language
+
+        Returns:
+            list: (language, source, relative path, line) tuples
+        """
+        languages = [language] if language is not None else self.languages()
+        return [
+            (lang, source, rel_path, line)
+            for lang in languages
+            for source, rel_path, line in self._keys.get(lang, {}).get(key, ())
+        ]
+
+    def check(self, sources: Optional[Iterable[str]] = None,
+              languages: Optional[Iterable[str]] = None,
+              context: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Report missing and duplicated keys per language.
+
+        A key is missing from a language if the selected sources define it in
+        some language but no context source defines it in this one. A key is
+        duplicated if one source defines it more than once in a language.
+
+        Args:
+            sources (iterable, optional): Sources whose keys are checked, e.g.
+                ['mod:My Mod']. Defaults to all sources.
+            languages (iterable, optional): Languages to report. Defaults to all indexed languages.
+            context (iterable, optional): Sources whose definitions count as
+                present, e.g. ['vanilla', 'mod:My Mod'], so other indexed mods
+                don't hide missing keys. Defaults to all sources.
+
+        Returns:
+            dict: language -> {'missing': sorted keys, 'duplicates': {key: [(source, path, line)]}}
+        """
+        selected = set(sources) if sources is not None else set(self._sources)
+        languages = list(languages) if languages is not None else self.languages()
+        context = set(context) | selected if context is not None else None
+
+        reference = set()
+        for keys in self._keys.values():
+            for key, locations in keys.items():
+                if any(location[0] in selected for location in locations):
+                    reference.add(key)
+
+        report = {}
+        for language in languages:
+            keys = self._keys.get(language, {})
+            duplicates = {}
+            for key, locations in keys.items():
+                if len(locations) < 2:
+                    continue
+                mine = [location for location in locations if location[0] in selected]
+                if len({location[0] for location in mine}) < len(mine):
+                    duplicates[key] = sorted(mine)
+            present = keys
+            if context is not None:
+                present = {key for key in reference.intersection(keys)
+                           if any(location[0] in context for location in keys[key])}
+            report[language] = {
+                'missing': sorted(reference.difference(present)),
+                'duplicates': duplicates
+            }
+        return report
+
+    def build(self, roots: Dict[str, str], max_workers: Optional[int] = None,
+              status_callback=None) -> Dict[str, Dict[str, int]]:
+        """
+        Update every given source and save.
+
+        Sources indexed earlier but not given here are kept, so checking one
+        mod doesn't throw away the index of another; see prune.
+
+        Args:
+            roots (dict): Source name -> root directory
+            max_workers (int, optional): Parser processes
+            status_callback (callable, optional): Callback for progress updates
+
+        Returns:
+            dict: Source name -> update_source() result
+        """
+        start = time.perf_counter()
+        results = {}
+        for source, root in roots.items():
+            if status_callback:
+                status_callback(f"Indexing localization of {source}...")
+            results[source] = self.update_source(source, root, max_workers=max_workers)
+        self.save()
+        parsed = sum(result['parsed'] for result in results.values())
+        logging.info(f"Localization index: {len(self.languages())} languages, "
+                     f"{parsed} files parsed in {time.perf_counter() - start:.2f}s")
+        return results
@@ -0,0 +1,262 @@
+import os
+import time
+import logging
+from typing import Any, Dict, List, Optional
+
+from src.core.ast_cache import ASTCache
+from src.core.game_index import GameFileIndex
+from src.core.symbol_index import SymbolIndex, EVENT, OBJECT_PREFIX
+
+# Mod metadata that never overrides game files
+IGNORED_FILES = frozenset(('descriptor.mod', 'thumbnail.png'))
+
+
+def _object_scope(kind: str) -> Optional[str]:
+    """
+    Get the override scope of a symbol kind: the common/ folder for objects,
+    'events' for events, None for kinds that don't override anything.
+    """
+    if kind.startswith(OBJECT_PREFIX):
+        return kind[len(OBJECT_PREFIX):]
+    if kind == EVENT:
+        return 'events'
+    return None
+
+
+class ModOverrideAnalyzer:
+    """
+    Finds what a mod overrides in the vanilla game.
+
+    File-level overrides are mod files with the same relative path as a game
+    file, found with the persistent GameFileIndex. Block-level redefinitions
+    are top-level objects (and events) the mod defines under a key the game
+    already uses in the same folder, found with the SymbolIndex. Both indexes
+    are only refreshed for files whose size or mtime changed, so repeat runs
+    don't re-parse the game.
+    """
+
+    def __init__(self, game_dir: str, symbol_index: Optional[SymbolIndex] = None,
+                 cache: Optional[ASTCache] = None, max_workers: Optional[int] = None):
+        """
+        Args:
+            game_dir (str): Path to the game directory
+            symbol_index (SymbolIndex, optional): Index to use. Defaults to the saved one.
+            cache (ASTCache, optional): Parse cache. Defaults to the shared on-disk cache.
+            max_workers (int, optional): Parser processes for large updates
+        """
+        self.game_dir = game_dir
+        if symbol_index is None:
+            symbol_index = SymbolIndex()
+            symbol_index.load()
+        self.symbol_index = symbol_index
+        self.cache = cache if cache is not None else ASTCache()
+        self.max_workers = max_workers
+        self._vanilla_files: Optional[frozenset] = None
+
+    def refresh_vanilla(self, status_callback=None):
+        """
+        Bring the vanilla file list and symbols up to date.
+
+        Args:
+            status_callback (callable, optional): Callback for progress updates
+        """
+        file_index = GameFileIndex(self.game_dir)
+        file_index.scan()
+        self._vanilla_files = frozenset(file_index.list_files())
+        self.symbol_index.update_source('vanilla', self.game_dir, cache=self.cache,
+                                        max_workers=self.max_workers, status_callback=status_callback)
+
+    @staticmethod
+    def list_mod_files(mod_dir: str) -> List[str]:
+        """
+        List the files of a mod.
+
+        Args:
+            mod_dir (str): Mod root directory
+
+        Returns:
+            list: Sorted relative paths with '/' separators, excluding mod metadata
+        """
+        files = []
+        for dirpath, _, filenames in os.walk(mod_dir):
+            rel_dir = os.path.relpath(dirpath, mod_dir).replace(os.sep, '/')
+            for name in filenames:
+                rel_path = name if rel_dir == '.' else f'{rel_dir}/{name}'
+                if rel_path not in IGNORED_FILES:
+                    files.append(rel_path)
+        return sorted(files)
+
+    def analyze(self, mod_dir: str, source: Optional[str] = None, status_callback=None) -> Dict[str, Any]:
+        """
+        Compare a mod with the vanilla game.
+
+        Args:
+            mod_dir (str): Mod root directory, e.g. from ModCreator.create_mod_structure
+            source (str, optional): Symbol index source name. Defaults to 'mod:<folder name>'.
+            status_callback (callable, optional): Callback for progress updates
+
+        Returns:
+            dict: 'mod_dir', 'files' (count), 'overridden_files' (sorted paths),
+                'redefined_objects' (list of dicts with 'scope', 'name', 'mod_file'
+                and 'vanilla_files') and 'elapsed'
+        """
+        start = time.perf_counter()
+        if self._vanilla_files is None:
+            self.refresh_vanilla(status_callback)
+        source = source or f'mod:{os.path.basename(os.path.normpath(mod_dir))}'
+
+        mod_files = self.list_mod_files(mod_dir)
+        overridden = [path for path in mod_files if path in self._vanilla_files]
+        overridden_set = frozenset(overridden)
+
+        self.symbol_index.update_source(source, mod_dir, cache=self.cache, max_workers=self.max_workers)
+        redefined = []
+        for rel_path, kind, name in self.symbol_index.iter_symbols(source):
+            scope = _object_scope(kind)
+            if scope is None:
+                continue
+            # Objects of a vanilla file the mod replaces wholesale are covered by the file override
+            vanilla_files = [
+                path for location_source, path in self.symbol_index.lookup(kind, name)
+                if location_source == 'vanilla' and path not in overridden_set
+            ]
+            if vanilla_files:
+                redefined.append({'scope': scope, 'name': name, 'mod_file': rel_path, 'vanilla_files': vanilla_files})
+        redefined.sort(key=lambda item: (item['scope'], item['name']))
+
+        self.symbol_index.save()
+        self.cache.save()
+        elapsed = time.perf_counter() - start
+        logging.info(f"Override analysis of {source}: {len(overridden)} files overridden, "
+                     f"{len(redefined)} objects redefined in {elapsed:.2f}s")
+        return {
+            'mod_dir': mod_dir,
+            'files': len(mod_files),
+            'overridden_files': overridden,
+            'redefined_objects': redefined,
+            'elapsed': elapsed
+        }
+
+
+class LoadOrderAnalyzer:
+    """
+    Finds conflicts between installed mods for any load order.
+
+    Every mod's file list and script objects are indexed once by index_mods();
+    the owners of each path and object are inverted into tables that only
+    keep entries claimed by more than one mod. analyze() then just orders
+    those small owner lists, so trying another load order costs nothing like
+    a rescan. Later mods in the load order win.
+    """
+
+    def __init__(self, symbol_index: Optional[SymbolIndex] = None,
+                 cache: Optional[ASTCache] = None, max_workers: Optional[int] = None):
+        """
+        Args:
+            symbol_index (SymbolIndex, optional): Index to use. Defaults to the saved one.
+            cache (ASTCache, optional): Parse cache. Defaults to the shared on-disk cache.
+            max_workers (int, optional): Parser processes for large updates
+        """
+        if symbol_index is None:
+            symbol_index = SymbolIndex()
+            symbol_index.load()
+        self.symbol_index = symbol_index
+        self.cache = cache if cache is not None else ASTCache()
+        self.max_workers = max_workers
+        self.roots: Dict[str, str] = {}
+        # path -> sources shipping it, only for paths shipped by several mods
+        self._file_owners: Dict[str, List[str]] = {}
+        # (scope, name) -> [(source, path)], only for objects defined by several mods
+        self._object_owners: Dict[tuple, List[tuple]] = {}
+
+    def index_mods(self, roots: Dict[str, str], status_callback=None) -> Dict[str, Any]:
+        """
+        Index the files and objects of every mod.
+
+        Args:
+            roots (dict): Source name -> mod root directory, e.g. from CK3GameUtils.get_mod_roots
+            status_callback (callable, optional): Callback for progress updates
+
+        Returns:
+            dict: 'mods', 'files', 'parsed' (script files re-parsed) and 'elapsed'
+        """
+        start = time.perf_counter()
+        self.roots = dict(roots)
+        file_owners: Dict[str, List[str]] = {}
+        object_owners: Dict[tuple, List[tuple]] = {}
+        files = 0
+        parsed = 0
+
+        for number, (source, root) in enumerate(sorted(self.roots.items()), 1):
+            if status_callback:
+                status_callback(f"Indexing mod {number}/{len(self.roots)}: {source}")
+            for path in ModOverrideAnalyzer.list_mod_files(root):
+                file_owners.setdefault(path, []).append(source)
+                files += 1
+            result = self.symbol_index.update_source(source, root, cache=self.cache, max_workers=self.max_workers)
+            parsed += result['parsed']
+            for rel_path, kind, name in self.symbol_index.iter_symbols(source):
+                scope = _object_scope(kind)
+                if scope is not None:
+                    object_owners.setdefault((scope, name), []).append((source, rel_path))
+
+        self._file_owners = {path: owners for path, owners in file_owners.items() if len(owners) > 1}
+        self._object_owners = {
+            key: owners for key, owners in object_owners.items()
+            if len({source for source, _ in owners}) > 1
+        }
+        self.symbol_index.save()
+        self.cache.save()
+        return {'mods': len(self.roots), 'files': files, 'parsed': parsed, 'elapsed': time.perf_counter() - start}
+
+    def analyze(self, load_order: List[str]) -> Dict[str, Any]:
+        """
+        Report conflicts for a load order.
+
+        Mods missing from the load order are treated as disabled.
+
+        Args:
+            load_order (list): Source names, first loaded first
+
+        Returns:
+            dict: 'file_conflicts' (dicts with 'path', 'sources' in load order and
+                'winner'), 'object_conflicts' (dicts with 'scope', 'name',
+                'definitions' as (source, path) in load order and 'winner') and 'elapsed'
+        """
+        start = time.perf_counter()
+        position = {source: i for i, source in enumerate(load_order)}
+
+        file_conflicts = []
+        for path, owners in self._file_owners.items():
+            enabled = sorted((source for source in owners if source in position), key=position.__getitem__)
+            if len(enabled) > 1:
+                file_conflicts.append({'path': path, 'sources': enabled, 'winner': enabled[-1]})
+
+        object_conflicts = []
+        for (scope, name), owners in self._object_owners.items():
+            enabled = sorted(
+                (owner for owner in owners if owner[0] in position),
+                key=lambda owner: position[owner[0]]
+            )
+            if len({source for source, _ in enabled}) < 2:
+                continue
+            # A definition in a file that a later mod replaces wholesale never loads
+            winners = [owner for owner in enabled if self._file_winner(owner[1], position) in (None, owner[0])]
+            if len({source for source, _ in winners}) < 2:
+                continue
+            object_conflicts.append({'scope': scope, 'name': name, 'definitions': winners, 'winner': winners[-1][0]})
+
+        file_conflicts.sort(key=lambda item: item['path'])
+        object_conflicts.sort(key=lambda item: (item['scope'], item['name']))
+        return {
+            'file_conflicts': file_conflicts,
+            'object_conflicts': object_conflicts,
+            'elapsed': time.perf_counter() - start
+        }
+
+    def _file_winner(self, path: str, position: Dict[str, int]) -> Optional[str]:
+        owners = self._file_owners.get(path)
+        if owners is None:
+            return None
+        enabled = [source for source in owners if source in position]
+        return max(enabled, key=position.__getitem__) if enabled else None
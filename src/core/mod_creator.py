@@ -1,7 +1,81 @@
 import os
+import time
+import errno
+import shutil
+import logging
 import platform
+import tempfile
+
+from src.core.config import ConfigManager
+from src.core.template_engine import TemplateEngine
+
+# Template copied into every new mod
+ESSENTIALS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'Mod', 'Essentials'
+)
+
+# create_mod builds mods in <mod folder>/.staging-XXXX before moving them into place
+STAGING_PREFIX = '.staging-'
+# Staging directories untouched for this long were left behind by a killed process
+STAGING_MAX_AGE = 3600
+
 
 class ModCreator:
+    @staticmethod
+    def get_mod_paths(mod_name, debug=False):
+        """
+        Get the paths create_mod_structure would write for a mod.
+        
+        Args:
+            mod_name (str): Full name of the mod
+            debug (bool, optional): Whether to use debug output path. Defaults to False.
+        
+        Returns:
+            dict: 'documents_path', 'mod_folder_path' and 'mod_file_path'
+        """
+        documents_path = _get_mod_documents_path(debug)
+        return {
+            'documents_path': documents_path,
+            'mod_folder_path': os.path.join(documents_path, mod_name),
+            'mod_file_path': os.path.join(documents_path, f"{mod_name}.mod")
+        }
+
+    @staticmethod
+    def clean_staging(debug=False, max_age=STAGING_MAX_AGE):
+        """
+        Remove staging directories left behind by create_mod runs that were killed.
+
+        Only directories older than max_age are removed, so mods another
+        process is creating right now are left alone.
+
+        Args:
+            debug (bool, optional): Whether to use debug output path. Defaults to False.
+            max_age (float, optional): Minimum age in seconds. Defaults to one hour.
+
+        Returns:
+            int: Number of staging directories removed
+        """
+        documents_path = _get_mod_documents_path(debug)
+        try:
+            entries = list(os.scandir(documents_path))
+        except OSError:
+            return 0
+        cutoff = time.time() - max_age
+        removed = 0
+        for entry in entries:
+            if not entry.name.startswith(STAGING_PREFIX):
+                continue
+            try:
+                if not entry.is_dir(follow_symlinks=False) or entry.stat(follow_symlinks=False).st_mtime > cutoff:
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed += 1
+        if removed:
+            logging.info(f"Removed {removed} leftover staging directories from {documents_path}")
+        return removed
+
     @staticmethod
     def create_mod_structure(mod_name, short_mod_name, selected_tags, supported_version, debug=False, status_callback=None):
         """
@@ -20,17 +94,18 @@ class ModCreator:
         """
         try:
             # Determine mod paths based on debug flag
-            documents_path = _get_mod_documents_path(debug)
+            paths = ModCreator.get_mod_paths(mod_name, debug)
+            documents_path = paths['documents_path']
 
             # Ensure the mod directory exists
             os.makedirs(documents_path, exist_ok=True)
 
             # Create mod folder
-            mod_folder_path = os.path.join(documents_path, mod_name)
+            mod_folder_path = paths['mod_folder_path']
             os.makedirs(mod_folder_path, exist_ok=True)
 
             # Create .mod file
-            mod_file_path = os.path.join(documents_path, f"{mod_name}.mod")
+            mod_file_path = paths['mod_file_path']
             mod_file_content = _generate_mod_file_content(
                 mod_name, selected_tags, supported_version, mod_folder_path
             )
@@ -73,9 +148,13 @@ class ModCreator:
             }
 
     @staticmethod
-    def copy_and_replace(src, dst, short_mod_name, mod_name, status_callback=None):
+    def copy_and_replace(src, dst, short_mod_name, mod_name, status_callback=None, link_mode=None):
         """
             Recursively copy files and replace placeholders.
+
+            Files are copied byte for byte apart from the placeholders, so
+            BOMs and line endings of the templates are kept. Files without
+            placeholders, such as .dds or .ogg assets, are never decoded.
             
             Args:
             src (str): Source directory path
@@ -83,51 +162,17 @@ class ModCreator:
             short_mod_name (str): Short mod name to replace placeholders
             mod_name (str): Full mod name to replace placeholders
             status_callback (callable, optional): Function to report status
+            link_mode (str, optional): 'copy', 'hardlink' or 'reflink' for files
+                without placeholders. Defaults to the 'template_link_mode' config value.
         
         Returns:
             dict: Result of the copy operation
         """
-        def _copy_and_replace_internal(src, dst, short_mod_name, mod_name):
-            """
-            Internal recursive function to copy and replace files.
-            
-            Args:
-                src (str): Source directory path
-                dst (str): Destination directory path
-                short_mod_name (str): Short mod name to replace placeholders
-                mod_name (str): Full mod name to replace placeholders
-            """
-            # Ensure destination directory exists
-            os.makedirs(dst, exist_ok=True)
-            
-            # Iterate through all items in source directory
-            for item in os.listdir(src):
-                s = os.path.join(src, item)
-                
-                # Replace placeholders in the destination path
-                replaced_item = (item.replace('your_mod_name_here', short_mod_name)
-                                .replace('your_long_mod_name_here', mod_name))
-                d = os.path.join(dst, replaced_item)
-                
-                if os.path.isdir(s):
-                    # Recursively copy subdirectories
-                    _copy_and_replace_internal(s, d, short_mod_name, mod_name)
-                else:
-                    # Copy and replace placeholders for files
-                    with open(s, 'r', encoding='utf-8') as source_file:
-                        content = source_file.read()
-                    
-                    # Replace placeholders in file content
-                    content = (content.replace('<your_mod_name_here>', short_mod_name)
-                                    .replace('<your_long_mod_name_here>', mod_name))
-                    
-                    # Write to destination
-                    with open(d, 'w', encoding='utf-8') as dest_file:
-                        dest_file.write(content)
-
         try:
-            # Perform the recursive copy
-            _copy_and_replace_internal(src, dst, short_mod_name, mod_name)
+            # Compiled once per template folder; later mods only render it
+            if link_mode is None:
+                link_mode = ConfigManager.get_config_value('template_link_mode', 'copy')
+            TemplateEngine.get(src).render(dst, short_mod_name, mod_name, link_mode)
             
             # Optional status callback (called only once)
             if status_callback:
@@ -148,6 +193,187 @@ class ModCreator:
                 'error': str(e)
             }
 
+    @staticmethod
+    def create_mod(mod_name, short_mod_name, selected_tags, supported_version, template_dir=ESSENTIALS_DIR,
+                   debug=False, status_callback=None, link_mode=None, sync=True):
+        """
+        Create a complete mod atomically.
+
+        The mod folder, descriptor.mod, the template files and the .mod file
+        are all built in a staging directory inside the Paradox mod folder, so
+        on the same filesystem. Once everything is written it is synced in one
+        batch and moved into place with two renames: the folder first, then
+        the .mod file the launcher looks for. Neither rename replaces a
+        folder or .mod file created in the meantime. A failure at any point removes the
+        staging directory and leaves no trace of the mod; directories left
+        by a killed process are removed later by clean_staging.
+
+        Args:
+            mod_name (str): Full name of the mod
+            short_mod_name (str): Short identifier for the mod
+            selected_tags (list): List of mod tags
+            supported_version (str): Game version supported by the mod
+            template_dir (str, optional): Template copied into the mod, or None. Defaults to Mod/Essentials.
+            debug (bool, optional): Whether to use debug output path. Defaults to False.
+            status_callback (callable, optional): Function to report status or errors
+            link_mode (str, optional): See copy_and_replace
+            sync (bool, optional): Flush the staged files to disk before the renames. Defaults to True.
+
+        Returns:
+            dict: Same keys as create_mod_structure, plus 'timings' with the seconds
+                spent in the 'stage', 'render', 'sync' and 'commit' phases
+        """
+        timings = {'stage': 0.0, 'render': 0.0, 'sync': 0.0, 'commit': 0.0}
+        staging_path = None
+        try:
+            start = time.perf_counter()
+            paths = ModCreator.get_mod_paths(mod_name, debug)
+            documents_path = paths['documents_path']
+            mod_folder_path = paths['mod_folder_path']
+            mod_file_path = paths['mod_file_path']
+            for path in (mod_folder_path, mod_file_path):
+                if os.path.lexists(path):
+                    raise FileExistsError(f"{path} already exists")
+
+            os.makedirs(documents_path, exist_ok=True)
+            staging_path = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=documents_path)
+            staged_folder = os.path.join(staging_path, 'mod')
+            staged_file = os.path.join(staging_path, 'mod.mod')
+            os.makedirs(staged_folder)
+            with open(os.path.join(staged_folder, 'descriptor.mod'), 'w', encoding='utf-8') as descriptor_file:
+                descriptor_file.write(_generate_descriptor_content(mod_name, selected_tags, supported_version))
+            # The .mod file points at the final folder, not the staged one
+            with open(staged_file, 'w', encoding='utf-8') as mod_file:
+                mod_file.write(_generate_mod_file_content(mod_name, selected_tags, supported_version, mod_folder_path))
+            timings['stage'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            if template_dir and os.path.isdir(template_dir):
+                if link_mode is None:
+                    link_mode = ConfigManager.get_config_value('template_link_mode', 'copy')
+                TemplateEngine.get(template_dir).render(staged_folder, short_mod_name, mod_name, link_mode)
+            timings['render'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            if sync:
+                _fsync_tree(staging_path)
+            timings['sync'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            _rename_dir_no_replace(staged_folder, mod_folder_path)
+            try:
+                _rename_no_replace(staged_file, mod_file_path)
+            except OSError:
+                os.rename(mod_folder_path, staged_folder)
+                raise
+            if sync:
+                # The mod is in place; failing to flush the renames doesn't undo it
+                try:
+                    _fsync_dir(documents_path)
+                except OSError as e:
+                    logging.warning(f"Could not sync {documents_path} after creating '{mod_name}': {e}")
+            timings['commit'] = time.perf_counter() - start
+
+            if status_callback:
+                status_callback(f"Mod '{mod_name}' created successfully in {mod_folder_path}")
+
+            return {
+                'success': True,
+                'documents_path': documents_path,
+                'mod_folder_path': mod_folder_path,
+                'mod_file_path': mod_file_path,
+                'descriptor_file_path': os.path.join(mod_folder_path, "descriptor.mod"),
+                'message': f"Mod '{mod_name}' created successfully",
+                'timings': timings
+            }
+
+        except Exception as e:
+            if status_callback:
+                status_callback(f"Error creating mod: {str(e)}", is_error=True)
+
+            return {
+                'success': False,
+                'error': str(e),
+                'timings': timings
+            }
+
+        finally:
+            if staging_path is not None:
+                shutil.rmtree(staging_path, ignore_errors=True)
+
+def _rename_no_replace(src, dst):
+    """
+    Move a file into place, failing with FileExistsError if dst appeared meanwhile.
+
+    os.rename silently replaces an existing file on POSIX; os.link refuses to,
+    atomically. Windows renames never replace.
+    """
+    if os.name == 'nt':
+        os.rename(src, dst)
+        return
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        raise
+    except OSError:
+        # Filesystem without hardlinks: the best we can do is check first
+        if os.path.lexists(dst):
+            raise FileExistsError(f"{dst} already exists")
+        os.rename(src, dst)
+        return
+    os.unlink(src)
+
+def _rename_dir_no_replace(src, dst):
+    """
+    Move a directory into place, failing with FileExistsError if dst appeared meanwhile.
+
+    os.rename replaces an empty directory on POSIX, so dst is reserved first
+    with os.mkdir, which fails if anything exists there; the rename then only
+    replaces that reservation, and fails if something was put inside it.
+    Windows renames never replace.
+    """
+    if os.name == 'nt':
+        os.rename(src, dst)
+        return
+    os.mkdir(dst)
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        try:
+            os.rmdir(dst)
+        except OSError:
+            pass  # no longer empty, it belongs to whoever filled it
+        if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+            raise FileExistsError(f"{dst} already exists") from e
+        raise
+
+def _fsync_dir(path):
+    """
+    Flush a directory's entries to disk; directories can't be opened for this on Windows.
+    """
+    if os.name == 'nt':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _fsync_tree(root):
+    """
+    Flush every file and directory below root to disk.
+    """
+    # Windows only flushes handles opened for writing
+    flags = os.O_RDWR if os.name == 'nt' else os.O_RDONLY
+    for dirpath, _, filenames in os.walk(root, topdown=False):
+        for name in filenames:
+            fd = os.open(os.path.join(dirpath, name), flags)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        _fsync_dir(dirpath)
+
 def _get_mod_documents_path(debug):
     """
     Determine the appropriate documents path for mod creation.
@@ -1,8 +1,82 @@
-import os
-import json
 import re
 import dataclasses
 from typing import List, Optional
+from src.core.name_blocklist import ShortNameBlocklist
+
+_SHORT_MOD_NAME_RE = re.compile(r'^[a-z0-9_]+$')
+
+
+def essentials_symbols(short_mod_name: str):
+    """
+    Get the symbols the Essentials template defines for a short mod name.
+
+    The symbol index module pulls in the whole parser stack, so it is only
+    imported here, when a collision check actually runs.
+
+    Returns:
+        list: (kind, name) pairs
+    """
+    from src.core.symbol_index import EVENT_NAMESPACE, EVENT, ON_ACTION, GLOBAL_VARIABLE
+    return [
+        (EVENT_NAMESPACE, f'{short_mod_name}_error_suppression'),
+        (EVENT, f'{short_mod_name}_error_suppression.0001'),
+        (ON_ACTION, f'on_{short_mod_name}_start'),
+        (GLOBAL_VARIABLE, f'{short_mod_name}_is_loaded'),
+    ]
+
+
+def validate_short_mod_name(short_mod_name: str):
+    """
+    Validate the format of a short mod name and check the blocklist.
+
+    Cheap enough to run on every keystroke: the blocklist is loaded once and
+    checked with a hash lookup. Symbol collisions are checked separately by
+    check_symbol_collisions.
+
+    Args:
+        short_mod_name (str): Short mod name to check
+
+    Raises:
+        ValueError: Describing the first problem found
+    """
+    if not short_mod_name:
+        raise ValueError("Short mod name cannot be empty")
+
+    if short_mod_name in ShortNameBlocklist.get():
+        raise ValueError(f"The short mod name '{short_mod_name}' is already in use and cannot be used")
+
+    # Check for valid characters (lowercase, numbers, underscores)
+    if not _SHORT_MOD_NAME_RE.match(short_mod_name):
+        raise ValueError("Short mod name must contain only lowercase letters, numbers, and underscores")
+
+    # Length constraints
+    if len(short_mod_name) < 3 or len(short_mod_name) > 30:
+        raise ValueError("Short mod name must be between 3 and 30 characters long")
+
+
+def check_symbol_collisions(short_mod_name: str, symbol_index):
+    """
+    Check that the identifiers the Essentials template would add don't
+    already exist in the game or another installed mod.
+
+    Args:
+        short_mod_name (str): Short mod name to check
+        symbol_index (SymbolIndex): Loaded index, or None to skip the check
+
+    Raises:
+        ValueError: Naming the first identifier that already exists
+    """
+    if symbol_index is None:
+        return
+    collisions = symbol_index.find_collisions(essentials_symbols(short_mod_name))
+    if collisions:
+        (kind, name), locations = next(iter(collisions.items()))
+        source, path = locations[0]
+        raise ValueError(
+            f"The short mod name '{short_mod_name}' would redefine the {kind.replace('_', ' ')} "
+            f"'{name}' already defined in {source} ({path})"
+        )
+
 
 @dataclasses.dataclass
 class ModCreationParams:
@@ -21,28 +95,9 @@ class ModCreationParams:
         # Validate mod name
         if not self.mod_name or len(self.mod_name) < 3:
             raise ValueError("Mod name must be at least 3 characters long")
-        
-        # Load blocked names from JSON
-        blocked_names_path = os.path.join(os.path.dirname(__file__), '../data/blocked_short_mod_names.json')
-        try:
-            with open(blocked_names_path, 'r') as file:
-                data = json.load(file)
-                BLOCKED_SHORT_MOD_NAMES = data['BLOCKED_SHORT_MOD_NAMES']
-        except (FileNotFoundError, json.JSONDecodeError, KeyError):
-            # Fallback to an empty list if file is not found or invalid
-            BLOCKED_SHORT_MOD_NAMES = []
-
-        # Comprehensive validation for short mod name
-        if not self.short_mod_name:
-            raise ValueError("Short mod name cannot be empty")
-
-        if self.short_mod_name.lower() in [name.lower() for name in BLOCKED_SHORT_MOD_NAMES]:
-            raise ValueError(f"The short mod name '{self.short_mod_name}' is already in use and cannot be used")
-
-        # Check for valid characters (lowercase, numbers, underscores)
-        if not re.match(r'^[a-z0-9_]+$', self.short_mod_name):
-            raise ValueError("Short mod name must contain only lowercase letters, numbers, and underscores")
-
-        # Length constraints
-        if len(self.short_mod_name) < 3 or len(self.short_mod_name) > 30:
-            raise ValueError("Short mod name must be between 3 and 30 characters long")
\ No newline at end of file
+
+        validate_short_mod_name(self.short_mod_name)
+
+        # Loads the saved symbol index on first use
+        from src.core.symbol_index import SymbolIndex
+        check_symbol_collisions(self.short_mod_name, SymbolIndex.get_shared())
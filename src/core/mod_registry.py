@@ -0,0 +1,303 @@
+import os
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from src.core.config import ConfigManager
+from src.core.mod_creator import _get_mod_documents_path
+from src.core.script_parser import parse_bytes
+
+# Steam app ID of Crusader Kings III; workshop items live under content/<app id>/<item id>
+CK3_APP_ID = '1158310'
+
+
+def parse_descriptor(data: bytes) -> Dict[str, Any]:
+    """
+    Parse a .mod or descriptor.mod file.
+
+    Args:
+        data (bytes): File contents
+
+    Returns:
+        dict: Descriptor fields; single values as str, blocks such as tags as lists of str
+    """
+    nodes, _ = parse_bytes(data)
+    info: Dict[str, Any] = {}
+    for key, _, value in nodes:
+        if key is None:
+            continue
+        if isinstance(value, str):
+            info[key] = value
+        else:
+            block = value[1] if isinstance(value, tuple) else value
+            info[key] = [item for item_key, _, item in block if item_key is None and isinstance(item, str)]
+    return info
+
+
+def parse_descriptor_file(path: str) -> Dict[str, Any]:
+    """
+    Parse a .mod or descriptor.mod file from disk.
+
+    Args:
+        path (str): Path to the descriptor
+
+    Returns:
+        dict: Descriptor fields (see parse_descriptor)
+    """
+    with open(path, 'rb') as f:
+        return parse_descriptor(f.read())
+
+
+def _path_key(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path))
+
+
+class ModRegistry:
+    """
+    Registry of installed mods, read from their descriptors.
+
+    Covers `.mod` files and mod folders in the Paradox documents mod folder
+    and Steam Workshop items under steamapps/workshop/content/1158310. Parsed
+    descriptors are persisted with their mtime and size; a refresh only
+    re-reads descriptors that changed, so it costs one stat per descriptor.
+    """
+    REGISTRY_VERSION = 1
+
+    _shared: Optional['ModRegistry'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, documents_path: Optional[str] = None, steam_path: Optional[str] = None,
+                 registry_path: Optional[str] = None):
+        """
+        Args:
+            documents_path (str, optional): Paradox mod folder. Defaults to the platform location.
+            steam_path (str, optional): Steam installation. Defaults to the configured one.
+            registry_path (str, optional): Cache file. Defaults to src/data/mod_registry.json
+        """
+        if documents_path is None:
+            try:
+                documents_path = _get_mod_documents_path(False)
+            except OSError:
+                documents_path = None
+        self.documents_path = documents_path
+        self.steam_path = steam_path
+        if registry_path is None:
+            registry_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'mod_registry.json')
+        self.registry_path = registry_path
+        # descriptor path -> {'mtime': int, 'size': int, 'source': str, 'info': dict}
+        self._descriptors: Dict[str, Dict[str, Any]] = {}
+        # Lookup tables rebuilt by refresh()
+        self._mods: List[Dict[str, Any]] = []
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        self._by_path: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @classmethod
+    def get_shared(cls) -> 'ModRegistry':
+        """
+        Get the process-wide registry, refreshed against the descriptors on disk.
+
+        Returns:
+            ModRegistry: The registry
+        """
+        with cls._shared_lock:
+            steam_path = ConfigManager.get_steam_path()
+            if cls._shared is None or cls._shared.steam_path != steam_path:
+                cls._shared = cls(steam_path=steam_path)
+            cls._shared.refresh()
+            return cls._shared
+
+    def _load(self):
+        try:
+            with open(self.registry_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') == self.REGISTRY_VERSION:
+            self._descriptors = data.get('descriptors', {})
+
+    def save(self):
+        """
+        Persist the parsed descriptors atomically.
+        """
+        os.makedirs(os.path.dirname(self.registry_path), exist_ok=True)
+        tmp_path = self.registry_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.REGISTRY_VERSION, 'descriptors': self._descriptors}, f, separators=(',', ':'))
+        os.replace(tmp_path, self.registry_path)
+
+    def _list_descriptors(self) -> Dict[str, str]:
+        """
+        Find every descriptor file.
+
+        Returns:
+            dict: Descriptor path -> source ('local' or 'workshop')
+        """
+        found = {}
+        if self.documents_path:
+            try:
+                with os.scandir(self.documents_path) as it:
+                    for entry in it:
+                        if entry.name.endswith('.mod') and entry.is_file():
+                            found[entry.path] = 'local'
+                        elif entry.is_dir():
+                            found[os.path.join(entry.path, 'descriptor.mod')] = 'local'
+            except OSError:
+                pass
+        if self.steam_path:
+            workshop_dir = os.path.join(self.steam_path, 'steamapps', 'workshop', 'content', CK3_APP_ID)
+            try:
+                with os.scandir(workshop_dir) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            found[os.path.join(entry.path, 'descriptor.mod')] = 'workshop'
+            except OSError:
+                pass
+        return found
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Re-read descriptors that were added or changed since the last refresh.
+
+        Returns:
+            dict: 'parsed', 'removed' and 'unchanged' descriptor counts
+        """
+        parsed = unchanged = 0
+        descriptors = {}
+        for path, source in self._list_descriptors().items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # mod folder without a descriptor
+            record = self._descriptors.get(path)
+            if record is not None and record['mtime'] == stat.st_mtime_ns and record['size'] == stat.st_size:
+                descriptors[path] = record
+                unchanged += 1
+                continue
+            try:
+                info = parse_descriptor_file(path)
+            except OSError as e:
+                logging.warning(f"Could not read mod descriptor {path}: {e}")
+                continue
+            descriptors[path] = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'source': source, 'info': info}
+            parsed += 1
+
+        removed = len(self._descriptors.keys() - descriptors.keys())
+        changed = parsed or removed
+        self._descriptors = descriptors
+        if changed or not self._mods:
+            self._build_tables()
+        if changed:
+            self.save()
+        return {'parsed': parsed, 'removed': removed, 'unchanged': unchanged}
+
+    def _mod_folder(self, descriptor_path: str, info: Dict[str, Any]) -> str:
+        if os.path.basename(descriptor_path) == 'descriptor.mod':
+            return os.path.dirname(descriptor_path)
+        path = info.get('path') or info.get('archive') or os.path.splitext(descriptor_path)[0]
+        if not os.path.isabs(path) and self.documents_path:
+            # Launcher paths like "mod/ugc_123" are relative to the user folder
+            path = os.path.join(os.path.dirname(self.documents_path), path)
+        return path
+
+    def _build_tables(self):
+        mods: Dict[str, Dict[str, Any]] = {}
+        # Outer .mod files first so the descriptor.mod inside the folder fills gaps only
+        for path in sorted(self._descriptors, key=lambda p: os.path.basename(p) == 'descriptor.mod'):
+            record = self._descriptors[path]
+            folder = self._mod_folder(path, record['info'])
+            mod = mods.setdefault(_path_key(folder), {
+                'name': None, 'path': os.path.normpath(folder), 'source': record['source'],
+                'descriptors': [], 'mtime': 0, 'info': {}
+            })
+            mod['descriptors'].append(path)
+            mod['mtime'] = max(mod['mtime'], record['mtime'])
+            for key, value in record['info'].items():
+                mod['info'].setdefault(key, value)
+            if record['source'] == 'workshop':
+                mod['source'] = 'workshop'
+
+        self._mods = []
+        self._by_name = {}
+        self._by_path = {}
+        for key, mod in mods.items():
+            mod['name'] = mod['info'].get('name') or os.path.basename(mod['path'])
+            self._mods.append(mod)
+            self._by_path[key] = mod
+            self._by_name.setdefault(mod['name'].casefold(), mod)
+            for descriptor in mod['descriptors']:
+                self._by_path[_path_key(descriptor)] = mod
+        self._mods.sort(key=lambda mod: mod['name'].casefold())
+
+    def mods(self) -> List[Dict[str, Any]]:
+        """
+        Get every installed mod.
+
+        Returns:
+            list: Dicts with 'name', 'path' (mod folder), 'source' ('local' or
+                'workshop'), 'descriptors', 'mtime' and 'info' (descriptor fields)
+        """
+        return list(self._mods)
+
+    def find_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Find an installed mod by name, ignoring case.
+
+        Args:
+            name (str): Mod name
+
+        Returns:
+            Optional[dict]: The mod or None
+        """
+        return self._by_name.get(name.casefold())
+
+    def find_existing(self, name: str, *paths: str) -> Optional[Dict[str, Any]]:
+        """
+        Check whether a mod with this name, or any of these paths, already exists.
+
+        Args:
+            name (str): Mod name
+            *paths (str): Mod folder and descriptor paths that would be created
+
+        Returns:
+            Optional[dict]: The installed mod, or a minimal {'name', 'path'} for
+                paths that exist on disk but are not registered; None if free
+        """
+        mod = self.find_by_name(name)
+        if mod is not None:
+            return mod
+        for path in paths:
+            mod = self._by_path.get(_path_key(path))
+            if mod is not None:
+                return mod
+            if os.path.exists(path):
+                return {'name': name, 'path': path}
+        return None
+
+    def get_recent_mods(self, limit: int = 10) -> List[str]:
+        """
+        Get recently created or edited local mods.
+
+        Mods recorded by full name with ConfigManager.add_recent_mod come
+        first, as long as they are still installed, followed by the most
+        recently modified ones.
+
+        Args:
+            limit (int, optional): Maximum number of names. Defaults to 10.
+
+        Returns:
+            list: Mod names
+        """
+        recent = []
+        for name in ConfigManager.get_recent_mod_names():
+            mod = self.find_by_name(name)
+            if mod is not None and mod['name'] not in recent:
+                recent.append(mod['name'])
+        local = sorted((mod for mod in self._mods if mod['source'] == 'local'), key=lambda mod: -mod['mtime'])
+        for mod in local:
+            if len(recent) >= limit:
+                break
+            if mod['name'] not in recent:
+                recent.append(mod['name'])
+        return recent[:limit]
@@ -0,0 +1,106 @@
+import os
+import json
+import logging
+import threading
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+from src.core.file_list_index import FileListIndex
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+
+
+def _signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ShortNameBlocklist:
+    """
+    Short mod names that are already taken, matched case-insensitively.
+
+    Names from blocked_short_mod_names.json are casefolded into a frozenset.
+    Very large lists (e.g. every Workshop mod prefix) can instead be compiled
+    into blocked_short_mod_names.idx, a sorted front-coded FileListIndex that
+    is memory-mapped and binary searched, so it is never loaded into memory.
+    Both files are read once per process and again only after they change.
+    """
+    JSON_PATH = os.path.join(_DATA_DIR, 'blocked_short_mod_names.json')
+    INDEX_PATH = os.path.join(_DATA_DIR, 'blocked_short_mod_names.idx')
+
+    _shared: Optional['ShortNameBlocklist'] = None
+    _shared_signature = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, names: Iterable[str] = (), index_path: Optional[str] = None):
+        """
+        Args:
+            names (iterable, optional): Blocked names
+            index_path (str, optional): Compiled index of further blocked names
+        """
+        self._names: FrozenSet[str] = frozenset(name.casefold() for name in names)
+        self._index: Optional[FileListIndex] = None
+        if index_path and os.path.exists(index_path):
+            try:
+                self._index = FileListIndex(index_path)
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring blocked name index {index_path}: {e}")
+
+    @classmethod
+    def get(cls) -> 'ShortNameBlocklist':
+        """
+        Get the shared blocklist, reloading it only when its files changed.
+
+        Returns:
+            ShortNameBlocklist: The blocklist
+        """
+        signature = (_signature(cls.JSON_PATH), _signature(cls.INDEX_PATH))
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared_signature != signature:
+                try:
+                    with open(cls.JSON_PATH, 'r', encoding='utf-8') as file:
+                        names = json.load(file)['BLOCKED_SHORT_MOD_NAMES']
+                except (FileNotFoundError, json.JSONDecodeError, KeyError):
+                    # Fall back to an empty list if the file is missing or invalid
+                    names = []
+                if cls._shared is not None:
+                    cls._shared.close()
+                cls._shared = cls(names, cls.INDEX_PATH)
+                cls._shared_signature = signature
+            return cls._shared
+
+    @staticmethod
+    def compile(names: Iterable[str], output_path: Optional[str] = None) -> int:
+        """
+        Write a large name list to the compiled index format.
+
+        Args:
+            names (iterable): Blocked names
+            output_path (str, optional): Defaults to blocked_short_mod_names.idx
+
+        Returns:
+            int: Number of distinct names written
+        """
+        return FileListIndex.write(
+            (name.casefold() for name in names),
+            output_path or ShortNameBlocklist.INDEX_PATH
+        )
+
+    def __contains__(self, name: str) -> bool:
+        key = name.casefold()
+        if key in self._names:
+            return True
+        return self._index is not None and key in self._index
+
+    def __len__(self) -> int:
+        return len(self._names) + (len(self._index) if self._index is not None else 0)
+
+    def close(self):
+        """
+        Release the memory-mapped index, if any.
+        """
+        if self._index is not None:
+            self._index.close()
+            self._index = None
@@ -0,0 +1,144 @@
+import os
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.core.game_manifest import GameManifest
+
+
+class GamePatchDiff:
+    """
+    Compare two stored game version manifests.
+
+    Both manifests are walked as sorted path lists in a single merge pass, so
+    added and removed files are found without searching; only paths present
+    in both versions are looked up, to compare their content digests.
+    """
+
+    @staticmethod
+    def diff_manifests(old_manifest: Dict[str, Any], new_manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Diff two manifests produced by GameManifest.build.
+
+        Args:
+            old_manifest (dict): Manifest of the older game version
+            new_manifest (dict): Manifest of the newer game version
+
+        Returns:
+            dict: 'old_version', 'new_version', sorted 'added', 'removed' and
+                'changed' path lists, the 'unchanged' count and 'elapsed' seconds
+        """
+        start = time.perf_counter()
+        old_files = old_manifest['files']
+        new_files = new_manifest['files']
+
+        # Manifests are written in path order, so sorting is a linear check
+        old_paths = sorted(old_files)
+        new_paths = sorted(new_files)
+
+        added: List[str] = []
+        removed: List[str] = []
+        changed: List[str] = []
+        unchanged = 0
+
+        i = j = 0
+        old_count = len(old_paths)
+        new_count = len(new_paths)
+        while i < old_count and j < new_count:
+            old_path = old_paths[i]
+            new_path = new_paths[j]
+            if old_path == new_path:
+                # Entries are [size, mtime_ns, digest]; compare content only
+                if old_files[old_path][2] != new_files[new_path][2]:
+                    changed.append(new_path)
+                else:
+                    unchanged += 1
+                i += 1
+                j += 1
+            elif old_path < new_path:
+                removed.append(old_path)
+                i += 1
+            else:
+                added.append(new_path)
+                j += 1
+        removed.extend(old_paths[i:])
+        added.extend(new_paths[j:])
+
+        return {
+            'old_version': old_manifest['version'],
+            'new_version': new_manifest['version'],
+            'added': added,
+            'removed': removed,
+            'changed': changed,
+            'unchanged': unchanged,
+            'elapsed': time.perf_counter() - start
+        }
+
+    @classmethod
+    def diff_versions(cls, old_version: str, new_version: str) -> Dict[str, Any]:
+        """
+        Diff the stored manifests of two game versions.
+
+        Args:
+            old_version (str): Older version string, e.g. '1.13.2'
+            new_version (str): Newer version string, e.g. '1.14.2.2'
+
+        Returns:
+            dict: Diff as returned by diff_manifests
+
+        Raises:
+            FileNotFoundError: If either version has no stored manifest
+        """
+        old_manifest = GameManifest.load(old_version)
+        if old_manifest is None:
+            raise FileNotFoundError(f"No manifest stored for game version {old_version}")
+        new_manifest = GameManifest.load(new_version)
+        if new_manifest is None:
+            raise FileNotFoundError(f"No manifest stored for game version {new_version}")
+        return cls.diff_manifests(old_manifest, new_manifest)
+
+    @staticmethod
+    def filter_paths(diff: Dict[str, Any], paths: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Restrict a diff to a set of paths, e.g. the vanilla files a mod overrides.
+
+        Args:
+            diff (dict): Diff as returned by diff_manifests
+            paths (iterable): Relative game paths (either separator style)
+
+        Returns:
+            dict: 'added', 'removed' and 'changed' paths that are in ``paths``
+        """
+        wanted = {path.replace(os.sep, '/') for path in paths}
+        return {
+            key: [path for path in diff[key] if path in wanted]
+            for key in ('added', 'removed', 'changed')
+        }
+
+    @staticmethod
+    def previous_version(current_version: str) -> Optional[str]:
+        """
+        Get the newest stored version before the given one.
+
+        Versions are compared by number, not by when their manifests were
+        built, so a manifest built late for an older patch is never picked.
+
+        Args:
+            current_version (str): Version to look behind
+
+        Returns:
+            Optional[str]: Previous version with a manifest, or None
+        """
+        current_key = GamePatchDiff._version_key(current_version)
+        versions = [
+            version for version in GameManifest.list_versions()
+            if GamePatchDiff._version_key(version) < current_key
+        ]
+        return max(versions, key=GamePatchDiff._version_key) if versions else None
+
+    @staticmethod
+    def _version_key(version: str) -> Tuple[Tuple[int, ...], str]:
+        """
+        Sort key comparing versions number by number, so '1.10' follows '1.9'.
+        """
+        return tuple(int(part) for part in re.findall(r'\d+', version)), version
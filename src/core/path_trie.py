@@ -0,0 +1,298 @@
+import os
+import sys
+import bisect
+import fnmatch
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class _TrieNode:
+    """
+    A single path component in a PathTrie.
+    """
+    __slots__ = ('children', 'sorted_names', 'ext_children', 'is_file')
+
+    def __init__(self):
+        self.children: Optional[Dict[str, '_TrieNode']] = None
+        # Sorted child names, rebuilt lazily after inserts, for bisecting name prefixes
+        self.sorted_names: Optional[List[str]] = None
+        # Extension -> names of the children whose subtree holds a file with it
+        self.ext_children: Optional[Dict[str, List[str]]] = None
+        self.is_file = False
+
+
+# Shared node for files without children; most entries are leaves, so they
+# don't each need a node of their own
+_LEAF = _TrieNode()
+_LEAF.is_file = True
+
+
+class PathTrie:
+    """
+    In-memory trie of relative game file paths, one node per directory
+    component (files without children share a single leaf node).
+
+    Component strings are interned, so the thousands of repeated directory
+    names (common, events, gfx, ...) are stored once. Each directory also
+    lists, per extension, which of its children lead to files with that
+    extension; those lists hold references to the interned names, not paths.
+    Queries walk only the part of the tree that matches, so their cost scales
+    with the size of the result rather than the number of indexed paths.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._count = 0
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[str]) -> 'PathTrie':
+        """
+        Build a trie from relative paths, e.g. the result of list_game_files.
+
+        Args:
+            paths (iterable): Relative file paths (either separator style)
+
+        Returns:
+            PathTrie: The populated trie
+        """
+        trie = cls()
+        for path in paths:
+            trie.add(path)
+        return trie
+
+    @staticmethod
+    def _extension(name: str) -> str:
+        return os.path.splitext(name)[1].lower()
+
+    @classmethod
+    def _has_extension(cls, child: Optional[_TrieNode], name: str, extension: str) -> bool:
+        """
+        Check whether a child (named name) is or contains a file with an extension.
+        """
+        if child is None:
+            return False
+        if child.is_file and cls._extension(name) == extension:
+            return True
+        return child.ext_children is not None and extension in child.ext_children
+
+    @staticmethod
+    def _register_extension(node: _TrieNode, name: str, extension: str):
+        if node.ext_children is None:
+            node.ext_children = {}
+        node.ext_children.setdefault(extension, []).append(name)
+
+    @staticmethod
+    def _split(path: str) -> List[str]:
+        return [part for part in path.replace(os.sep, '/').split('/') if part]
+
+    def add(self, path: str):
+        """
+        Insert a file path.
+
+        Args:
+            path (str): Relative file path
+        """
+        parts = self._split(path)
+        if not parts:
+            return
+        extension = self._extension(parts[-1])
+        node = self._root
+        for part in parts[:-1]:
+            if node.children is None:
+                node.children = {}
+            child = node.children.get(part)
+            registered = self._has_extension(child, part, extension)
+            if child is None or child is _LEAF:
+                # New directory, or a file path that is now also a directory
+                new_child = _TrieNode()
+                new_child.is_file = child is _LEAF
+                if child is None:
+                    node.sorted_names = None
+                part = sys.intern(part)
+                node.children[part] = new_child
+                child = new_child
+            if not registered:
+                self._register_extension(node, part, extension)
+            node = child
+
+        name = parts[-1]
+        if node.children is None:
+            node.children = {}
+        child = node.children.get(name)
+        if child is None:
+            name = sys.intern(name)
+            node.children[name] = _LEAF
+            node.sorted_names = None
+            self._register_extension(node, name, extension)
+        elif not child.is_file:
+            if not self._has_extension(child, name, extension):
+                self._register_extension(node, name, extension)
+            child.is_file = True
+        else:
+            return
+        self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, path: str) -> bool:
+        node = self._find(self._split(path))
+        return node is not None and node.is_file
+
+    def _find(self, parts: List[str]) -> Optional[_TrieNode]:
+        node = self._root
+        for part in parts:
+            if node.children is None:
+                return None
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def _iter_subtree(self, node: _TrieNode, prefix: str) -> Iterator[str]:
+        """
+        Yield every file at or below a node in sorted order.
+        """
+        if node.is_file:
+            yield prefix
+        if node.children:
+            for name in self._sorted_names(node):
+                child_path = f"{prefix}/{name}" if prefix else name
+                yield from self._iter_subtree(node.children[name], child_path)
+
+    @staticmethod
+    def _sorted_names(node: _TrieNode) -> List[str]:
+        if node.sorted_names is None:
+            node.sorted_names = sorted(node.children) if node.children else []
+        return node.sorted_names
+
+    def list_dir(self, directory: str) -> List[str]:
+        """
+        Get every file under a directory, recursively.
+
+        Args:
+            directory (str): Relative directory, e.g. 'common/on_action'
+
+        Returns:
+            list: Sorted relative file paths
+        """
+        parts = self._split(directory)
+        node = self._find(parts)
+        if node is None:
+            return []
+        return list(self._iter_subtree(node, '/'.join(parts)))
+
+    def find_prefix(self, prefix: str) -> List[str]:
+        """
+        Get files whose path starts with a string prefix.
+
+        The last component may be partial: 'events/health_' matches
+        'events/health_events.txt' and everything under 'events/health_stuff/'.
+
+        Args:
+            prefix (str): Path prefix
+
+        Returns:
+            list: Sorted relative file paths
+        """
+        normalized = prefix.replace(os.sep, '/')
+        if normalized.endswith('/') or not normalized:
+            return self.list_dir(normalized)
+
+        parts = self._split(normalized)
+        directory, partial = parts[:-1], parts[-1]
+        node = self._find(directory)
+        if node is None or not node.children:
+            return []
+
+        names = self._sorted_names(node)
+        base = '/'.join(directory)
+        results: List[str] = []
+        # Names sharing the prefix are contiguous in sorted order
+        for i in range(bisect.bisect_left(names, partial), len(names)):
+            name = names[i]
+            if not name.startswith(partial):
+                break
+            child_path = f"{base}/{name}" if base else name
+            results.extend(self._iter_subtree(node.children[name], child_path))
+        return results
+
+    def glob(self, pattern: str) -> List[str]:
+        """
+        Get files matching a glob pattern, matched component by component.
+
+        Supports the fnmatch wildcards within a component and '**' for any
+        number of directories. Literal components are looked up directly.
+
+        Args:
+            pattern (str): Pattern such as 'common/*/00_*.txt' or 'events/**/*.txt'
+
+        Returns:
+            list: Sorted relative file paths
+        """
+        results: List[str] = []
+        self._glob(self._root, '', self._split(pattern), results)
+        return sorted(set(results))
+
+    def _glob(self, node: _TrieNode, path: str, parts: List[str], results: List[str]):
+        if not parts:
+            if node.is_file:
+                results.append(path)
+            return
+        part, rest = parts[0], parts[1:]
+        if part == '**':
+            # Zero directories (checked first, so a trailing '**' reaches files),
+            # or consume one and keep '**' active
+            self._glob(node, path, rest, results)
+            for name, child in (node.children or {}).items():
+                self._glob(child, f"{path}/{name}" if path else name, parts, results)
+            return
+        if not node.children:
+            return
+
+        if not any(char in part for char in '*?['):
+            child = node.children.get(part)
+            if child is not None:
+                self._glob(child, f"{path}/{part}" if path else part, rest, results)
+            return
+
+        for name in fnmatch.filter(self._sorted_names(node), part):
+            self._glob(node.children[name], f"{path}/{name}" if path else name, rest, results)
+
+    def find_extension(self, extension: str, directory: Optional[str] = None) -> List[str]:
+        """
+        Get files with an extension, optionally limited to a directory.
+
+        Only directories that lead to matching files are visited.
+
+        Args:
+            extension (str): Extension with or without the dot, e.g. '.yml'
+            directory (str, optional): Relative directory to search under
+
+        Returns:
+            list: Sorted relative file paths
+        """
+        extension = extension.lower()
+        if not extension.startswith('.'):
+            extension = '.' + extension
+        parts = self._split(directory) if directory else []
+        node = self._find(parts)
+        if node is None:
+            return []
+        results: List[str] = []
+        self._collect_extension(node, '/'.join(parts), extension, results)
+        return sorted(results)
+
+    def _collect_extension(self, node: _TrieNode, path: str, extension: str, results: List[str]):
+        if node.ext_children is None:
+            return
+        prefix = path + '/' if path else ''
+        children = node.children
+        for name in node.ext_children.get(extension, ()):
+            child = children[name]
+            if child.ext_children is None:
+                # Plain file, only listed because it has the extension
+                results.append(prefix + name)
+                continue
+            if child.is_file and self._extension(name) == extension:
+                results.append(prefix + name)
+            self._collect_extension(child, prefix + name, extension, results)
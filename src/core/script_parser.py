@@ -0,0 +1,292 @@
+import os
+import re
+import mmap
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# Paradox script files are usually saved as UTF-8 with a byte order mark
+UTF8_BOM = b'\xef\xbb\xbf'
+
+# Bumped whenever the shape of parse() output changes (used as a cache key)
+PARSER_VERSION = 1
+
+
+class TokenType:
+    """
+    Token type constants; values are the regex group indexes below.
+    """
+    COMMENT = 1
+    LBRACE = 2
+    RBRACE = 3
+    OPERATOR = 4
+    STRING = 5
+    ATOM = 6
+
+    NAMES = {1: 'COMMENT', 2: 'LBRACE', 3: 'RBRACE', 4: 'OPERATOR', 5: 'STRING', 6: 'ATOM'}
+
+
+# Whitespace is consumed in front of every token; lastindex gives the type
+_TOKEN_RE = re.compile(
+    rb'[ \t\r\n\f\v]*(?:'
+    rb'(#[^\n]*)'                         # 1 comment
+    rb'|(\{)'                             # 2 {
+    rb'|(\})'                             # 3 }
+    rb'|([<>!?]=|==|[<>=])'               # 4 operator
+    rb'|("(?:[^"\\]|\\.)*"?)'             # 5 quoted string (unterminated runs to EOF)
+    rb'|([^\s{}=<>!?#"]+|[!?])'           # 6 bare word, number, scope:x, @value ...
+    rb')'
+)
+
+# A parsed value is a string, a block (list of nodes) or a tagged block such
+# as `rgb { 1 2 3 }`, stored as (tag, block)
+Value = Union[str, List['Node'], Tuple[str, List['Node']]]
+# A statement `key op value`; list items inside a block have key and op None
+Node = Tuple[Optional[str], Optional[str], Value]
+
+
+class Token:
+    """
+    A token referencing a span of the source buffer.
+
+    The text is only decoded when ``text`` is accessed.
+    """
+    __slots__ = ('type', 'start', 'end', '_buffer')
+
+    def __init__(self, token_type: int, start: int, end: int, buffer):
+        self.type = token_type
+        self.start = start
+        self.end = end
+        self._buffer = buffer
+
+    @property
+    def raw(self) -> bytes:
+        """
+        The token's bytes, copied out of the source buffer.
+        """
+        return bytes(self._buffer[self.start:self.end])
+
+    @property
+    def text(self) -> str:
+        """
+        The decoded token text; quoted strings lose their quotes.
+        """
+        raw = self._buffer[self.start:self.end]
+        if self.type == TokenType.STRING:
+            raw = raw[1:-1] if len(raw) > 1 and raw.endswith(b'"') else raw[1:]
+        return raw.decode('utf-8', 'replace')
+
+    def __repr__(self) -> str:
+        return f"Token({TokenType.NAMES[self.type]}, {self.text!r}, {self.start})"
+
+
+class ScriptTokenizer:
+    """
+    Lazy tokenizer for Paradox script (`key = value`, `{ }`, `# comment`).
+
+    Works directly on bytes-like buffers, including memory maps, and yields
+    tokens as they are scanned. A leading UTF-8 BOM is skipped.
+    """
+
+    def __init__(self, data, include_comments: bool = False):
+        """
+        Args:
+            data (bytes-like): Script source, e.g. bytes or an mmap
+            include_comments (bool, optional): Yield COMMENT tokens. Defaults to False.
+        """
+        self.data = data
+        self.include_comments = include_comments
+        self.start = len(UTF8_BOM) if data[:len(UTF8_BOM)] == UTF8_BOM else 0
+
+    def iter_spans(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yield (type, start, end) tuples without creating Token objects.
+
+        Yields:
+            tuple: Token type and its byte span in the buffer
+        """
+        include_comments = self.include_comments
+        for match in _TOKEN_RE.finditer(self.data, self.start):
+            token_type = match.lastindex
+            if token_type is None:
+                continue  # trailing whitespace
+            if token_type == TokenType.COMMENT and not include_comments:
+                continue
+            yield token_type, match.start(token_type), match.end(token_type)
+
+    def __iter__(self) -> Iterator[Token]:
+        data = self.data
+        for token_type, start, end in self.iter_spans():
+            yield Token(token_type, start, end, data)
+
+
+class ScriptParser:
+    """
+    Builds a nested node tree from a token stream.
+
+    Parsing is lenient, like the game: stray closing braces are ignored and
+    unclosed blocks are closed at end of file. Problems are collected in
+    ``errors`` as (byte offset, message) instead of raising.
+    """
+
+    def __init__(self, data):
+        """
+        Args:
+            data (bytes-like): Script source, e.g. bytes or an mmap
+        """
+        self.data = data
+        self.errors: List[Tuple[int, str]] = []
+        # Repeated tokens (yes, limit, =, scope:actor, ...) decode once
+        self._strings: Dict[bytes, str] = {}
+
+    def _decode(self, start: int, end: int) -> str:
+        raw = self.data[start:end]
+        text = self._strings.get(raw)
+        if text is None:
+            text = raw.decode('utf-8', 'replace')
+            self._strings[raw] = text
+        return text
+
+    def parse(self) -> List[Node]:
+        """
+        Parse the whole buffer.
+
+        Returns:
+            list: Top-level nodes as (key, operator, value) tuples
+        """
+        root: List[Node] = []
+        current = root
+        # Open blocks: (parent list, key, operator, tag, start offset)
+        stack: List[Tuple[List[Node], Optional[str], Optional[str], Optional[str], int]] = []
+        key: Optional[str] = None
+        op: Optional[str] = None
+        value: Optional[str] = None
+        decode = self._decode
+
+        for token_type, start, end in ScriptTokenizer(self.data).iter_spans():
+            if token_type == TokenType.ATOM or token_type == TokenType.STRING:
+                if token_type == TokenType.STRING:
+                    text = decode(start + 1, end - 1 if end - start > 1 and self.data[end - 1:end] == b'"' else end)
+                else:
+                    text = decode(start, end)
+                if value is not None:
+                    current.append((key, op, value))
+                    key, op, value = text, None, None
+                elif op is not None:
+                    value = text
+                elif key is not None:
+                    current.append((None, None, key))
+                    key = text
+                else:
+                    key = text
+
+            elif token_type == TokenType.OPERATOR:
+                if value is not None:
+                    current.append((key, op, value))
+                    key, op, value = None, None, None
+                if key is None or op is not None:
+                    self.errors.append((start, f"Unexpected operator '{decode(start, end)}'"))
+                    continue
+                op = decode(start, end)
+
+            elif token_type == TokenType.LBRACE:
+                # `key = tag {` keeps the tag; `key {` and bare `{` have no operator
+                stack.append((current, key, op, value, start))
+                current = []
+                key, op, value = None, None, None
+
+            elif token_type == TokenType.RBRACE:
+                self._flush(current, key, op, value, start)
+                key, op, value = None, None, None
+                if not stack:
+                    self.errors.append((start, "Unmatched '}'"))
+                    continue
+                parent, block_key, block_op, tag, _ = stack.pop()
+                parent.append((block_key, block_op, (tag, current) if tag is not None else current))
+                current = parent
+
+        self._flush(current, key, op, value, len(self.data))
+        while stack:
+            parent, block_key, block_op, tag, start = stack.pop()
+            self.errors.append((start, "Unclosed '{'"))
+            parent.append((block_key, block_op, (tag, current) if tag is not None else current))
+            current = parent
+        return root
+
+    def _flush(self, current: List[Node], key, op, value, offset: int):
+        """
+        Emit whatever statement is pending at the end of a block.
+        """
+        if value is not None:
+            current.append((key, op, value))
+        elif op is not None:
+            self.errors.append((offset, f"Missing value for '{key}'"))
+        elif key is not None:
+            current.append((None, None, key))
+
+
+def parse_bytes(data) -> Tuple[List[Node], List[Tuple[int, str]]]:
+    """
+    Parse Paradox script from a bytes-like buffer.
+
+    Args:
+        data (bytes-like): Script source
+
+    Returns:
+        tuple: (top-level nodes, list of (byte offset, error message))
+    """
+    parser = ScriptParser(data)
+    nodes = parser.parse()
+    return nodes, parser.errors
+
+
+def parse_file(path: str) -> Tuple[List[Node], List[Tuple[int, str]]]:
+    """
+    Parse a Paradox script file through a read-only memory map.
+
+    Args:
+        path (str): Path to the script file
+
+    Returns:
+        tuple: (top-level nodes, list of (byte offset, error message))
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return [], []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_bytes(mm)
+
+
+def iter_blocks(nodes: List[Node], key: str) -> Iterator[List[Node]]:
+    """
+    Yield the block values of nodes with a given key.
+
+    Args:
+        nodes (list): Nodes to search (not recursive)
+        key (str): Key to match
+
+    Yields:
+        list: Block contents
+    """
+    for node_key, _, value in nodes:
+        if node_key == key:
+            if isinstance(value, tuple):
+                yield value[1]
+            elif isinstance(value, list):
+                yield value
+
+
+def get_value(nodes: List[Node], key: str, default: Any = None) -> Any:
+    """
+    Get the value of the first node with a given key.
+
+    Args:
+        nodes (list): Nodes to search (not recursive)
+        key (str): Key to match
+        default (Any, optional): Returned if the key is absent
+
+    Returns:
+        Any: The node's value or default
+    """
+    for node_key, _, value in nodes:
+        if node_key == key:
+            return value
+    return default
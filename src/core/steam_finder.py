@@ -1,10 +1,10 @@
 import os
 import platform
-import tkinter as tk
-from tkinter import messagebox, filedialog, ttk
-import winreg
 from src.core.config import ConfigManager
 
+# tkinter and winreg are imported where they are used, so the core imports
+# without a display and on systems other than Windows
+
 class SteamPathFinder:
     """
     A utility class for finding Steam installation paths across different platforms.
@@ -60,6 +60,7 @@ class SteamPathFinder:
             OSError: If the operating system is unsupported.
         """
         if platform.system() == "Windows":
+            import winreg
             try:
                 # Try primary registry key
                 reg_key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"SOFTWARE\Valve\Steam")
@@ -106,6 +107,9 @@ class SteamPathFinder:
         Raises:
             SystemExit: If no path is selected.
         """
+        import tkinter as tk
+        from tkinter import messagebox, filedialog, ttk
+
         # Create a custom dialog
         steam_path_dialog = tk.Toplevel(root)
         steam_path_dialog.title("Select Steam Installation Directory")
@@ -0,0 +1,397 @@
+import os
+import json
+import time
+import logging
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.core.ast_cache import ASTCache
+from src.core.bulk_parser import BulkScriptParser
+from src.core.script_parser import get_value, parse_file
+
+# Symbol kinds
+EVENT_NAMESPACE = 'event_namespace'
+EVENT = 'event'
+ON_ACTION = 'on_action'
+SCRIPTED_EFFECT = 'scripted_effect'
+SCRIPTED_TRIGGER = 'scripted_trigger'
+GLOBAL_VARIABLE = 'global_variable'
+# Prefix for top-level objects of a common/ database folder, e.g. 'object:common/traits'.
+# Objects with the same key in the same folder override each other.
+OBJECT_PREFIX = 'object:'
+
+# Top-level definitions by directory; events are handled separately
+_DEFINITION_DIRS = {
+    'common/on_action/': ON_ACTION,
+    'common/scripted_effects/': SCRIPTED_EFFECT,
+    'common/scripted_triggers/': SCRIPTED_TRIGGER,
+}
+
+# Effects that create a global variable, as `effect = name` or `effect = { name = x ... }`
+_GLOBAL_VARIABLE_EFFECTS = frozenset((
+    'set_global_variable', 'change_global_variable', 'add_to_global_variable_list'
+))
+
+# Only these top-level folders of the game or a mod hold indexed script
+SCRIPT_DIRS = ('common', 'events')
+
+# Below this many changed files the process pool start-up costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+Symbol = Tuple[str, str]
+
+
+def extract_symbols(rel_path: str, nodes: list) -> List[Symbol]:
+    """
+    Get the symbols a parsed script file defines.
+
+    Args:
+        rel_path (str): Path relative to the game or mod root, '/' separated
+        nodes (list): Parsed top-level nodes
+
+    Returns:
+        list: Unique (kind, name) pairs in definition order
+    """
+    symbols: Dict[Symbol, None] = {}
+    if rel_path.startswith('events/'):
+        for key, _, value in nodes:
+            if key == 'namespace' and isinstance(value, str):
+                symbols[(EVENT_NAMESPACE, value)] = None
+            elif key and '.' in key and not isinstance(value, str):
+                symbols[(EVENT, key)] = None
+    elif rel_path.startswith('common/'):
+        for prefix, kind in _DEFINITION_DIRS.items():
+            if rel_path.startswith(prefix):
+                for key, _, value in nodes:
+                    if key and not isinstance(value, str):
+                        symbols[(kind, key)] = None
+                break
+        object_kind = OBJECT_PREFIX + rel_path.rsplit('/', 1)[0]
+        for key, _, value in nodes:
+            # Skip `@constant = value` and plain assignments
+            if key and key[0] != '@' and not isinstance(value, str):
+                symbols[(object_kind, key)] = None
+
+    # Global variables can be set from any script; walk blocks iteratively
+    stack = [nodes]
+    while stack:
+        for key, _, value in stack.pop():
+            if isinstance(value, str):
+                if key in _GLOBAL_VARIABLE_EFFECTS:
+                    symbols[(GLOBAL_VARIABLE, value)] = None
+                continue
+            block = value[1] if isinstance(value, tuple) else value
+            if key in _GLOBAL_VARIABLE_EFFECTS:
+                name = get_value(block, 'name')
+                if isinstance(name, str):
+                    symbols[(GLOBAL_VARIABLE, name)] = None
+            stack.append(block)
+    return list(symbols)
+
+
+class SymbolIndex:
+    """
+    Index of script symbols defined by the game and installed mods.
+
+    Covers event namespaces and IDs, on_actions, scripted effects and
+    triggers, global variable names and the top-level objects of every
+    common/ folder (used for override analysis). Lookups go through an in-memory
+    dict, so they are O(1). Each source (the game or one mod) is tracked per
+    file by size and mtime; updates only re-parse files that changed.
+    """
+    INDEX_VERSION = 2
+
+    # Shared read-only instance for validation, reloaded when the file changes
+    _shared: Optional['SymbolIndex'] = None
+    _shared_signature: Optional[Tuple[int, int]] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, index_path: Optional[str] = None):
+        """
+        Args:
+            index_path (str, optional): Index file. Defaults to src/data/symbol_index.json
+        """
+        if index_path is None:
+            index_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'symbol_index.json')
+        self.index_path = index_path
+        # source -> {'root': str, 'files': {rel_path: [size, mtime_ns, [[kind, name], ...]]}}
+        self._sources: Dict[str, Dict] = {}
+        # kind -> name -> {(source, rel_path)}
+        self._symbols: Dict[str, Dict[str, Set[Tuple[str, str]]]] = {}
+
+    @classmethod
+    def get_shared(cls) -> Optional['SymbolIndex']:
+        """
+        Get the saved index, loading it once and again only after it is rewritten.
+
+        Returns:
+            Optional[SymbolIndex]: The index, or None if it has not been built yet
+        """
+        index = cls()
+        try:
+            stat = os.stat(index.index_path)
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared_signature != signature:
+                if not index.load():
+                    return None
+                cls._shared = index
+                cls._shared_signature = signature
+            return cls._shared
+
+    @classmethod
+    def get_loaded(cls) -> Optional['SymbolIndex']:
+        """
+        Get the shared index if get_shared has already loaded it, without touching the disk.
+
+        Returns:
+            Optional[SymbolIndex]: The index, or None if it is not loaded yet
+        """
+        return cls._shared
+
+    def load(self) -> bool:
+        """
+        Load the index from disk.
+
+        Returns:
+            bool: True if a compatible index was loaded
+        """
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+        if data.get('version') != self.INDEX_VERSION:
+            return False
+        self._sources = data.get('sources', {})
+        self._symbols = {}
+        for source, info in self._sources.items():
+            for rel_path, (_, _, symbols) in info['files'].items():
+                self._add_symbols(source, rel_path, symbols)
+        return True
+
+    def save(self):
+        """
+        Persist the index atomically.
+        """
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.INDEX_VERSION, 'sources': self._sources}, f, separators=(',', ':'))
+        os.replace(tmp_path, self.index_path)
+
+    def _add_symbols(self, source: str, rel_path: str, symbols: Iterable):
+        for kind, name in symbols:
+            self._symbols.setdefault(kind, {}).setdefault(name, set()).add((source, rel_path))
+
+    def _remove_file(self, source: str, rel_path: str):
+        record = self._sources[source]['files'].pop(rel_path, None)
+        if record is None:
+            return
+        for kind, name in record[2]:
+            locations = self._symbols.get(kind, {}).get(name)
+            if locations is None:
+                continue
+            locations.discard((source, rel_path))
+            if not locations:
+                del self._symbols[kind][name]
+
+    def _set_file(self, source: str, rel_path: str, size: int, mtime: int, symbols: List[Symbol]):
+        self._remove_file(source, rel_path)
+        self._sources[source]['files'][rel_path] = [size, mtime, [list(symbol) for symbol in symbols]]
+        self._add_symbols(source, rel_path, symbols)
+
+    @staticmethod
+    def _stat_scripts(root: str) -> Dict[str, List[int]]:
+        files = {}
+        for script_dir in SCRIPT_DIRS:
+            for dirpath, _, filenames in os.walk(os.path.join(root, script_dir)):
+                rel_dir = os.path.relpath(dirpath, root).replace(os.sep, '/')
+                for name in filenames:
+                    if not name.endswith(BulkScriptParser.SCRIPT_EXTENSIONS):
+                        continue
+                    try:
+                        stat = os.stat(os.path.join(dirpath, name))
+                    except OSError:
+                        continue
+                    files[f'{rel_dir}/{name}'] = [stat.st_size, stat.st_mtime_ns]
+        return files
+
+    def update_source(self, source: str, root: str, cache: Optional[ASTCache] = None,
+                      max_workers: Optional[int] = None, status_callback=None) -> Dict[str, int]:
+        """
+        Bring one source (the game or a mod) up to date.
+
+        Args:
+            source (str): Source name, e.g. 'vanilla' or 'mod:My Mod'
+            root (str): Game or mod root directory
+            cache (ASTCache, optional): Parse cache to use
+            max_workers (int, optional): Parser processes for large updates
+            status_callback (callable, optional): Callback for progress updates
+
+        Returns:
+            dict: 'parsed', 'removed' and 'unchanged' file counts
+        """
+        root = os.path.normpath(root)
+        info = self._sources.get(source)
+        if info is None or info['root'] != root:
+            if info is not None:
+                self.remove_source(source)
+            info = self._sources[source] = {'root': root, 'files': {}}
+
+        files = self._stat_scripts(root)
+        removed = [rel_path for rel_path in info['files'] if rel_path not in files]
+        for rel_path in removed:
+            self._remove_file(source, rel_path)
+
+        changed = {}
+        for rel_path, (size, mtime) in files.items():
+            record = info['files'].get(rel_path)
+            if record is None or record[0] != size or record[1] != mtime:
+                changed[rel_path] = size
+
+        if changed:
+            workers = max_workers if len(changed) >= PARALLEL_THRESHOLD else 1
+            # Indexing runs over many sources; callers save the cache once at the end
+            parser = BulkScriptParser(root, max_workers=workers, cache=cache, save_cache=False)
+            for rel_path, nodes, _ in parser.iter_parse(changed, status_callback=status_callback):
+                size, mtime = files[rel_path]
+                self._set_file(source, rel_path, size, mtime, extract_symbols(rel_path, nodes or []))
+
+        return {'parsed': len(changed), 'removed': len(removed), 'unchanged': len(files) - len(changed)}
+
+    def update_file(self, source: str, rel_path: str, cache: Optional[ASTCache] = None):
+        """
+        Re-index a single file of a known source, e.g. after it was edited.
+
+        Args:
+            source (str): Source name
+            rel_path (str): Path relative to the source root, '/' separated
+            cache (ASTCache, optional): Parse cache to use
+        """
+        info = self._sources[source]
+        path = os.path.join(info['root'], *rel_path.split('/'))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._remove_file(source, rel_path)
+            return
+        nodes = cache.get_or_parse(path)[0] if cache is not None else parse_file(path)[0]
+        self._set_file(source, rel_path, stat.st_size, stat.st_mtime_ns, extract_symbols(rel_path, nodes))
+
+    def remove_source(self, source: str):
+        """
+        Drop a source and all its symbols.
+
+        Args:
+            source (str): Source name
+        """
+        if source not in self._sources:
+            return
+        for rel_path in list(self._sources[source]['files']):
+            self._remove_file(source, rel_path)
+        del self._sources[source]
+
+    def sources(self) -> List[str]:
+        """
+        Get the names of all indexed sources.
+
+        Returns:
+            list: Source names
+        """
+        return list(self._sources)
+
+    def iter_symbols(self, source: str) -> Iterator[Tuple[str, str, str]]:
+        """
+        Yield every symbol a source defines.
+
+        Args:
+            source (str): Source name
+
+        Yields:
+            tuple: (relative path, kind, name)
+        """
+        for rel_path, (_, _, symbols) in self._sources[source]['files'].items():
+            for kind, name in symbols:
+                yield rel_path, kind, name
+
+    def lookup(self, kind: str, name: str) -> List[Tuple[str, str]]:
+        """
+        Find where a symbol is defined.
+
+        Args:
+            kind (str): Symbol kind, e.g. ON_ACTION
+            name (str): Symbol name
+
+        Returns:
+            list: Sorted (source, relative path) pairs; empty if undefined
+        """
+        return sorted(self._symbols.get(kind, {}).get(name, ()))
+
+    def __contains__(self, symbol: Symbol) -> bool:
+        kind, name = symbol
+        return name in self._symbols.get(kind, {})
+
+    def count(self, kind: Optional[str] = None) -> int:
+        """
+        Count distinct symbol names.
+
+        Args:
+            kind (str, optional): Only count this kind
+
+        Returns:
+            int: Number of names
+        """
+        if kind is not None:
+            return len(self._symbols.get(kind, {}))
+        return sum(len(names) for names in self._symbols.values())
+
+    def find_collisions(self, symbols: Iterable[Symbol],
+                        ignore_sources: Iterable[str] = ()) -> Dict[Symbol, List[Tuple[str, str]]]:
+        """
+        Check which of the given symbols are already defined.
+
+        Args:
+            symbols (iterable): (kind, name) pairs
+            ignore_sources (iterable, optional): Sources whose definitions don't count
+
+        Returns:
+            dict: (kind, name) -> locations, for colliding symbols only
+        """
+        ignored = set(ignore_sources)
+        collisions = {}
+        for kind, name in symbols:
+            locations = [location for location in self.lookup(kind, name) if location[0] not in ignored]
+            if locations:
+                collisions[(kind, name)] = locations
+        return collisions
+
+    def build(self, roots: Dict[str, str], cache: Optional[ASTCache] = None,
+              max_workers: Optional[int] = None, status_callback=None) -> Dict[str, Dict[str, int]]:
+        """
+        Update every given source, drop sources that are gone and save.
+
+        Args:
+            roots (dict): Source name -> root directory
+            cache (ASTCache, optional): Parse cache to use
+            max_workers (int, optional): Parser processes for large updates
+            status_callback (callable, optional): Callback for progress updates
+
+        Returns:
+            dict: Source name -> update_source() result
+        """
+        start = time.perf_counter()
+        for source in [source for source in self._sources if source not in roots]:
+            self.remove_source(source)
+        results = {}
+        for source, root in roots.items():
+            if status_callback:
+                status_callback(f"Indexing symbols of {source}...")
+            results[source] = self.update_source(source, root, cache=cache, max_workers=max_workers)
+        self.save()
+        parsed = sum(result['parsed'] for result in results.values())
+        logging.info(f"Symbol index: {self.count()} symbols from {len(roots)} sources, "
+                     f"{parsed} files parsed in {time.perf_counter() - start:.2f}s")
+        return results
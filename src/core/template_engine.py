@@ -0,0 +1,282 @@
+import os
+import re
+import mmap
+import shutil
+import logging
+import threading
+from typing import Dict, List, Tuple, Union
+
+# Placeholders in file contents -> value name
+CONTENT_PLACEHOLDERS = {
+    '<your_mod_name_here>': 'short_mod_name',
+    '<your_long_mod_name_here>': 'mod_name',
+}
+# Placeholders in file and folder names -> value name
+NAME_PLACEHOLDERS = {
+    'your_mod_name_here': 'short_mod_name',
+    'your_long_mod_name_here': 'mod_name',
+}
+
+
+def _alternation(placeholders) -> str:
+    # Longest first so no placeholder shadows another that contains it
+    return '|'.join(re.escape(p) for p in sorted(placeholders, key=len, reverse=True))
+
+
+_CONTENT_RE = re.compile(_alternation(CONTENT_PLACEHOLDERS).encode('utf-8'))
+_NAME_RE = re.compile(_alternation(NAME_PLACEHOLDERS))
+
+# Asset types that are copied without being opened
+BINARY_EXTENSIONS = frozenset((
+    '.dds', '.png', '.jpg', '.jpeg', '.tga', '.bmp', '.ogg', '.wav', '.mp3',
+    '.bank', '.mesh', '.anim', '.ttf', '.otf', '.fnt', '.bin', '.zip'
+))
+
+# How files without placeholders reach the mod folder
+LINK_MODES = ('copy', 'hardlink', 'reflink')
+
+# FICLONE ioctl: share the source's extents on copy-on-write filesystems (Btrfs, XFS)
+_FICLONE = 0x40049409
+
+# Literal segments at even indexes, value names at odd indexes
+Segments = List[Union[str, bytes]]
+
+
+def compile_segments(text, pattern, placeholders) -> Segments:
+    """
+    Split a template into literal segments and value names.
+
+    Args:
+        text (str or bytes): Template text
+        pattern (re.Pattern): Placeholder regex of the same type as text
+        placeholders (dict): Placeholder -> value name
+
+    Returns:
+        list: [literal, name, literal, name, ..., literal]
+    """
+    segments: Segments = []
+    pos = 0
+    for match in pattern.finditer(text):
+        segments.append(text[pos:match.start()])
+        placeholder = match.group(0)
+        if isinstance(placeholder, bytes):
+            placeholder = placeholder.decode('utf-8')
+        segments.append(placeholders[placeholder])
+        pos = match.end()
+    segments.append(text[pos:])
+    return segments
+
+
+def has_placeholders(path: str, size: int) -> bool:
+    """
+    Check whether a file contains content placeholders without reading it into memory.
+
+    Args:
+        path (str): File path
+        size (int): File size
+
+    Returns:
+        bool: True if the file needs rendering
+    """
+    if size == 0 or os.path.splitext(path)[1].lower() in BINARY_EXTENSIONS:
+        return False
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return _CONTENT_RE.search(data) is not None
+
+
+def _reflink(src: str, dst: str):
+    import fcntl
+    with open(src, 'rb') as source, open(dst, 'wb') as target:
+        fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+
+
+def copy_file(src: str, dst: str, link_mode: str = 'copy'):
+    """
+    Copy a file with the cheapest method allowed.
+
+    'copy' uses shutil.copyfile, which lets the kernel move the data
+    (sendfile/copy_file_range on Linux, fcopyfile on macOS). 'hardlink' and
+    'reflink' share the source's data and fall back to a copy where the
+    filesystem does not support them. A hardlinked file is the template file,
+    so editing it in the mod edits the template.
+
+    Args:
+        src (str): Source file
+        dst (str): Destination file
+        link_mode (str, optional): One of LINK_MODES. Defaults to 'copy'.
+    """
+    # Never write through an earlier hardlink into the template
+    if os.path.lexists(dst):
+        os.remove(dst)
+    if link_mode == 'hardlink':
+        try:
+            os.link(src, dst)
+            return
+        except OSError as e:
+            logging.debug(f"Hardlink {src} -> {dst} failed, copying: {e}")
+    elif link_mode == 'reflink':
+        try:
+            _reflink(src, dst)
+            return
+        except (ImportError, OSError) as e:
+            logging.debug(f"Reflink {src} -> {dst} failed, copying: {e}")
+    shutil.copyfile(src, dst)
+
+
+def render_segments(segments: Segments, values: Dict[str, Union[str, bytes]]):
+    """
+    Render compiled segments with a single join.
+
+    Args:
+        segments (list): Output of compile_segments
+        values (dict): Value name -> replacement of the same type as the literals
+
+    Returns:
+        str or bytes: Rendered text
+    """
+    if len(segments) == 1:
+        return segments[0]
+    parts = segments[:]
+    for i in range(1, len(parts), 2):
+        parts[i] = values[parts[i]]
+    return parts[0][:0].join(parts)
+
+
+def write_file(path: str, data: bytes):
+    """
+    Write a file, replacing rather than overwriting an existing one.
+
+    Like copy_file, an existing destination is unlinked first: it may be a
+    hardlink to a template file (e.g. from an earlier 'hardlink' render), and
+    writing into it would change the template.
+
+    Args:
+        path (str): Destination file
+        data (bytes): File contents
+    """
+    if os.path.lexists(path):
+        os.remove(path)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+class TemplateEngine:
+    """
+    A template tree (e.g. Mod/Essentials) compiled for repeated rendering.
+
+    Files that contain placeholders are read once and split into literal byte
+    segments around them, so a UTF-8 BOM and line endings pass through
+    untouched. Every other file, including binary assets, is never decoded
+    or held in memory; it is copied with copy_file. Relative paths are split
+    around the name placeholders. Rendering a mod is then one join per path
+    and per rendered file. Compiled trees are cached per directory and
+    recompiled when any mtime or size in the tree changes.
+    """
+
+    _cache: Dict[str, Tuple[tuple, 'TemplateEngine']] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, template_dir: str):
+        """
+        Compile a template directory.
+
+        Args:
+            template_dir (str): Root of the template tree
+        """
+        self.template_dir = template_dir
+        # Compiled relative folder paths, parents first
+        self.dirs: List[Segments] = []
+        # (compiled relative file path, compiled contents)
+        self.files: List[Tuple[Segments, Segments]] = []
+        # (compiled relative file path, source path) of files copied as they are
+        self.assets: List[Tuple[Segments, str]] = []
+        self.signature = self._compile()
+
+    @staticmethod
+    def _walk(template_dir: str):
+        """
+        Yield (relative dir, signature entries) for every folder, parents first.
+
+        The first entry is the folder's, followed by one (relative path, mtime, size) per file.
+        """
+        for dirpath, dirnames, filenames in os.walk(template_dir):
+            dirnames.sort()
+            filenames.sort()
+            rel_dir = os.path.relpath(dirpath, template_dir)
+            rel_dir = '' if rel_dir == '.' else rel_dir
+            signature = [(rel_dir, os.stat(dirpath).st_mtime_ns)]
+            for name in filenames:
+                stat = os.stat(os.path.join(dirpath, name))
+                signature.append((os.path.join(rel_dir, name), stat.st_mtime_ns, stat.st_size))
+            yield rel_dir, signature
+
+    @classmethod
+    def _signature(cls, template_dir: str) -> tuple:
+        return tuple(entry for _, signature in cls._walk(template_dir) for entry in signature)
+
+    def _compile(self) -> tuple:
+        full_signature = []
+        for rel_dir, signature in self._walk(self.template_dir):
+            full_signature.extend(signature)
+            if rel_dir:
+                self.dirs.append(compile_segments(rel_dir, _NAME_RE, NAME_PLACEHOLDERS))
+            for rel_path, _, size in signature[1:]:
+                path = os.path.join(self.template_dir, rel_path)
+                compiled_path = compile_segments(rel_path, _NAME_RE, NAME_PLACEHOLDERS)
+                if not has_placeholders(path, size):
+                    self.assets.append((compiled_path, path))
+                    continue
+                with open(path, 'rb') as f:
+                    content = f.read()
+                self.files.append((compiled_path, compile_segments(content, _CONTENT_RE, CONTENT_PLACEHOLDERS)))
+        return tuple(full_signature)
+
+    @classmethod
+    def get(cls, template_dir: str) -> 'TemplateEngine':
+        """
+        Get the compiled template for a directory, recompiling it only if it changed.
+
+        Args:
+            template_dir (str): Root of the template tree
+
+        Returns:
+            TemplateEngine: Compiled template
+        """
+        key = os.path.normcase(os.path.abspath(template_dir))
+        signature = cls._signature(template_dir)
+        with cls._cache_lock:
+            cached = cls._cache.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        engine = cls(template_dir)
+        with cls._cache_lock:
+            cls._cache[key] = (engine.signature, engine)
+        return engine
+
+    def render(self, dst: str, short_mod_name: str, mod_name: str, link_mode: str = 'copy') -> int:
+        """
+        Write the template tree into a mod folder.
+
+        Args:
+            dst (str): Destination directory
+            short_mod_name (str): Replaces <your_mod_name_here>
+            mod_name (str): Replaces <your_long_mod_name_here>
+            link_mode (str, optional): How files without placeholders are copied,
+                one of LINK_MODES. Defaults to 'copy'.
+
+        Returns:
+            int: Number of files written
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode {link_mode!r}, expected one of {', '.join(LINK_MODES)}")
+        names = {'short_mod_name': short_mod_name, 'mod_name': mod_name}
+        contents = {key: value.encode('utf-8') for key, value in names.items()}
+
+        os.makedirs(dst, exist_ok=True)
+        for rel_dir in self.dirs:
+            os.makedirs(os.path.join(dst, render_segments(rel_dir, names)), exist_ok=True)
+        for rel_path, content in self.files:
+            write_file(os.path.join(dst, render_segments(rel_path, names)), render_segments(content, contents))
+        for rel_path, source in self.assets:
+            copy_file(source, os.path.join(dst, render_segments(rel_path, names)), link_mode)
+        return len(self.files) + len(self.assets)
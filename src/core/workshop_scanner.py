@@ -0,0 +1,234 @@
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.mod_registry import CK3_APP_ID
+
+# Quoted strings and braces of Steam's KeyValues (.acf/.vdf) text format
+_VDF_TOKEN_RE = re.compile(r'"((?:[^"\\]|\\.)*)"|([{}])')
+
+
+def parse_vdf(text: str) -> Dict[str, Any]:
+    """
+    Parse Steam KeyValues text such as appworkshop_<app id>.acf.
+
+    Args:
+        text (str): File contents
+
+    Returns:
+        dict: Nested dicts of strings
+    """
+    root: Dict[str, Any] = {}
+    stack = [root]
+    key = None
+    for match in _VDF_TOKEN_RE.finditer(text):
+        string, brace = match.groups()
+        if brace == '{':
+            child: Dict[str, Any] = {}
+            stack[-1][key if key is not None else ''] = child
+            stack.append(child)
+            key = None
+        elif brace == '}':
+            if len(stack) > 1:
+                stack.pop()
+            key = None
+        elif key is None:
+            key = string
+        else:
+            stack[-1][key] = string
+            key = None
+    return root
+
+
+def _scan_item(path: str) -> Dict[str, Any]:
+    """
+    Count, size and fingerprint one workshop item folder.
+
+    The fingerprint is a BLAKE2b digest over every file's relative path,
+    size and mtime, so it changes whenever any file does.
+
+    Args:
+        path (str): Item folder
+
+    Returns:
+        dict: 'files', 'bytes', 'mtime' (newest file mtime in ns) and 'fingerprint'
+    """
+    entries: List[Tuple[str, int, int]] = []
+    stack = ['']
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            with os.scandir(os.path.join(path, rel_dir)) as it:
+                for entry in it:
+                    rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(rel_path)
+                        elif entry.is_file():
+                            stat = entry.stat()
+                            entries.append((rel_path, stat.st_size, stat.st_mtime_ns))
+                    except OSError:
+                        continue
+        except OSError as e:
+            logging.warning(f"Could not list {os.path.join(path, rel_dir)}: {e}")
+
+    entries.sort()
+    digest = hashlib.blake2b(digest_size=16)
+    for rel_path, size, mtime in entries:
+        digest.update(f'{rel_path}\0{size}\0{mtime}\n'.encode('utf-8'))
+    return {
+        'files': len(entries),
+        'bytes': sum(entry[1] for entry in entries),
+        'mtime': max((entry[2] for entry in entries), default=0),
+        'fingerprint': digest.hexdigest()
+    }
+
+
+class WorkshopScanner:
+    """
+    Scans subscribed Steam Workshop mods under steamapps/workshop/content/1158310.
+
+    Item folders are walked concurrently on a thread pool. Results are
+    persisted with a stamp per item: Steam's manifest ID and update time from
+    appworkshop_1158310.acf where available, plus the item folder's mtime.
+    Later scans only walk items whose stamp changed.
+    """
+    SCAN_VERSION = 1
+
+    def __init__(self, steam_path: str, cache_path: Optional[str] = None, max_workers: Optional[int] = None):
+        """
+        Args:
+            steam_path (str): Path to the Steam installation directory
+            cache_path (str, optional): Results file. Defaults to src/data/workshop_scan.json
+            max_workers (int, optional): Scanner threads. Defaults to min(32, CPU count + 4).
+        """
+        self.workshop_dir = os.path.join(steam_path, 'steamapps', 'workshop')
+        self.content_dir = os.path.join(self.workshop_dir, 'content', CK3_APP_ID)
+        if cache_path is None:
+            cache_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'workshop_scan.json')
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        # item id -> {'stamp': [...], 'files', 'bytes', 'mtime', 'fingerprint'}
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') == self.SCAN_VERSION and data.get('content_dir') == self.content_dir:
+            self._items = data.get('items', {})
+
+    def save(self):
+        """
+        Persist the scan results atomically.
+        """
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': self.SCAN_VERSION,
+                'content_dir': self.content_dir,
+                'items': self._items
+            }, f, separators=(',', ':'))
+        os.replace(tmp_path, self.cache_path)
+
+    def _read_steam_manifest(self) -> Dict[str, Dict[str, str]]:
+        """
+        Get Steam's record of installed items, keyed by item ID.
+        """
+        acf_path = os.path.join(self.workshop_dir, f'appworkshop_{CK3_APP_ID}.acf')
+        try:
+            with open(acf_path, 'r', encoding='utf-8', errors='replace') as f:
+                data = parse_vdf(f.read())
+        except OSError:
+            return {}
+        return data.get('AppWorkshop', {}).get('WorkshopItemsInstalled', {})
+
+    def scan(self, full: bool = False, status_callback=None) -> Dict[str, Any]:
+        """
+        Scan the workshop folder, re-walking only items that changed.
+
+        Args:
+            full (bool, optional): Re-walk every item. Defaults to False.
+            status_callback (callable, optional): Callback for progress updates
+
+        Returns:
+            dict: 'items' (count), 'scanned', 'reused', 'removed' and 'elapsed'
+        """
+        start = time.perf_counter()
+        installed = self._read_steam_manifest()
+
+        stamps: Dict[str, list] = {}
+        try:
+            with os.scandir(self.content_dir) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_dir():
+                            continue
+                        record = installed.get(entry.name, {})
+                        stamps[entry.name] = [
+                            record.get('manifest'), record.get('timeupdated'), entry.stat().st_mtime_ns
+                        ]
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+
+        removed = [item_id for item_id in self._items if item_id not in stamps]
+        for item_id in removed:
+            del self._items[item_id]
+        changed = sorted(
+            item_id for item_id, stamp in stamps.items()
+            if full or item_id not in self._items or self._items[item_id]['stamp'] != stamp
+        )
+
+        if changed:
+            if status_callback:
+                status_callback(f"Scanning {len(changed)} of {len(stamps)} workshop mods...")
+            paths = [os.path.join(self.content_dir, item_id) for item_id in changed]
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for item_id, result in zip(changed, executor.map(_scan_item, paths)):
+                    result['stamp'] = stamps[item_id]
+                    self._items[item_id] = result
+        if changed or removed:
+            self.save()
+
+        return {
+            'items': len(stamps),
+            'scanned': len(changed),
+            'reused': len(stamps) - len(changed),
+            'removed': len(removed),
+            'elapsed': time.perf_counter() - start
+        }
+
+    def get_item(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the scan result of one workshop item.
+
+        Args:
+            item_id (str): Workshop item ID
+
+        Returns:
+            Optional[dict]: 'files', 'bytes', 'mtime' and 'fingerprint', or None if unknown
+        """
+        item = self._items.get(item_id)
+        if item is None:
+            return None
+        return {key: value for key, value in item.items() if key != 'stamp'}
+
+    def get_items(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the scan results of every workshop item.
+
+        Returns:
+            dict: Item ID -> result (see get_item)
+        """
+        return {item_id: self.get_item(item_id) for item_id in sorted(self._items)}
@@ -2,8 +2,11 @@ import tkinter as tk
 import ttkbootstrap as ttk
 import webbrowser
 import os
-from tkinter import messagebox, simpledialog
+import threading
+from tkinter import messagebox, simpledialog, filedialog
 from src.core.game_utils import CK3GameUtils
+from src.core.fuzzy_finder import FuzzyFileFinder
+from src.core.batch_creator import BatchModCreator, load_manifest
 
 class ActionButtonsUI:
     @staticmethod
@@ -82,6 +85,15 @@ class ActionButtonsUI:
         )
         create_mod_btn.pack(side=tk.LEFT, padx=5, expand=True, fill='x')
 
+        # Batch Create Button
+        batch_create_btn = ttk.Button(
+            action_buttons_frame, 
+            text="Batch Create", 
+            command=lambda: ActionButtonsUI.create_mods_from_manifest(parent_class),
+            style='success.Outline.TButton'
+        )
+        batch_create_btn.pack(side=tk.LEFT, padx=5, expand=True, fill='x')
+
         # Open Mod Folder Button
         open_mod_folder_btn = ttk.Button(
             action_buttons_frame, 
@@ -96,11 +108,20 @@ class ActionButtonsUI:
         list_game_files_btn = ttk.Button(
             action_buttons_frame, 
             text="List Game Files", 
-            command=lambda: CK3GameUtils.list_game_files(parent_class.steam_path, status_callback=parent_class.update_status_label),
+            command=lambda: ActionButtonsUI.show_game_file_finder(parent_class),
             style='warning.TButton'  # Use a warning-styled button
         )
         list_game_files_btn.pack(side=tk.LEFT, padx=5, expand=True, fill='x')
 
+        # Index Symbols Button
+        index_symbols_btn = ttk.Button(
+            action_buttons_frame, 
+            text="Index Symbols", 
+            command=lambda: ActionButtonsUI.build_symbol_index(parent_class),
+            style='warning.Outline.TButton'
+        )
+        index_symbols_btn.pack(side=tk.LEFT, padx=5, expand=True, fill='x')
+
         # Advanced Mod Tools Button (Template)
         advanced_tools_btn = ttk.Button(
             action_buttons_frame, 
@@ -128,6 +149,236 @@ class ActionButtonsUI:
         )
         parent_class.status_label.pack(pady=10)
 
+    @staticmethod
+    def show_game_file_finder(parent_class):
+        """
+        Open a fuzzy search window over the vanilla game files.
+        
+        The file list comes from the incremental game file index and is
+        indexed once per Steam path; later openings reuse it until the path
+        changes.
+        
+        Args:
+            parent_class (SteamModCreator): Reference to the main class for callbacks
+        """
+        root = parent_class.root
+        dialog = tk.Toplevel(root)
+        dialog.title("Game File Finder")
+        dialog.geometry("800x600")
+
+        frame = ttk.Frame(dialog, padding="20 20 20 20")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(frame, text="Search game files:", font=('Helvetica', 10)).pack(anchor='w')
+        search_var = tk.StringVar()
+        search_entry = ttk.Entry(frame, textvariable=search_var, state='disabled')
+        search_entry.pack(fill='x', pady=(0, 10))
+
+        # Results list with scrollbar
+        results_frame = ttk.Frame(frame)
+        results_frame.pack(fill=tk.BOTH, expand=True)
+        scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL)
+        results_list = tk.Listbox(results_frame, yscrollcommand=scrollbar.set, font=('Consolas', 10))
+        scrollbar.config(command=results_list.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        results_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        finder_status = ttk.Label(frame, text="Indexing game files...", font=('Helvetica', 8), foreground='gray')
+        finder_status.pack(anchor='w', pady=(5, 10))
+
+        # Export the full list to vanilla_files.txt (cancellable)
+        export_btn = ttk.Button(frame, text="Export List to File", style='warning.TButton')
+        export_btn.config(command=lambda: ActionButtonsUI.toggle_list_game_files(parent_class, export_btn))
+        export_btn.pack(side=tk.LEFT)
+        ttk.Button(frame, text="Close", command=dialog.destroy, style='secondary.TButton').pack(side=tk.RIGHT)
+
+        def cached_finder():
+            # A finder built for another Steam installation is stale
+            if getattr(parent_class, 'game_file_finder_steam_path', None) != parent_class.steam_path:
+                return None
+            return getattr(parent_class, 'game_file_finder', None)
+
+        def run_search(event=None):
+            finder = cached_finder()
+            if finder is None or not dialog.winfo_exists():
+                return
+            results = finder.search(search_var.get(), limit=200)
+            results_list.delete(0, tk.END)
+            for path, _ in results:
+                results_list.insert(tk.END, path)
+            finder_status.config(text=f"{len(results)} matches in {len(finder)} files")
+
+        def copy_selected(event=None):
+            selection = results_list.curselection()
+            if not selection:
+                return
+            path = results_list.get(selection[0])
+            dialog.clipboard_clear()
+            dialog.clipboard_append(path)
+            finder_status.config(text=f"Copied {path}")
+
+        def on_ready():
+            if not dialog.winfo_exists():
+                return
+            finder = cached_finder()
+            if finder is None:
+                finder_status.config(text="Game files could not be indexed", foreground='red')
+                return
+            search_entry.config(state='normal')
+            search_entry.focus_set()
+            finder_status.config(text=f"{len(finder)} game files indexed. Double-click a result to copy its path.")
+            run_search()
+
+        def build_finder():
+            def status_callback(message, is_error=False):
+                root.after(0, parent_class.update_status_label, message, is_error)
+            steam_path = parent_class.steam_path
+            try:
+                files = CK3GameUtils.list_game_files(
+                    steam_path, 
+                    status_callback=status_callback, 
+                    write_text=False
+                )
+                parent_class.game_file_finder = FuzzyFileFinder(files) if files else None
+                parent_class.game_file_finder_steam_path = steam_path
+            finally:
+                root.after(0, on_ready)
+
+        search_entry.bind('<KeyRelease>', run_search)
+        results_list.bind('<Double-Button-1>', copy_selected)
+
+        if cached_finder() is not None:
+            on_ready()
+        else:
+            threading.Thread(target=build_finder, name='game-file-finder', daemon=True).start()
+
+    @staticmethod
+    def create_mods_from_manifest(parent_class):
+        """
+        Create every mod listed in a JSON or CSV manifest in the background.
+        
+        The per-mod report is written next to the manifest as <manifest>_report.json.
+        
+        Args:
+            parent_class (SteamModCreator): Reference to the main class for callbacks
+        """
+        manifest_path = filedialog.askopenfilename(
+            title="Select Mod Manifest",
+            filetypes=[("Mod manifests", "*.json *.csv"), ("All files", "*.*")]
+        )
+        if not manifest_path:
+            return
+        try:
+            manifest = load_manifest(manifest_path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Manifest Error", str(e))
+            return
+
+        root = parent_class.root
+        report_path = os.path.splitext(manifest_path)[0] + '_report.json'
+
+        def status_callback(message, is_error=False):
+            root.after(0, parent_class.update_status_label, message, is_error)
+
+        def on_done(report):
+            summary = (f"{report['created']} created, {report['failed']} failed, "
+                       f"{report['invalid']} invalid of {len(report['mods'])} mods.\n\n"
+                       f"Report: {report_path}")
+            if report['failed'] or report['invalid']:
+                messagebox.showwarning("Batch Creation", summary)
+            else:
+                messagebox.showinfo("Batch Creation", summary)
+
+        def worker():
+            report = BatchModCreator(debug=parent_class.debug).create_all(
+                manifest,
+                default_version=parent_class.latest_version if parent_class.latest_version != "Unknown" else None,
+                status_callback=status_callback
+            )
+            try:
+                BatchModCreator.write_report(report, report_path)
+            except OSError as e:
+                status_callback(f"Could not write batch report: {e}", is_error=True)
+            root.after(0, on_done, report)
+
+        status_callback(f"Creating {len(manifest)} mods from {os.path.basename(manifest_path)}...")
+        threading.Thread(target=worker, name='batch-create', daemon=True).start()
+
+    @staticmethod
+    def build_symbol_index(parent_class):
+        """
+        Update the symbol index of the game and installed mods in the background.
+        
+        Parsing runs on a process pool, so it is only started on request (or
+        on the first launch, when there is no index yet); a second request
+        while one is running is ignored.
+        
+        Args:
+            parent_class (SteamModCreator): Reference to the main class for callbacks
+        """
+        if getattr(parent_class, 'symbol_index_running', False) or not parent_class.steam_path:
+            return
+        parent_class.symbol_index_running = True
+        root = parent_class.root
+
+        def status_callback(message, is_error=False):
+            root.after(0, parent_class.update_status_label, message, is_error)
+
+        def on_done():
+            parent_class.symbol_index_running = False
+
+        def worker():
+            try:
+                CK3GameUtils.build_symbol_index(parent_class.steam_path, status_callback=status_callback)
+            finally:
+                root.after(0, on_done)
+
+        status_callback("Indexing game and mod symbols...")
+        threading.Thread(target=worker, name='symbol-index', daemon=True).start()
+
+    @staticmethod
+    def toggle_list_game_files(parent_class, button):
+        """
+        Start listing game files in the background, or cancel a running listing.
+        
+        Args:
+            parent_class (SteamModCreator): Reference to the main class for callbacks
+            button (ttk.Button): Button that started the listing, relabelled while running
+        """
+        cancel_token = getattr(parent_class, 'list_files_cancel_token', None)
+        if cancel_token is not None:
+            # A scan is running: request cancellation
+            cancel_token.set()
+            button.config(text="Cancelling...")
+            return
+
+        cancel_token = threading.Event()
+        parent_class.list_files_cancel_token = cancel_token
+        idle_text = button.cget('text')
+        button.config(text="Cancel Listing")
+        root = parent_class.root
+
+        def status_callback(message, is_error=False):
+            # Tk widgets may only be touched from the UI thread
+            root.after(0, parent_class.update_status_label, message, is_error)
+
+        def on_done():
+            parent_class.list_files_cancel_token = None
+            if button.winfo_exists():
+                button.config(text=idle_text)
+
+        def worker():
+            try:
+                CK3GameUtils.stream_game_files(
+                    parent_class.steam_path, 
+                    status_callback=status_callback, 
+                    cancel_token=cancel_token
+                )
+            finally:
+                root.after(0, on_done)
+
+        threading.Thread(target=worker, name='list-game-files', daemon=True).start()
+
     @staticmethod
     def open_mod_folder(self):
         """
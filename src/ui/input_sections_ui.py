@@ -2,6 +2,7 @@ import tkinter as tk
 import ttkbootstrap as ttk
 import webbrowser
 from src.core.game_utils import CK3GameUtils
+from src.core.mod_params import validate_short_mod_name, check_symbol_collisions
 
 class InputSectionsUI:
     @staticmethod
@@ -41,6 +42,27 @@ class InputSectionsUI:
                   font=('Helvetica', 8), 
                   foreground='gray').pack(anchor='w')
 
+        # Live validation feedback for Short Mod Name
+        short_mod_name_feedback = ttk.Label(short_mod_name_frame, text="", font=('Helvetica', 8))
+        short_mod_name_feedback.pack(anchor='w')
+
+        def on_short_mod_name_change(event):
+            short_mod_name = parent_class.short_mod_name_entry.get().strip()
+            if not short_mod_name:
+                short_mod_name_feedback.config(text="")
+                return
+            try:
+                validate_short_mod_name(short_mod_name)
+                # Only against an index already loaded in the background; never load it here
+                from src.core.symbol_index import SymbolIndex
+                check_symbol_collisions(short_mod_name, SymbolIndex.get_loaded())
+            except ValueError as e:
+                short_mod_name_feedback.config(text=str(e), foreground='red')
+                return
+            short_mod_name_feedback.config(text="Short mod name is available", foreground='dark green')
+
+        parent_class.short_mod_name_entry.bind('<KeyRelease>', on_short_mod_name_change)
+
         # Supported Version Input
         supported_version_frame = ttk.Frame(main_frame)
         supported_version_frame.pack(fill='x', pady=10)
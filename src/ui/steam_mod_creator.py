@@ -9,6 +9,7 @@ import re, sys
 from typing import List, Optional, Dict, Any
 import dataclasses
 import logging
+import threading
 # Add the project root to the Python path
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
@@ -18,10 +19,11 @@ from src.ui.header_ui import HeaderUI
 from src.ui.input_sections_ui import InputSectionsUI
 from src.ui.action_buttons_ui import ActionButtonsUI
 from src.core.game_utils import CK3GameUtils
-from src.core.mod_creator import ModCreator
+from src.core.mod_creator import ModCreator, ESSENTIALS_DIR
 from debug.debug_config import setup_logging, is_debug_mode, setup_exception_handling
 from src.core.config import ConfigManager
 from src.core.mod_params import ModCreationParams
+from src.core.mod_registry import ModRegistry
 from src.ui.welcome_page import show_welcome_page
 
 
@@ -71,12 +73,24 @@ class SteamModCreator:
             self.logger.error(f"Could not detect game version: {e}")
             self.latest_version = "Unknown"
 
+        # Remove staging directories of mod creations that were interrupted
+        ModCreator.clean_staging(self.debug)
+
         # Create Input Sections
         InputSectionsUI.create_input_sections(self.main_frame, self)
 
         # Create Action Buttons
         ActionButtonsUI.create_action_buttons(self.main_frame, self)
 
+        # Build the symbol index consulted by ModCreationParams once if there is none;
+        # later refreshes are started from the Index Symbols button
+        from src.core.symbol_index import SymbolIndex
+        if not os.path.exists(SymbolIndex().index_path):
+            ActionButtonsUI.build_symbol_index(self)
+        else:
+            # Load it off the UI thread so short name feedback can check collisions
+            threading.Thread(target=SymbolIndex.get_shared, name='symbol-index-load', daemon=True).start()
+
     
     def create_mod(self):
         mod_name = self.mod_name_entry.get().strip() if self.mod_name_entry else ""
@@ -113,12 +127,27 @@ class SteamModCreator:
                 supported_version=supported_version
             )
 
-            # Create mod structure
-            mod_creation_result = ModCreator.create_mod_structure(
+            # Refuse to overwrite an installed mod or existing files
+            mod_paths = ModCreator.get_mod_paths(mod_params.mod_name, self.debug)
+            existing_mod = ModRegistry.get_shared().find_existing(
+                mod_params.mod_name,
+                mod_paths['mod_folder_path'],
+                mod_paths['mod_file_path']
+            )
+            if existing_mod:
+                messagebox.showerror(
+                    "Mod Already Exists",
+                    f"A mod named '{existing_mod['name']}' already exists at {existing_mod['path']}"
+                )
+                return
+
+            # Build the mod with the Essentials template in staging, then move it into place
+            mod_creation_result = ModCreator.create_mod(
                 mod_params.mod_name, 
                 mod_params.short_mod_name, 
                 mod_params.tags, 
                 mod_params.supported_version, 
+                ESSENTIALS_DIR,
                 self.debug,
                 status_callback=self.update_status_label
             )
@@ -126,33 +155,16 @@ class SteamModCreator:
             if not mod_creation_result['success']:
                 messagebox.showerror("Mod Creation Error", mod_creation_result['error'])
                 return
-
-            # Copy essentials folder
-            essentials_source = os.path.join(os.path.dirname(__file__), 'mod', 'essentials')
-            
-            # Check if essentials folder exists
-            if os.path.exists(essentials_source):
-                # Copy essentials to mod folder with placeholder replacement
-                essentials_copy_result = ModCreator.copy_and_replace(
-                    essentials_source, 
-                    mod_creation_result['mod_folder_path'], 
-                    mod_params.short_mod_name, 
-                    mod_params.mod_name,
-                    status_callback=self.update_status_label
-                )
-
-                if not essentials_copy_result['success']:
-                    messagebox.showerror("Essentials Copy Error", essentials_copy_result['error'])
-                    return
+            self.logger.info(f"Mod creation timings: {mod_creation_result['timings']}")
 
             # Show success message
             messagebox.showinfo("Mod Created", f"Mod '{mod_name}' created successfully in {mod_creation_result['mod_folder_path']}")
             
             # Add to recent mods
-            ConfigManager.add_recent_mod(short_mod_name)
+            ConfigManager.add_recent_mod(short_mod_name, mod_name)
 
             # Optionally, show recent mods
-            recent_mods = ConfigManager.get_recent_mods()
+            recent_mods = ModRegistry.get_shared().get_recent_mods()
             self.logger.info(f"Recent mods: {recent_mods}")
 
         except ValueError as ve:
@@ -188,7 +200,12 @@ class SteamModCreator:
     def on_window_resize(self, event):
         """
         Save window size when resized.
+        
+        <Configure> fires for every child widget and many times per drag;
+        only the toplevel size is recorded and ConfigManager coalesces the writes.
         """
+        if event.widget is not self.root:
+            return
         ConfigManager.update_config('window_size', (event.width, event.height))
 
 